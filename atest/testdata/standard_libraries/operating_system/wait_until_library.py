@@ -18,6 +18,17 @@ class wait_until_library:
         else:
             self._run_after_sleeping(lambda: open(path, "w", encoding="ASCII").close())
 
+    def append_after_sleeping(self, path, content="x"):
+        def append():
+            with open(path, "a", encoding="ASCII") as file:
+                file.write(content)
+
+        self._run_after_sleeping(append)
+
+    def create_files_after_sleeping(self, directory, *names):
+        for name in names:
+            self.create_after_sleeping(os.path.join(directory, name))
+
     def _run_after_sleeping(self, method, *args):
         self._timers.append(Timer(0.1, method, args))
         self._timers[-1].start()
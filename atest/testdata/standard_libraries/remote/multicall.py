@@ -0,0 +1,56 @@
+import sys
+import xmlrpc.client
+
+from remoteserver import keyword, RemoteServer
+
+
+class MulticallRemoteServer(RemoteServer):
+
+    def __init__(self, library, port=8270, port_file=None):
+        self.called_methods = []
+        super().__init__(library, port, port_file)
+
+    def _register_functions(self):
+        # `get_library_information` is not registered, but `system.multicall` is.
+        super()._register_functions()
+        self.register_function(self.get_keyword_types)
+        self.register_multicall_functions()
+
+    def _marshaled_dispatch(self, data, dispatch_method=None, path=None):
+        self.called_methods.append(xmlrpc.client.loads(data)[1])
+        return super()._marshaled_dispatch(data, dispatch_method, path)
+
+    def get_keyword_types(self, name):
+        kw = getattr(self.library, name)
+        return getattr(kw, "robot_types", [])
+
+    def get_keyword_documentation(self, name):
+        if name == "__intro__":
+            return self.library.__doc__
+        if name == "__init__":
+            return self.library.__init__.__doc__
+        return super().get_keyword_documentation(name)
+
+    def run_keyword(self, name, args, kwargs=None):
+        if name == "called_methods":
+            return {"status": "PASS", "return": self.called_methods}
+        return super().run_keyword(name, args, kwargs)
+
+
+class Library:
+    """__intro__ documentation."""
+
+    def __init__(self):
+        """__init__ documentation."""
+
+    @keyword(tags=["tag"], types=["int"])
+    def keyword(self, arg=0):
+        """Documentation for 'keyword'."""
+        return arg
+
+    def called_methods(self):
+        pass
+
+
+if __name__ == "__main__":
+    MulticallRemoteServer(Library(), *sys.argv[1:])
@@ -42,6 +42,9 @@ The publicly exposed parsing entry points are the following:
 * :class:`~robot.parsing.model.visitor.ModelTransformer`
   for `adding and removing nodes`_.
 
+* :class:`~robot.parsing.model.visitor.CompositeVisitor`
+  for running multiple visitors in one traversal. New in RF 7.5.
+
 .. note:: This module is new in Robot Framework 4.0. In Robot Framework 3.2 functions
           for getting tokens and model as well as the :class:`~.lexer.tokens.Token`
           class were exposed directly via the :mod:`robot.api` package, but other
@@ -560,6 +563,7 @@ from robot.parsing.model.statements import (
     WhileHeader as WhileHeader,
 )
 from robot.parsing.model.visitor import (
+    CompositeVisitor as CompositeVisitor,
     ModelTransformer as ModelTransformer,
     ModelVisitor as ModelVisitor,
 )
@@ -54,6 +54,7 @@ class _BaseSettings:
         "Report"           : ("report", "report.html"),
         "XUnit"            : ("xunit", None),
         "SplitLog"         : ("splitlog", False),
+        "LogCompression"   : ("logcompression", (9, 0)),
         "TimestampOutputs" : ("timestampoutputs", False),
         "LogTitle"         : ("logtitle", None),
         "ReportTitle"      : ("reporttitle", None),
@@ -77,7 +78,7 @@ class _BaseSettings:
         "StdOut"           : ("stdout", None),
         "StdErr"           : ("stderr", None),
     }  # fmt: skip
-    _output_opts = ["Output", "Log", "Report", "XUnit", "DebugFile"]
+    _output_opts = ["Output", "Log", "Report", "XUnit", "DebugFile", "ResultDB"]
 
     def __init__(self, options=None, **extra_options):
         self.start_time = datetime.now()
@@ -112,7 +113,11 @@ class _BaseSettings:
             return [self._process_metadata(v) for v in value]
         if name == "TagDoc":
             return [self._process_tagdoc(v) for v in value]
-        if name in self._output_opts or name in ["ReRunFailed", "ReRunFailedSuites"]:
+        if name in self._output_opts or name in [
+            "ReRunFailed",
+            "ReRunFailedSuites",
+            "ChangedSince",
+        ]:
             if isinstance(value, Path):
                 return str(value)
             return value if value and value.upper() != "NONE" else None
@@ -124,6 +129,8 @@ class _BaseSettings:
             return [split_args_from_name_or_path(item) for item in value]
         if name == "ReportBackground":
             return self._process_report_background(value)
+        if name == "LogCompression":
+            return self._process_log_compression(value)
         if name == "TagStatCombine":
             return [self._process_tag_stat_combine(v) for v in value]
         if name == "TagStatLink":
@@ -226,7 +233,8 @@ class _BaseSettings:
     def _get_output_file(self, option):
         """Returns path of the requested output file and creates needed dirs.
 
-        `option` can be 'Output', 'Log', 'Report', 'XUnit' or 'DebugFile'.
+        `option` can be 'Output', 'Log', 'Report', 'XUnit', 'DebugFile'
+        or 'ResultDB'.
         """
         name = self._opts[option]
         if not name:
@@ -258,6 +266,8 @@ class _BaseSettings:
             return ".html"
         if file_type == "DebugFile":
             return ".txt"
+        if file_type == "ResultDB":
+            return ".sqlite"
         raise FrameworkError(f"Invalid output file type '{file_type}'.")
 
     def _process_metadata(self, value):
@@ -283,6 +293,22 @@ class _BaseSettings:
             return colors[0], colors[1], "#fed84f"
         return tuple(colors)
 
+    def _process_log_compression(self, value):
+        level, block_size = self._split_from_colon(str(value))
+        try:
+            level = int(level)
+            block_size = int(block_size or 0)
+        except ValueError:
+            level = -1
+        if not 0 <= level <= 9 or block_size < 0:
+            self._raise_invalid(
+                "LogCompression",
+                f"Expected format 'level' or 'level:blocksize' where level is "
+                f"an integer from 0 to 9 and block size a non-negative integer, "
+                f"got '{value}'.",
+            )
+        return level, block_size * 1024
+
     def _process_tag_stat_combine(self, pattern):
         if ":" in pattern:
             pattern, title = pattern.rsplit(":", 1)
@@ -404,6 +430,10 @@ class _BaseSettings:
     def split_log(self):
         return self["SplitLog"]
 
+    @property
+    def log_compression(self):
+        return self["LogCompression"]
+
     @property
     def suite_names(self):
         return self._filter_empty(self["SuiteNames"])
@@ -490,6 +520,8 @@ class RobotSettings(_BaseSettings):
         "SkipTeardownOnExit" : ("skipteardownonexit", False),
         "ReRunFailed"        : ("rerunfailed", None),
         "ReRunFailedSuites"  : ("rerunfailedsuites", None),
+        "ChangedSince"       : ("changedsince", None),
+        "Watch"              : ("watch", False),
         "Randomize"          : ("randomize", "NONE"),
         "RunEmptySuite"      : ("runemptysuite", False),
         "Variables"          : ("variable", []),
@@ -501,6 +533,8 @@ class RobotSettings(_BaseSettings):
         "ConsoleWidth"       : ("consolewidth", 78),
         "ConsoleMarkers"     : ("consolemarkers", "AUTO"),
         "DebugFile"          : ("debugfile", None),
+        "ResultDB"           : ("resultdb", None),
+        "ResultDBKeywords"   : ("resultdbkeywords", False),
         "Language"           : ("language", []),
     }  # fmt: skip
     _languages = None
@@ -544,6 +578,14 @@ class RobotSettings(_BaseSettings):
     def debug_file(self):
         return self["DebugFile"]
 
+    @property
+    def result_db(self):
+        return self["ResultDB"]
+
+    @property
+    def result_db_keywords(self):
+        return self["ResultDBKeywords"]
+
     @property
     def languages(self):
         if self._languages is None:
@@ -597,6 +639,14 @@ class RobotSettings(_BaseSettings):
             return names + rerun
         return names or rerun
 
+    @property
+    def changed_since(self):
+        return self["ChangedSince"]
+
+    @property
+    def watch(self):
+        return self["Watch"]
+
     @property
     def randomize_seed(self):
         return self["Randomize"][1]
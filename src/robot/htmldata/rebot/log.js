@@ -85,6 +85,33 @@ function loadAndExpandElementIds(ids) {
     }
 }
 
+function jumpToNextFailure() {
+    var failures = window.testdata.failures();
+    if (failures.length)
+        jumpToNext('failure', failures);
+}
+
+function searchLog(text) {
+    if (window.searchText !== text) {
+        window.searchText = text;
+        window.searchResults = text ? window.testdata.search(text) : [];
+        window.jumpIndexes['search'] = -1;
+    }
+    var results = window.searchResults;
+    $('#log-search-results').text(results.length + ' match' + (results.length == 1 ? '' : 'es'));
+    if (results.length)
+        jumpToNext('search', results);
+}
+
+window.jumpIndexes = {};
+
+function jumpToNext(name, ids) {
+    var previous = name in window.jumpIndexes ? window.jumpIndexes[name] : -1;
+    var index = (previous + 1) % ids.length;
+    window.jumpIndexes[name] = index;
+    makeElementVisible(ids[index]);
+}
+
 function expandFailed(element) {
     if (element.status == "FAIL" || (element.type == "test" && element.status == "SKIP")) {
         window.elementsToExpand = [element];
@@ -272,6 +272,57 @@ window.testdata = function () {
         return _statistics;
     }
 
+    function searchIndex() {
+        return window.output.search_index || {ids: [], failures: [], tags: {}, tokens: {}};
+    }
+
+    function failures() {
+        var index = searchIndex();
+        return util.map(index.failures, function (i) { return index.ids[i]; });
+    }
+
+    function search(text) {
+        // Returns ids of suites and tests containing all tokens in the text
+        // or, if the text is like `tag:name`, ids of tests having the tag.
+        var tag = text.match(/^\s*tag:([\s\S]*)$/i);
+        if (tag)
+            return searchByTag(tag[1]);
+        var index = searchIndex();
+        var tokens = text.toLowerCase().match(/[\p{L}\p{N}_]{2,}/gu) || [];
+        var matches = null;
+        for (var i = 0; i < tokens.length; i++) {
+            var postings = index.tokens[tokens[i]] || [];
+            matches = matches === null ? postings : intersection(matches, postings);
+            if (!matches.length)
+                break;
+        }
+        return util.map(matches || [], function (i) { return index.ids[i]; });
+    }
+
+    function intersection(first, second) {
+        // Postings are sorted so they can be intersected in linear time.
+        var result = [];
+        var i = 0, j = 0;
+        while (i < first.length && j < second.length) {
+            if (first[i] < second[j]) {
+                i++;
+            } else if (first[i] > second[j]) {
+                j++;
+            } else {
+                result.push(first[i]);
+                i++;
+                j++;
+            }
+        }
+        return result;
+    }
+
+    function searchByTag(tag) {
+        var index = searchIndex();
+        var ids = index.tags[util.normalize(tag)] || [];
+        return util.map(ids, function (i) { return index.ids[i]; });
+    }
+
     function StringStore(strings) {
 
         function getText(id) {
@@ -280,11 +331,18 @@ window.testdata = function () {
                 return '';
             if (text[0] == '*')
                 return text.substring(1);
-            var extracted = extract(text);
+            var extracted = text[0] == '@' ? extractFromBlock(text) : extract(text);
             strings[id] = '*' + extracted;
             return extracted;
         }
 
+        function extractFromBlock(text) {
+            // Format is '@<block index>:<start>:<end>'.
+            var parts = text.substring(1).split(':');
+            return getText(parseInt(parts[0])).substring(parseInt(parts[1]),
+                                                         parseInt(parts[2]));
+        }
+
         function extract(text) {
             var decoded = JXG.Util.Base64.decodeAsArray(text);
             var extracted = (new JXG.Util.Unzip(decoded)).unzip()[0][0];
@@ -305,6 +363,9 @@ window.testdata = function () {
         findLoaded: findLoaded,
         ensureLoaded: ensureLoaded,
         statistics: statistics,
+        failures: failures,
+        search: search,
+        searchByTag: searchByTag,
         StringStore: StringStore,  // exposed for tests
         LEVELS: LEVELS
     };
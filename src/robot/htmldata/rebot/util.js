@@ -54,7 +54,7 @@ window.util = function () {
     }
 
     function normalize(string) {
-        return string.toLowerCase().replace(/ /g, '').replace(/_/g, '');
+        return string.toLowerCase().replace(/[\s_]/g, '');
     }
 
     function regexpEscape(string) {
@@ -31,10 +31,10 @@ from robot.output import SettableLevel
 from robot.running import Keyword, RUN_KW_REGISTER, TypeInfo
 from robot.running.context import EXECUTION_CONTEXTS
 from robot.utils import (
-    DotDict, escape, format_assign_message, get_error_message, get_time, html_escape,
-    is_truthy, Matcher, normalize, normalize_whitespace, NormalizedDict, parse_re_flags,
-    parse_time, plural_or_not as s, prepr, safe_str, secs_to_timestr, seq2str,
-    split_from_equals, timestr_to_secs, type_name, unescape
+    compile_pattern, DotDict, escape, format_assign_message, get_error_message,
+    get_time, html_escape, is_truthy, Matcher, normalize, normalize_whitespace,
+    NormalizedDict, parse_re_flags, parse_time, plural_or_not as s, prepr, safe_str,
+    secs_to_timestr, seq2str, split_from_equals, timestr_to_secs, type_name, unescape
 )
 from robot.utils.asserts import assert_equal, assert_not_equal
 from robot.variables import (
@@ -1663,7 +1663,7 @@ class _Verify(_BuiltInBase):
         values = self._deprecate_no_values(values)
         if isinstance(string, (bytes, bytearray)):
             pattern = self._ensure_bytes(pattern)
-        res = re.search(pattern, string, flags=parse_re_flags(flags))
+        res = compile_pattern(pattern, parse_re_flags(flags)).search(string)
         if res is None:
             raise AssertionError(
                 self._get_msg(string, pattern, msg, values, "does not match")
@@ -1689,7 +1689,7 @@ class _Verify(_BuiltInBase):
         values = self._deprecate_no_values(values)
         if isinstance(string, (bytes, bytearray)):
             pattern = self._ensure_bytes(pattern)
-        if re.search(pattern, string, flags=parse_re_flags(flags)) is not None:
+        if compile_pattern(pattern, parse_re_flags(flags)).search(string):
             raise AssertionError(self._get_msg(string, pattern, msg, values, "matches"))
 
     def get_length(self, item: Sized) -> int:
@@ -2656,7 +2656,7 @@ class _RunKeyword(_BuiltInBase):
             "GLOB": glob,
             "EQUALS": lambda s, p: s == p,
             "STARTS": lambda s, p: s.startswith(p),
-            "REGEXP": lambda s, p: re.fullmatch(p, s) is not None,
+            "REGEXP": lambda s, p: compile_pattern(p).fullmatch(s) is not None,
         }
         prefixes = tuple(prefix + ":" for prefix in matchers)
         if not expected_error.startswith(prefixes):
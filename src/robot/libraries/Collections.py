@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 import copy
+from collections import Counter
 from collections.abc import (
     Iterator, Mapping, MutableMapping, MutableSequence, Sequence, Set
 )
@@ -30,6 +31,7 @@ from robot.version import get_version
 from .normalizer import IgnoreCase, Normalizer
 
 NOT_SET = NotSet()
+MAX_REPORTED_DIFFS = 100
 
 ListLike = Union[Sequence, Mapping, Set]
 
@@ -420,17 +422,25 @@ class _List:
         See the `Ignore case` section for more details. This option is new in
         Robot Framework 7.0.
         """
-        dupes = []
         list_ = Normalizer(ignore_case).normalize(list_)
-        for item in list_:
-            if item not in dupes:
-                count = list_.count(item)
-                if count > 1:
-                    logger.info(f"'{item}' found {count} times.")
-                    dupes.append(item)
+        dupes = []
+        for item, count in self._count_values(list_):
+            if count > 1:
+                logger.info(f"'{item}' found {count} times.")
+                dupes.append(item)
         if dupes:
             raise AssertionError(msg or f"{seq2str(dupes)} found multiple times.")
 
+    def _count_values(self, list_: ListLike) -> "Iterator[tuple[object, int]]":
+        try:
+            yield from Counter(iter(list_)).items()
+        except TypeError:  # Unhashable items.
+            seen = []
+            for item in list_:
+                if item not in seen:
+                    seen.append(item)
+                    yield item, list_.count(item)
+
     def lists_should_be_equal(
         self,
         list1: ListLike,
@@ -446,7 +456,8 @@ class _List:
         The keyword first verifies that the lists have equal lengths, and then
         it checks are all their values equal. Possible differences between the
         values are listed in the default error message like ``Index 4: ABC !=
-        Abc``. The types of the lists do not need to be the same. For example,
+        Abc``. If there are more than 100 differences, only the first 100 are
+        listed. The types of the lists do not need to be the same. For example,
         Python tuple and list with same content are considered equal.
 
         The error message can be configured using ``msg`` and ``values``
@@ -499,7 +510,11 @@ class _List:
         elif not isinstance(names, Mapping):
             names = dict(zip(range(len1), names))
         normalize = Normalizer(ignore_case, ignore_order=ignore_order).normalize
-        diffs = list(self._yield_list_diffs(normalize(list1), normalize(list2), names))
+        list1 = normalize(list1)
+        list2 = normalize(list2)
+        if self._lists_are_equal(list1, list2):
+            return
+        diffs = list(self._yield_list_diffs(list1, list2, names))
         if diffs:
             report_error("Lists are different:\n" + "\n".join(diffs), msg, values)
 
@@ -509,12 +524,29 @@ class _List:
         list2: Sequence,
         names: "Mapping[int, str]",
     ) -> "Iterator[str]":
-        for index, (item1, item2) in enumerate(zip(list1, list2)):
-            name = f" ({names[index]})" if index in names else ""
-            try:
-                assert_equal(item1, item2, msg=f"Index {index}{name}")
-            except AssertionError as err:
-                yield str(err)
+        items = enumerate(zip(list1, list2))
+        reported = 0
+        for index, (item1, item2) in items:
+            if not item1 == item2:
+                if reported == MAX_REPORTED_DIFFS:
+                    more = 1 + sum(1 for _, (i1, i2) in items if not i1 == i2)
+                    yield f"...and {more} more difference{s(more)}."
+                    break
+                reported += 1
+                name = f" ({names[index]})" if index in names else ""
+                try:
+                    assert_equal(item1, item2, msg=f"Index {index}{name}")
+                except AssertionError as err:
+                    yield str(err)
+
+    def _lists_are_equal(self, list1: ListLike, list2: ListLike) -> bool:
+        # Comparing lists is done in C and is a lot faster than comparing
+        # items one by one. The result is also the same except that items
+        # being the same object are considered equal also if they are NaNs.
+        try:
+            return bool(list(list1) == list(list2))
+        except Exception:
+            return False
 
     def list_should_contain_sub_list(
         self,
@@ -540,10 +572,21 @@ class _List:
         normalize = Normalizer(ignore_case).normalize
         list1 = normalize(list1)
         list2 = normalize(list2)
+        list1 = self._to_container(list1, list2)
         diffs = seq2str([item for item in list2 if item not in list1])
         if diffs:
             report_error(f"Following values are missing: {diffs}", msg, values)
 
+    def _to_container(self, list_: ListLike, items: ListLike) -> "Set | ListLike":
+        # Sets make checking are items in a list a lot faster, but they can be
+        # used only if both the list items and the searched items are hashable.
+        try:
+            for item in items:
+                hash(item)
+            return set(list_)
+        except TypeError:
+            return list_
+
     def log_list(self, list_: Sequence, level: logger.LogLevel = "INFO"):
         """Logs contents of the ``list`` using the given ``level``."""
         logger.write("\n".join(self._log_list(list_)), level)
@@ -899,7 +942,8 @@ class _Dictionary:
 
         First the equality of dictionaries' keys is checked and after that all
         the key value pairs. If there are differences between the values, those
-        are listed in the error message. The types of the dictionaries do not
+        are listed in the error message. If there are more than 100 differences,
+        only the first 100 are listed. The types of the dictionaries do not
         need to be same.
 
         ``ignore_keys`` can be used to provide a list of keys to ignore in the
@@ -931,6 +975,8 @@ class _Dictionary:
         ).normalize
         dict1 = normalize(dict1)
         dict2 = normalize(dict2)
+        if self._dicts_are_equal(dict1, dict2):
+            return
         self._should_have_same_keys(dict1, dict2, msg, values)
         self._should_have_same_values(dict1, dict2, msg, values)
 
@@ -960,16 +1006,32 @@ class _Dictionary:
         message: "str | None",
         values: bool,
     ):
-        errors = []
-        for key in dict2:
-            try:
-                assert_equal(dict1[key], dict2[key], msg=f"Key {key}")
-            except AssertionError as err:
-                errors.append(str(err))
+        errors = list(self._yield_dict_diffs(dict1, dict2))
         if errors:
             error = "\n".join(["Following keys have different values:", *errors])
             report_error(error, message, values)
 
+    def _yield_dict_diffs(self, dict1: Mapping, dict2: Mapping) -> "Iterator[str]":
+        keys = iter(dict2)
+        reported = 0
+        for key in keys:
+            if not dict1[key] == dict2[key]:
+                if reported == MAX_REPORTED_DIFFS:
+                    more = 1 + sum(1 for k in keys if not dict1[k] == dict2[k])
+                    yield f"...and {more} more difference{s(more)}."
+                    break
+                reported += 1
+                try:
+                    assert_equal(dict1[key], dict2[key], msg=f"Key {key}")
+                except AssertionError as err:
+                    yield str(err)
+
+    def _dicts_are_equal(self, dict1: Mapping, dict2: Mapping) -> bool:
+        try:
+            return bool(dict(dict1) == dict(dict2))
+        except Exception:
+            return False
+
     def dictionary_should_contain_sub_dictionary(
         self,
         dict1: Mapping,
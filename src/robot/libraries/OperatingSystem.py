@@ -13,22 +13,26 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import codecs
 import fnmatch
 import glob
+import mmap
 import os
-import re
 import shutil
 import tempfile
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import NoReturn, Sequence
+from itertools import islice
+from typing import Callable, Iterator, NoReturn, Sequence
 
 from robot.api import logger
 from robot.api.types import Secret
 from robot.utils import (
-    abspath, ConnectionCache, console_decode, CONSOLE_ENCODING, del_env_var,
-    get_env_var, get_env_vars, get_time, parse_time, plural_or_not as s, PY_VERSION,
-    safe_str, secs_to_timestr, seq2str, set_env_var, WINDOWS
+    abspath, compile_pattern, ConnectionCache, console_decode, CONSOLE_ENCODING,
+    del_env_var, get_env_var, get_env_vars, get_time, parse_time, PathWatcher,
+    plural_or_not as s, PY_VERSION, safe_str, secs_to_timestr, seq2str, set_env_var,
+    WINDOWS
 )
 from robot.version import get_version
 
@@ -292,6 +296,8 @@ class OperatingSystem:
         encoding: str = "UTF-8",
         encoding_errors: str = "strict",
         regexp: bool = False,
+        max_matches: "int | None" = None,
+        tail: bool = False,
     ) -> str:
         r"""Returns the lines of the specified file that match the ``pattern``.
 
@@ -317,32 +323,124 @@ class OperatingSystem:
         the `Pattern matching` section. With this keyword matching is always
         case-sensitive.
 
+        If ``max_matches`` is given, searching stops when that many matching
+        lines have been found. If ``tail`` is given a true value, the file is
+        searched starting from the end and the last matching lines are returned.
+        Also in that case lines are returned in the order they are in the file.
+        Using ``tail`` and ``max_matches`` together is an efficient way to get
+        the last matching lines from a large file.
+
         Examples:
         | ${errors} = | Grep File | /var/log/myapp.log | ERROR |
         | ${ret} = | Grep File | ${CURDIR}/file.txt | [Ww]ildc??d ex*ple |
         | ${ret} = | Grep File | ${CURDIR}/file.txt | [Ww]ildc\\w+d ex.*ple | regexp=True |
+        | ${first} = | Grep File | /var/log/myapp.log | ERROR | max_matches=1 |
+        | ${last} = | Grep File | /var/log/myapp.log | ERROR | max_matches=10 | tail=True |
+
+        With encodings where newline bytes cannot be part of other characters,
+        such as UTF-8, ASCII and single byte encodings, the file is memory
+        mapped and decoded in chunks. Large files can thus be searched without
+        reading them fully into memory and, when ``tail`` is used, only the end
+        of the file is read if enough matches are found there.
 
         Special encoding values ``SYSTEM`` and ``CONSOLE`` that `Get File` supports
         are supported by this keyword only with Robot Framework 4.0 and newer.
 
         Support for regular expressions is new in Robot Framework 5.0.
+        ``max_matches`` and ``tail`` are new in Robot Framework 7.5.
         """
         path = self._absnorm(path)
-        if not regexp:
-            pattern = fnmatch.translate(f"{pattern}*")
-        reobj = re.compile(pattern)
-        encoding = self._map_encoding(encoding)
-        lines = []
-        total_lines = 0
+        if max_matches is not None and max_matches < 1:
+            self._error(f"'max_matches' must be positive, got {max_matches}.")
+        if regexp:
+            matches = compile_pattern(pattern).search
+            may_match = None
+        elif glob.has_magic(pattern):
+            matches = compile_pattern(f"{pattern}*", regexp=False).search
+            may_match = None
+        else:
+            # Literal patterns allow skipping chunks not containing them.
+            matches = may_match = lambda text: pattern in text
+        reader = _TextChunks(path, self._map_encoding(encoding), encoding_errors)
         self._link("Reading file '%s'.", path)
-        with open(path, encoding=encoding, errors=encoding_errors) as file:
-            for line in file:
-                total_lines += 1
-                line = line.rstrip("\r\n")
-                if reobj.search(line):
-                    lines.append(line)
-            self._info(f"{len(lines)} out of {total_lines} lines matched.")
-            return "\n".join(lines)
+        found = []
+        total_lines = 0
+        for chunk in reader.backward() if tail else reader.forward():
+            if may_match and not may_match(chunk):
+                total_lines += self._count_lines(chunk)
+                continue
+            lines = self._split_lines(chunk)
+            total_lines += len(lines)
+            if tail:
+                lines.reverse()
+            limit = max_matches - len(found) if max_matches else None
+            found.extend(islice(filter(matches, lines), limit))
+            if len(found) == max_matches:
+                self._info(f"Stopped after {len(found)} matching line{s(found)}.")
+                break
+        else:
+            self._info(f"{len(found)} out of {total_lines} lines matched.")
+        if tail:
+            found.reverse()
+        return "\n".join(found)
+
+    def _split_lines(self, text: str) -> "list[str]":
+        if not text:
+            return []
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if text[-1] == "\n":
+            text = text[:-1]
+        return text.split("\n")
+
+    def _count_lines(self, text: str) -> int:
+        if "\r" in text:
+            return len(self._split_lines(text))
+        return text.count("\n") + (text[-1:] not in ("\n", ""))
+
+    def get_file_tail(
+        self,
+        path: str,
+        lines: int = 10,
+        encoding: str = "UTF-8",
+        encoding_errors: str = "strict",
+    ) -> str:
+        """Returns the last ``lines`` lines of the specified file.
+
+        The file is read using the given ``encoding`` and ``encoding_errors``
+        and line breaks are converted similarly as with `Get File`. If the file
+        ends with a newline, also the returned content ends with it. If the file
+        has less lines than requested, the whole content is returned.
+
+        With encodings where newline bytes cannot be part of other characters,
+        such as UTF-8, ASCII and single byte encodings, only the end of the file
+        is read. That makes this keyword suitable for inspecting the end of
+        large log files. With other encodings the whole file is read.
+
+        Examples:
+        | ${last line} = | Get File Tail | /var/log/myapp.log | 1 |
+        | ${tail} = | Get File Tail | /var/log/myapp.log | 100 | encoding=Latin-1 |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        if lines < 0:
+            self._error(f"Number of lines cannot be negative, got {lines}.")
+        reader = _TextChunks(path, self._map_encoding(encoding), encoding_errors)
+        self._link("Getting tail of file '%s'.", path)
+        chunks = []
+        newlines = 0
+        needed = lines
+        for chunk in reader.backward():
+            if not chunks and chunk.endswith("\n"):
+                needed += 1
+            chunks.append(chunk)
+            newlines += chunk.count("\n")
+            if newlines >= needed:
+                break
+        if not lines:
+            return ""
+        content = "".join(reversed(chunks)).split("\n")
+        return "\n".join(content[-needed:]).replace("\r\n", "\n")
 
     def log_file(
         self,
@@ -484,12 +582,12 @@ class OperatingSystem:
         Disabling timeout using ``None`` is new in Robot Framework 7.4.
         """
         path = self._absnorm(path)
-        timeout = timeout.total_seconds() if timeout else -1
-        maxtime = time.time() + timeout
-        while self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not removed in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
+        self._wait_until(
+            lambda: not self._glob(path),
+            [path],
+            timeout,
+            f"'{path}' was not removed",
+        )
         self._link("'%s' was removed.", path)
 
     def wait_until_created(
@@ -516,13 +614,111 @@ class OperatingSystem:
         Disabling timeout using ``None`` is new in Robot Framework 7.4.
         """
         path = self._absnorm(path)
+        self._wait_until(
+            lambda: bool(self._glob(path)),
+            [path],
+            timeout,
+            f"'{path}' was not created",
+        )
+        self._link("'%s' was created.", path)
+
+    def wait_until_file_changed(
+        self,
+        path: str,
+        timeout: "timedelta | None" = timedelta(minutes=1),
+    ):
+        """Waits until the given file is modified, created or removed.
+
+        The file is considered changed if its size, modification time or
+        inode changes, or if it is created or removed, after this keyword
+        has been called. The path must be an exact path, not a glob pattern.
+
+        Waits for 1 minute by default, but that can be changed by using
+        the ``timeout`` argument. Using a negative value or ``None`` disables
+        the timeout.
+
+        Examples:
+        | Wait Until File Changed | ${path} |
+        | Wait Until File Changed | ${path} | 10 seconds |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        initial = self._get_file_state(path)
+        self._wait_until(
+            lambda: self._get_file_state(path) != initial,
+            [path],
+            timeout,
+            f"'{path}' was not changed",
+        )
+        self._link("'%s' was changed.", path)
+
+    def _get_file_state(self, path: str) -> "tuple[int, int, int] | None":
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def wait_until_directory_contains_n_files(
+        self,
+        path: str,
+        count: int,
+        pattern: "str | None" = None,
+        timeout: "timedelta | None" = timedelta(minutes=1),
+    ):
+        """Waits until the given directory contains at least ``count`` files.
+
+        Only files are counted, not directories. If ``pattern`` is given,
+        only files matching it are counted. The pattern is matched the same
+        way as with `List Directory`. The directory does not need to exist
+        when this keyword is called.
+
+        Waits for 1 minute by default, but that can be changed by using
+        the ``timeout`` argument. Using a negative value or ``None`` disables
+        the timeout.
+
+        Examples:
+        | Wait Until Directory Contains N Files | ${dir} | 3 |
+        | Wait Until Directory Contains N Files | ${dir} | 10 | pattern=*.txt | timeout=30s |
+
+        New in Robot Framework 7.5.
+        """
+        path = self._absnorm(path)
+        self._wait_until(
+            lambda: self._count_files(path, pattern) >= count,
+            [os.path.join(path, "*")],
+            timeout,
+            f"Directory '{path}' did not contain {count} file{s(count)}",
+        )
+        self._link(f"Directory '%s' contains {count} file{s(count)}.", path)
+
+    def _count_files(self, path: str, pattern: "str | None") -> int:
+        try:
+            items = [safe_str(item) for item in os.listdir(path)]
+        except OSError:
+            return 0
+        if pattern:
+            items = [i for i in items if fnmatch.fnmatchcase(i, pattern)]
+        return sum(os.path.isfile(os.path.join(path, item)) for item in items)
+
+    def _wait_until(
+        self,
+        condition: "Callable[[], bool]",
+        paths: "list[str]",
+        timeout: "timedelta | None",
+        error: str,
+    ):
         timeout = timeout.total_seconds() if timeout else -1
         maxtime = time.time() + timeout
-        while not self._glob(path):
-            if timeout >= 0 and time.time() > maxtime:
-                self._fail(f"'{path}' was not created in {secs_to_timestr(timeout)}.")
-            time.sleep(0.1)
-        self._link("'%s' was created.", path)
+        # Watcher is started before checking the condition the first time
+        # to avoid missing changes occurring between checking and waiting.
+        with PathWatcher(os.path.dirname(p) for p in paths) as watcher:
+            while not condition():
+                remaining = maxtime - time.time()
+                if timeout >= 0 and remaining < 0:
+                    self._fail(f"{error} in {secs_to_timestr(timeout)}.")
+                watcher.wait(max(remaining, 0) if timeout >= 0 else None)
 
     # Dir/file empty
 
@@ -1517,6 +1713,79 @@ class OperatingSystem:
         logger.write(msg, level)
 
 
+class _TextChunks:
+    """Reads text files in chunks that contain only full lines.
+
+    With encodings where newline bytes cannot be part of other characters,
+    the file is memory mapped and chunks are decoded separately. Line
+    boundaries are found without decoding and reading chunks backwards does
+    not touch the beginning of the file. With other encodings the file is
+    read in text mode. Newlines are not translated in either case.
+    """
+
+    chunk_size = 1024 * 1024
+
+    def __init__(self, path: str, encoding: "str | None", errors: str = "strict"):
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self.mappable = self._is_ascii_compatible(encoding)
+
+    def _is_ascii_compatible(self, encoding: "str | None") -> bool:
+        try:
+            name = codecs.lookup(encoding).name
+        except (LookupError, TypeError):
+            return False
+        if name == "utf-7" or name.startswith("iso2022"):
+            return False
+        return "\r\n".encode(name) == b"\r\n"
+
+    def forward(self) -> Iterator[str]:
+        if not self.mappable:
+            yield from self._read_text()
+            return
+        with self._map() as data:
+            start = 0
+            while start < len(data):
+                end = data.find(b"\n", start + self.chunk_size - 1) + 1 or len(data)
+                yield self._decode(data[start:end])
+                start = end
+
+    def backward(self) -> Iterator[str]:
+        if not self.mappable:
+            yield from reversed(list(self._read_text()))
+            return
+        with self._map() as data:
+            end = len(data)
+            while end > 0:
+                start = data.rfind(b"\n", 0, max(end - self.chunk_size, 0)) + 1
+                yield self._decode(data[start:end])
+                end = start
+
+    def _read_text(self) -> Iterator[str]:
+        with open(
+            self.path, encoding=self.encoding, errors=self.errors, newline=""
+        ) as file:
+            while True:
+                lines = file.readlines(self.chunk_size)
+                if not lines:
+                    break
+                yield "".join(lines)
+
+    @contextmanager
+    def _map(self) -> "Iterator[mmap.mmap | bytes]":
+        with open(self.path, "rb") as file:
+            # Empty files cannot be memory mapped.
+            if not os.fstat(file.fileno()).st_size:
+                yield b""
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                yield data
+
+    def _decode(self, data: bytes) -> str:
+        return data.decode(self.encoding, self.errors)
+
+
 class _Process:
 
     def __init__(self, command):
@@ -17,6 +17,7 @@ import os
 import signal as signal_module
 import subprocess
 import sys
+import threading
 import time
 from collections.abc import Sequence
 from datetime import timedelta
@@ -164,6 +165,107 @@ class ProcessResult:
         return f"<result object with rc {self.rc}>"
 
 
+class OutputReader:
+    """Reads standard output and error of a running process on background.
+
+    Each stream is read in its own thread and readers waiting for output
+    are notified when new data arrives. Also the final result is got from
+    here, because the streams cannot be read with ``Popen.communicate()``
+    anymore after they have been read here.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, process: subprocess.Popen):
+        self._condition = threading.Condition()
+        self._buffers = {"stdout": bytearray(), "stderr": bytearray()}
+        self._piped = set()
+        self._open = set()
+        self._threads = []
+        for name in self._buffers:
+            stream = getattr(process, name)
+            if stream:
+                self._piped.add(name)
+                self._open.add(name)
+                thread = threading.Thread(
+                    target=self._read,
+                    args=(name, stream),
+                    name=f"robot-process-{process.pid}-{name}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _read(self, name: str, stream):
+        buffer = self._buffers[name]
+        read = getattr(stream, "read1", stream.read)
+        try:
+            while True:
+                data = read(self.chunk_size)
+                if not data:
+                    break
+                with self._condition:
+                    buffer += data
+                    self._condition.notify_all()
+        except (OSError, ValueError):
+            pass
+        finally:
+            with self._condition:
+                self._open.discard(name)
+                self._condition.notify_all()
+
+    def is_piped(self, name: str) -> bool:
+        return name in self._piped
+
+    def is_open(self, name: str) -> bool:
+        return name in self._open
+
+    def wait_until_contains(
+        self,
+        name: str,
+        data: bytes,
+        timeout: "float | None" = None,
+    ) -> bool:
+        """Waits until the stream contains ``data``.
+
+        Returns ``False`` if the timeout occurs or the stream is closed before
+        the data is found. Only the part of the stream that has not yet been
+        searched is searched when new data arrives.
+        """
+        buffer = self._buffers[name]
+        end_time = time.time() + timeout if timeout is not None else None
+        start = 0
+        with self._condition:
+            while True:
+                if buffer.find(data, start) != -1:
+                    return True
+                start = max(len(buffer) - len(data) + 1, 0)
+                if name not in self._open:
+                    return False
+                wait = 0.1
+                if end_time is not None:
+                    remaining = end_time - time.time()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                # Waiting in short slices allows Robot's timeouts to occur.
+                self._condition.wait(wait)
+
+    def join(self, timeout: "float | None" = None) -> bool:
+        end_time = time.time() + timeout if timeout is not None else None
+        for thread in self._threads:
+            if end_time is not None:
+                thread.join(max(end_time - time.time(), 0))
+            else:
+                thread.join()
+        return not any(thread.is_alive() for thread in self._threads)
+
+    def get(self, name: str) -> "bytes | None":
+        if name not in self._piped:
+            return None
+        with self._condition:
+            return bytes(self._buffers[name])
+
+
 class ProcessConfiguration:
 
     def __init__(
@@ -356,6 +458,10 @@ class Process:
     - Starting processes on background using the `Start Process` keyword.
     - Waiting started process to complete using `Wait For Process` or
       stopping them with `Terminate Process` or `Terminate All Processes`.
+    - Waiting for output of running processes using `Wait Until Process
+      Output Contains`.
+    - Running multiple processes at the same time using `Run Processes
+      In Parallel`.
 
     This library provides various benefits over using ``Run`` and other similar
     keywords in the
@@ -632,6 +738,7 @@ class Process:
     def __init__(self):
         self._processes = ConnectionCache[subprocess.Popen]("No active process.")
         self._results: dict[subprocess.Popen, ProcessResult] = {}
+        self._readers: dict[subprocess.Popen, OutputReader] = {}
 
     def run_process(
         self,
@@ -704,6 +811,96 @@ class Process:
         finally:
             self._processes.current = current
 
+    def run_processes_in_parallel(
+        self,
+        *commands: "str | Sequence[str]",
+        cwd: "str | None" = None,
+        shell: bool = False,
+        output_encoding: str = "CONSOLE",
+        timeout: "timedelta | None" = None,
+        on_timeout: OnTimeout = "terminate",
+        env: "dict[str, str | Secret] | None" = None,
+        **env_extra: "str | Secret",
+    ) -> "list[ProcessResult | None]":
+        """Runs multiple processes in parallel and waits for all of them to complete.
+
+        Each command can be given either as a list containing the command and
+        its arguments or as a string. A string is split to a command and
+        arguments using `Split Command Line` unless `running processes in
+        shell`, in which case the string is passed to the shell as-is.
+
+        All processes are started first and then waited for at the same time.
+        Their standard output and error streams are read on background while
+        waiting, so a process producing lot of output cannot block others.
+
+        ``cwd``, ``shell``, ``output_encoding``, ``env`` and ``env_extra`` are
+        used with all processes and they are documented in the `Process
+        configuration` section. Outputs cannot be redirected to files.
+
+        ``timeout`` is the maximum time to wait for all processes together,
+        and ``on_timeout`` specifies what to do with processes that are still
+        running after that. They have the same semantics as with `Wait For
+        Process`, except that the default action is to terminate processes.
+
+        Returns a list of `result objects` in the same order as the commands
+        were given. If a process is left running, ``None`` is returned in
+        its place.
+
+        Examples:
+        | @{first} = | `Create List` | python | -c | print('first') |
+        | @{results} = | Run Processes In Parallel | ${first} | tool.sh --arg | timeout=1 min |
+        | Should Be Equal | ${results[0].stdout} | first |
+        | @{results} = | Run Processes In Parallel | cmd1 \\| cmd2 | cmd3 | shell=True |
+
+        This keyword does not change the `active process`.
+
+        New in Robot Framework 7.5.
+        """
+        current = self._processes.current
+        processes = []
+        try:
+            for command in commands:
+                if isinstance(command, str):
+                    command = [command] if shell else self.split_command_line(command)
+                if not command:
+                    raise ValueError("Command cannot be empty.")
+                process = self.start_process(
+                    *command,
+                    cwd=cwd,
+                    shell=shell,
+                    output_encoding=output_encoding,
+                    env=env,
+                    **env_extra,
+                )
+                self._get_output_reader(process)
+                processes.append(process)
+            return self._wait_in_parallel(processes, timeout, on_timeout.lower())
+        finally:
+            self._processes.current = current
+
+    def _wait_in_parallel(
+        self,
+        processes: "list[subprocess.Popen]",
+        timeout: "timedelta | None",
+        on_timeout: str,
+    ) -> "list[ProcessResult | None]":
+        logger.info(f"Waiting for {len(processes)} processes to complete.")
+        timeout = timeout.total_seconds() if timeout else -1
+        end_time = time.time() + timeout
+        results = []
+        for process in processes:
+            if timeout > 0:
+                remaining = max(end_time - time.time(), 0)
+                if not self._process_is_stopped(process, remaining):
+                    logger.info(
+                        f"Process {process.pid} did not complete in "
+                        f"{secs_to_timestr(timeout)}."
+                    )
+                    results.append(self._manage_process_timeout(process, on_timeout))
+                    continue
+            results.append(self._wait(process))
+        return results
+
     def start_process(
         self,
         command: str,
@@ -887,6 +1084,76 @@ class Process:
             return self._manage_process_timeout(handle, on_timeout.lower())
         return self._wait(process)
 
+    def wait_until_process_output_contains(
+        self,
+        text: str,
+        handle: Handle = None,
+        timeout: "timedelta | None" = None,
+        stream: Literal["stdout", "stderr"] = "stdout",
+        error_message: "str | None" = None,
+    ):
+        """Waits until output of a running process contains the given ``text``.
+
+        If ``handle`` is not given, uses the current `active process`.
+
+        ``timeout`` defines the maximum time to wait in
+        [http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#time-format|
+        Robot Framework time format]. If it is not given, waits until the
+        text is found or the process closes the stream. ``stream`` specifies
+        which stream to monitor and it can be either ``stdout`` (default) or
+        ``stderr``. The stream must not be `redirected to a file
+        <Standard output and error streams>`.
+
+        Fails if the text is not found before the timeout or before the process
+        closes the stream. The default error message can be overridden with
+        the ``error_message`` argument.
+
+        Output is read on background after this keyword has been used the first
+        time with the process, and the keyword returns immediately when the
+        text is found. The output is also available normally in the `result
+        object` returned by `Wait For Process` and `Terminate Process`.
+
+        Examples:
+        | `Start Process` | server.py | alias=server |
+        | Wait Until Process Output Contains | Server started | server | timeout=30s |
+        | Wait Until Process Output Contains | Warning | stream=stderr | timeout=1 min |
+
+        New in Robot Framework 7.5.
+        """
+        process = self._processes[handle]
+        result = self._results[process]
+        stream = stream.lower()
+        if stream not in ("stdout", "stderr"):
+            raise ValueError(f"Stream must be 'stdout' or 'stderr', got '{stream}'.")
+        if result.rc is not None:
+            if text not in (getattr(result, stream) or ""):
+                raise AssertionError(
+                    error_message or f"Process {stream} did not contain '{text}'."
+                )
+            return
+        reader = self._get_output_reader(process)
+        if not reader.is_piped(stream):
+            raise RuntimeError(
+                f"Cannot monitor {stream} because it is redirected "
+                f"or combined with another stream."
+            )
+        data = console_encode(text, result._output_encoding, force=True)
+        seconds = timeout.total_seconds() if timeout else None
+        logger.info(f"Waiting until process {stream} contains '{text}'.")
+        if not reader.wait_until_contains(stream, data, seconds):
+            if error_message:
+                raise AssertionError(error_message)
+            if seconds is not None and reader.is_open(stream):
+                limit = f"in {secs_to_timestr(seconds)}"
+            else:
+                limit = "before the stream was closed"
+            raise AssertionError(f"Process {stream} did not contain '{text}' {limit}.")
+
+    def _get_output_reader(self, process: subprocess.Popen) -> OutputReader:
+        if process not in self._readers:
+            self._readers[process] = OutputReader(process)
+        return self._readers[process]
+
     def _manage_process_timeout(
         self,
         handle: subprocess.Popen,
@@ -900,6 +1167,8 @@ class Process:
         return None
 
     def _wait(self, process: subprocess.Popen) -> ProcessResult:
+        if process in self._readers:
+            return self._wait_with_reader(process, self._readers.pop(process))
         result = self._results[process]
         # Popen.communicate() does not like closed stdin/stdout/stderr PIPEs.
         # Due to us using a timeout, we only need to care about stdin.
@@ -923,6 +1192,47 @@ class Process:
         logger.info("Process completed.")
         return result
 
+    def _wait_with_reader(
+        self,
+        process: subprocess.Popen,
+        reader: OutputReader,
+    ) -> ProcessResult:
+        result = self._results[process]
+        # Same as what Popen.communicate() does when there is no input.
+        if process.stdin and not process.stdin.closed:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+        while True:
+            try:
+                process.wait(timeout=0.1)
+            except subprocess.TimeoutExpired:
+                continue
+            except TimeoutExceeded:
+                logger.info("Timeout exceeded.")
+                self._kill(process)
+                raise
+            else:
+                break
+        # Possible child processes can keep streams open after the process
+        # has ended. Communicate() would wait for them, but that is not
+        # worth hanging here forever. Streams still being read cannot be
+        # closed, so they are left to the reader threads.
+        finished = reader.join(timeout=self.KILL_TIMEOUT)
+        result.stdout = reader.get("stdout")
+        result.stderr = reader.get("stderr")
+        if finished:
+            for stream in process.stdout, process.stderr:
+                if stream:
+                    stream.close()
+        else:
+            process.stdout = process.stderr = None
+        result.rc = process.returncode
+        result.close_streams()
+        logger.info("Process completed.")
+        return result
+
     def terminate_process(
         self,
         handle: Handle = None,
@@ -13,23 +13,31 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import hashlib
 import http.client
+import os
 import re
 import socket
 import sys
+import tempfile
+import threading
 import xmlrpc.client
 from contextlib import contextmanager
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from xml.parsers.expat import ExpatError
 
 from robot.errors import RemoteError
-from robot.utils import DotDict, is_dict_like, is_list_like, safe_str, timestr_to_secs
+from robot.utils import (
+    DotDict, is_dict_like, is_list_like, JsonDumper, JsonLoader, safe_str,
+    timestr_to_secs
+)
 
 
 class Remote:
     ROBOT_LIBRARY_SCOPE = "TEST SUITE"
 
-    def __init__(self, uri="http://127.0.0.1:8270", timeout=None):
+    def __init__(self, uri="http://127.0.0.1:8270", timeout=None, cache=None):
         """Connects to a remote server at ``uri``.
 
         Optional ``timeout`` can be used to specify a timeout to wait when
@@ -41,6 +49,13 @@ class Remote:
         the operating system and its configuration. Notice that setting
         a timeout that is shorter than keyword execution time will interrupt
         the keyword.
+
+        If optional ``cache`` is given, library information got from the server
+        is cached on the disk and later imports using the same ``uri`` and
+        ``cache`` do not need to get it again. The value should identify
+        the library version on the server (e.g. ``1.2.3``) so that the cache
+        is not used after the library has changed. Caching requires the server
+        to support ``get_library_information`` or ``system.multicall``.
         """
         if "://" not in uri:
             uri = "http://" + uri
@@ -48,6 +63,7 @@ class Remote:
             timeout = timestr_to_secs(timeout)
         self._uri = uri
         self._client = XmlRpcRemoteClient(uri, timeout)
+        self._cache = LibraryInfoCache(uri, cache) if cache else None
         self._lib_info = None
         self._lib_info_initialized = False
 
@@ -67,13 +83,28 @@ class Remote:
 
     def _is_lib_info_available(self):
         if not self._lib_info_initialized:
-            try:
-                self._lib_info = self._client.get_library_information()
-            except TypeError:
-                pass
+            self._lib_info = self._get_lib_info()
             self._lib_info_initialized = True
         return self._lib_info is not None
 
+    def _get_lib_info(self):
+        if self._cache:
+            lib_info = self._cache.load()
+            if lib_info is not None:
+                return lib_info
+        for getter in (
+            self._client.get_library_information,
+            self._client.get_library_information_using_multicall,
+        ):
+            try:
+                lib_info = getter()
+            except TypeError:
+                continue
+            if self._cache:
+                self._cache.save(lib_info)
+            return lib_info
+        return None
+
     def get_keyword_arguments(self, name):
         return self._get_kw_info(
             name,
@@ -221,27 +252,57 @@ class XmlRpcRemoteClient:
     @property
     @contextmanager
     def _server(self):
-        if self.uri.startswith("https://"):
-            transport = TimeoutHTTPSTransport(timeout=self.timeout)
-        else:
-            transport = TimeoutHTTPTransport(timeout=self.timeout)
-        server = xmlrpc.client.ServerProxy(
-            self.uri,
-            encoding="UTF-8",
-            use_builtin_types=True,
-            transport=transport,
-        )
+        server = SERVER_POOL.acquire(self.uri, self.timeout)
         try:
             yield server
         except (socket.error, xmlrpc.client.Error) as err:
+            SERVER_POOL.discard(server)
             raise TypeError(err)
-        finally:
-            server("close")()
+        except BaseException:
+            SERVER_POOL.discard(server)
+            raise
+        else:
+            SERVER_POOL.release(server, self.uri, self.timeout)
 
     def get_library_information(self):
         with self._server as server:
             return server.get_library_information()
 
+    def get_library_information_using_multicall(self):
+        # Servers not having `get_library_information` typically have
+        # `system.multicall` that allows getting same information in one go.
+        getters = {
+            "args": "get_keyword_arguments",
+            "types": "get_keyword_types",
+            "tags": "get_keyword_tags",
+            "doc": "get_keyword_documentation",
+        }
+        with self._server as server:
+            names = server.get_keyword_names()
+            multicall = xmlrpc.client.MultiCall(server)
+            for name in names:
+                for method in getters.values():
+                    getattr(multicall, method)(name)
+            for name in "__intro__", "__init__":
+                multicall.get_keyword_documentation(name)
+            results = iter(multicall().results)
+        info = {}
+        for name in names:
+            info[name] = self._get_multicall_results(getters, results)
+        for name in "__intro__", "__init__":
+            info[name] = self._get_multicall_results({"doc": None}, results)
+        return info
+
+    def _get_multicall_results(self, getters, results):
+        info = {}
+        for key in getters:
+            result = next(results)
+            # Failed calls are returned as fault dictionaries. They are ignored
+            # the same way as failures when calling methods individually.
+            if isinstance(result, list) and len(result) == 1:
+                info[key] = result[0]
+        return info
+
     def get_keyword_names(self):
         with self._server as server:
             return server.get_keyword_names()
@@ -280,6 +341,84 @@ class XmlRpcRemoteClient:
             raise RuntimeError(message)
 
 
+class LibraryInfoCache:
+    """On-disk cache for library information got from a remote server.
+
+    Cache files are stored in the system temporary directory and named based
+    on the server URI and the version given by the user. Failures to read or
+    write cache files are ignored and information is got from the server.
+    """
+
+    directory = Path(tempfile.gettempdir(), "robotframework", "remote")
+
+    def __init__(self, uri, version):
+        key = hashlib.sha256(f"{uri}\n{version}".encode("UTF-8")).hexdigest()
+        self.path = self.directory / f"{key}.json"
+
+    def load(self):
+        try:
+            return JsonLoader().load(self.path)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, lib_info):
+        temp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            JsonDumper(ensure_ascii=False).dump(lib_info, temp)
+            os.replace(temp, self.path)
+        except (OSError, ValueError, TypeError):
+            if temp.exists():
+                temp.unlink()
+
+
+class ServerProxyPool:
+    """Pool of idle XML-RPC server proxies per URI and timeout.
+
+    Proxies keep their HTTP connections open, which avoids connecting again,
+    possibly with TLS, on every call if the server supports persistent
+    connections. Proxies are returned to the pool only after successful calls
+    and proxies that fail are closed. Reconnecting if the server has closed
+    an idle connection is handled by the underlying transport.
+    """
+
+    max_idle = 8
+
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, uri, timeout=None):
+        with self._lock:
+            idle = self._idle.get((uri, timeout))
+            if idle:
+                return idle.pop()
+        if uri.startswith("https://"):
+            transport = TimeoutHTTPSTransport(timeout=timeout)
+        else:
+            transport = TimeoutHTTPTransport(timeout=timeout)
+        return xmlrpc.client.ServerProxy(
+            uri,
+            encoding="UTF-8",
+            use_builtin_types=True,
+            transport=transport,
+        )
+
+    def release(self, server, uri, timeout=None):
+        with self._lock:
+            idle = self._idle.setdefault((uri, timeout), [])
+            if len(idle) < self.max_idle:
+                idle.append(server)
+                return
+        self.discard(server)
+
+    def discard(self, server):
+        server("close")()
+
+
+SERVER_POOL = ServerProxyPool()
+
+
 # Custom XML-RPC timeouts based on
 # http://stackoverflow.com/questions/2425799/timeout-for-xmlrpclib-client-requests
 class TimeoutHTTPTransport(xmlrpc.client.Transport):
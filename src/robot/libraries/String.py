@@ -15,13 +15,14 @@
 
 import os
 import re
-from fnmatch import fnmatchcase
 from random import randint
 from string import ascii_lowercase, ascii_uppercase, digits
 from typing import Callable, Literal
 
 from robot.api import logger
-from robot.utils import FileReader, parse_re_flags, plural_or_not as s, type_name
+from robot.utils import (
+    compile_pattern, FileReader, parse_re_flags, plural_or_not as s, type_name
+)
 from robot.version import get_version
 
 from .normalizer import Normalizer
@@ -63,6 +64,10 @@ class String:
 
     ROBOT_LIBRARY_SCOPE = "GLOBAL"
     ROBOT_LIBRARY_VERSION = get_version()
+    _other_line_separators = {
+        str: re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]"),
+        bytes: re.compile(b"\r"),
+    }
 
     def convert_to_lower_case(self, string: "str | bytes") -> "str | bytes":
         """Converts string to lower case.
@@ -155,7 +160,7 @@ class String:
         else:
             split, join = r"(\s+)", ""
         try:
-            exclude = [re.compile(e) for e in exclude]
+            exclude = [compile_pattern(e) for e in exclude]
         except re.error as err:
             raise ValueError(
                 f"Compiling exclude pattern {err.pattern!r} to a regular expression "
@@ -390,6 +395,8 @@ class String:
             pattern = self._ensure_bytes(pattern)
         if case_insensitive is not None:
             ignore_case = case_insensitive
+        if not ignore_case:
+            return self._get_lines_containing(string, pattern)
         normalize = Normalizer(ignore_case=ignore_case).normalize
         pattern = normalize(pattern)
         return self._get_matching_lines(string, lambda line: pattern in normalize(line))
@@ -438,11 +445,8 @@ class String:
         if case_insensitive is not None:
             ignore_case = case_insensitive
         normalize = Normalizer(ignore_case=ignore_case).normalize
-        pattern = normalize(pattern)
-        return self._get_matching_lines(
-            string,
-            lambda line: fnmatchcase(normalize(line), pattern),
-        )
+        match = compile_pattern(normalize(pattern), regexp=False).match
+        return self._get_matching_lines(string, lambda line: match(normalize(line)))
 
     def get_lines_matching_regexp(
         self,
@@ -489,7 +493,7 @@ class String:
         """
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
-        regexp = re.compile(pattern, flags=parse_re_flags(flags))
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
         match = regexp.search if partial_match else regexp.fullmatch
         return self._get_matching_lines(string, match)
 
@@ -503,6 +507,37 @@ class String:
         logger.info(f"{len(matching)} out of {len(lines)} lines matched.")
         return ("\n" if isinstance(string, str) else b"\n").join(matching)
 
+    def _get_lines_containing(
+        self,
+        string: "str | bytes",
+        substring: "str | bytes",
+    ) -> "str | bytes":
+        # Searching the whole text and expanding hits to line boundaries avoids
+        # splitting large strings to lines. Only works if lines are separated
+        # with plain newlines, because `splitlines` also splits on other
+        # separators.
+        newline = "\n" if isinstance(string, str) else b"\n"
+        if (
+            not substring
+            or newline in substring
+            or self._other_line_separators[type(string)].search(string)
+        ):
+            return self._get_matching_lines(string, lambda line: substring in line)
+        matching = []
+        index = string.find(substring)
+        while index != -1:
+            start = string.rfind(newline, 0, index) + 1
+            end = string.find(newline, index)
+            if end == -1:
+                end = len(string)
+            matching.append(string[start:end])
+            index = string.find(substring, end)
+        total = string.count(newline)
+        if string and not string.endswith(newline):
+            total += 1
+        logger.info(f"{len(matching)} out of {total} lines matched.")
+        return newline.join(matching)
+
     def get_regexp_matches(
         self,
         string: "str | bytes",
@@ -549,7 +584,7 @@ class String:
         """
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
-        regexp = re.compile(pattern, flags=parse_re_flags(flags))
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
         groups = [self._parse_group(g) for g in groups]
         return [m.group(*groups) for m in regexp.finditer(string)]
 
@@ -632,13 +667,8 @@ class String:
         if isinstance(string, bytes):
             pattern = self._ensure_bytes(pattern)
             replace_with = self._ensure_bytes(replace_with)
-        return re.sub(
-            pattern,
-            replace_with,
-            string,
-            count=max(count, 0),
-            flags=parse_re_flags(flags),
-        )
+        regexp = compile_pattern(pattern, parse_re_flags(flags))
+        return regexp.sub(replace_with, string, count=max(count, 0))
 
     def remove_string(
         self,
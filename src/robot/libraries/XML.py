@@ -15,7 +15,9 @@
 
 import copy
 import re
+from collections import deque
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, NoReturn, TYPE_CHECKING
 from xml.etree import ElementTree as ET
@@ -112,6 +114,8 @@ class XML:
       (e.g `Element Text Should Be` and `Elements Should Be Equal`).
     - Modifying XML and saving it (e.g. `Set Element Text`, `Add Element`
       and `Save XML`).
+    - Finding elements from large XML files without parsing them fully
+      into memory (e.g. `Get Elements From File`).
 
     == Table of contents ==
 
@@ -159,6 +163,30 @@ class XML:
     than the standard ElementTree and enables using `Evaluate Xpath` keyword.
     It also preserves the doctype and possible namespace prefixes saving XML.
 
+    = Handling large files =
+
+    `Parse XML` and other keywords accepting a path to an XML file parse
+    the whole file into memory before finding elements. With very large
+    files that can be slow and use lots of memory, and in such cases
+    `Get Element Count From File`, `Get First Element From File` and
+    `Get Elements From File` keywords can be used instead. They parse
+    the file incrementally and keep only matching elements, and their
+    children, in memory. `Get First Element From File` stops parsing
+    immediately when it has found a match.
+
+    These keywords support only a subset of the syntax explained in the
+    `Finding elements with xpath` section. Paths can contain tag names,
+    the ``*`` wildcard, the ``//`` descendant separator, and predicates like
+    ``[@attr]`` and ``[@attr='value']`` that check attributes. Matching is done against tag names without namespaces unless
+    the tag is given in Clark Notation like ``{http://my.ns}tag``. Returned
+    elements are handled the same way as when using `Parse XML` with default
+    namespace handling.
+
+    Examples:
+    | ${count} = | `Get Element Count From File` | ${CURDIR}/huge.xml | .//record |
+    | ${first} = | `Get First Element From File` | ${CURDIR}/huge.xml | record[@status='FAIL'] |
+    | @{elems} = | `Get Elements From File` | ${CURDIR}/huge.xml | .//error | limit=10 |
+
     = Example =
 
     The following simple example demonstrates parsing XML and verifying its
@@ -655,6 +683,70 @@ class XML:
         logger.info(f"{count} element{s(count)} matched '{xpath}'.")
         return count
 
+    def get_element_count_from_file(self, source: Source, xpath: str) -> int:
+        """Returns and logs how many elements the ``xpath`` matches in a large file.
+
+        Unlike `Get Element Count`, this keyword parses the ``source`` file
+        incrementally and does not keep parsed elements in memory. Supported
+        ``xpath`` syntax is limited. See the `Handling large files` section for
+        more details.
+        """
+        count = sum(1 for _ in self._stream(source, xpath, keep=False))
+        logger.info(f"{count} element{s(count)} matched '{xpath}'.")
+        return count
+
+    def get_first_element_from_file(self, source: Source, xpath: str) -> Element:
+        """Returns the first element matching the ``xpath`` in a large file.
+
+        The ``source`` file is parsed incrementally and parsing is stopped
+        when the first matching element has been found. The keyword fails if
+        no element matches. Supported ``xpath`` syntax is limited. See the
+        `Handling large files` section for more details.
+        """
+        for elem in self._stream(source, xpath):
+            return elem
+        self._raise_wrong_number_of_matches(0, xpath)
+
+    def get_elements_from_file(
+        self,
+        source: Source,
+        xpath: str,
+        limit: "int | None" = None,
+    ) -> "list[Element]":
+        """Returns elements matching the ``xpath`` in a large file.
+
+        Unlike `Get Elements`, this keyword parses the ``source`` file
+        incrementally and keeps only matching elements, and their children,
+        in memory. If ``limit`` is given, parsing is stopped after that many
+        elements have been found. Supported ``xpath`` syntax is limited.
+        See the `Handling large files` section for more details.
+        """
+        elements = []
+        if limit is not None and limit < 1:
+            return elements
+        for elem in self._stream(source, xpath):
+            elements.append(elem)
+            if len(elements) == limit:
+                break
+        return elements
+
+    def _stream(
+        self,
+        source: Source,
+        xpath: str,
+        keep: bool = True,
+    ) -> "Iterator[Element]":
+        if not isinstance(source, (str, bytes, Path)):
+            raise TypeError(
+                f"Source must be a path to an XML file or XML data, "
+                f"got {type(source).__name__}."
+            )
+        streamer = ElementStreamer(self.etree, self.lxml_etree)
+        for elem in streamer.iterate(source, xpath, keep):
+            if keep:
+                self._ns_stripper.strip(elem)
+            yield elem
+
     def element_should_exist(
         self,
         source: Source,
@@ -1604,7 +1696,16 @@ class XML:
         """
         if not self.lxml_etree:
             raise RuntimeError("'Evaluate Xpath' keyword only works in lxml mode.")
-        return self.get_element(source, context).xpath(expression)  # type: ignore
+        elem = self.get_element(source, context)
+        return _compile_xpath(expression)(elem)
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(xpath: str, clark_notation: bool = False):
+    # Compiling xpaths is relatively expensive and same xpaths are typically
+    # used over and over again. Only used in lxml mode.
+    compile = lxml_etree.ETXPath if clark_notation else lxml_etree.XPath
+    return compile(xpath)  # type: ignore
 
 
 class NameSpaceStripper:
@@ -1667,8 +1768,7 @@ class ElementFinder:
             return [elem]
         if not self.lxml:
             return elem.findall(xpath)
-        finder = self.etree.ETXPath(xpath)  # type: ignore
-        return finder(elem)
+        return _compile_xpath(xpath, clark_notation=True)(elem)
 
     def _get_xpath(self, xpath: str) -> str:
         if not xpath:
@@ -1687,6 +1787,133 @@ class ElementFinder:
             return xpath
 
 
+class ElementStreamer:
+    """Finds elements matching a simple xpath by parsing XML incrementally.
+
+    Elements not matching the xpath are cleared and removed from the tree
+    as soon as they have been parsed, unless they are inside a matching
+    element. Matching elements are yielded in document order.
+    """
+
+    _separator = re.compile(r"/(?![^{[]*[}\]])")
+    _step = re.compile(
+        r"(\*|(?:\{[^}]*\})?[^\s/\[\]{}*@().][^\s/\[\]{}*@()]*)((?:\[[^\]]*\])*)"
+    )
+    _predicate = re.compile(r"""\[@([^\s=\]]+)(?:=(?:'([^']*)'|"([^"]*)"))?\]""")
+
+    def __init__(self, etree, lxml: bool = False):
+        self.etree = etree
+        self.lxml = lxml
+
+    def iterate(
+        self,
+        source: Source,
+        xpath: str,
+        keep: bool = True,
+    ) -> "Iterator[Element]":
+        steps = self._parse_xpath(xpath)
+        depth = len(steps) if None not in steps else None
+        config = {"remove_comments": True, "remove_pis": True} if self.lxml else {}
+        path: "list[Element]" = []
+        matches: "list[list | None]" = []
+        pending: "deque[list]" = deque()
+        with ETSource(source) as source_:
+            for event, elem in self.etree.iterparse(
+                source_, ("start", "end"), **config
+            ):
+                if event == "start":
+                    match = None
+                    if depth is None or depth == len(path):
+                        if self._matches(steps, path[1:] + [elem] if path else []):
+                            if keep:
+                                match = [elem, False]
+                                pending.append(match)
+                            else:
+                                yield elem
+                    path.append(elem)
+                    matches.append(match)
+                    continue
+                path.pop()
+                match = matches.pop()
+                if match:
+                    match[1] = True
+                while pending and pending[0][1]:
+                    yield pending.popleft()[0]
+                if path and not pending:
+                    if not match:
+                        elem.clear()
+                    # The current element may not yet have its tail text, but
+                    # earlier siblings are complete and can be removed.
+                    del path[-1][:-1]
+
+    def _parse_xpath(self, xpath: str) -> "list[tuple | None]":
+        if not xpath:
+            raise RuntimeError("No xpath given.")
+        if xpath.startswith("/"):
+            self._unsupported(xpath)
+        if xpath == ".":
+            return []
+        parts = self._separator.split(xpath)
+        if parts[0] == ".":
+            parts.pop(0)
+        steps = []
+        for index, part in enumerate(parts):
+            if part == ".":
+                continue
+            if part:
+                steps.append(self._parse_step(part, xpath))
+            elif index == len(parts) - 1 or (steps and steps[-1] is None):
+                self._unsupported(xpath)
+            else:
+                steps.append(None)
+        return steps
+
+    def _parse_step(self, step: str, xpath: str) -> tuple:
+        match = self._step.fullmatch(step)
+        if not match:
+            self._unsupported(xpath)
+        tag, predicates = match.groups()
+        attrs = []
+        for predicate in re.findall(r"\[[^\]]*\]", predicates):
+            match = self._predicate.fullmatch(predicate)
+            if not match:
+                self._unsupported(xpath)
+            name, value1, value2 = match.groups()
+            attrs.append((name, value1 if value1 is not None else value2))
+        return tag, attrs
+
+    def _unsupported(self, xpath: str) -> NoReturn:
+        raise RuntimeError(
+            f"Xpath '{xpath}' is not supported when parsing incrementally."
+        )
+
+    def _matches(self, steps: "list[tuple | None]", nodes: "list[Element]") -> bool:
+        if not steps:
+            return not nodes
+        step = steps[0]
+        if step is None:
+            return any(self._matches(steps[1:], nodes[i:]) for i in range(len(nodes)))
+        return (
+            bool(nodes)
+            and self._step_matches(step, nodes[0])
+            and self._matches(steps[1:], nodes[1:])
+        )
+
+    def _step_matches(self, step: tuple, elem: Element) -> bool:
+        tag, attrs = step
+        if tag != "*":
+            elem_tag = elem.tag
+            if tag[0] != "{" and elem_tag[0] == "{":
+                elem_tag = elem_tag.split("}", 1)[1]
+            if tag != elem_tag:
+                return False
+        for name, value in attrs:
+            actual = elem.get(name)
+            if actual is None or (value is not None and actual != value):
+                return False
+        return True
+
+
 class Location:
 
     def __init__(self, path: str, is_root: bool = True):
@@ -56,11 +56,16 @@ from .message import Message as Message, MessageLevel as MessageLevel
 from .modelobject import DataDict as DataDict, ModelObject as ModelObject
 from .modifier import ModelModifier as ModelModifier
 from .statistics import Statistics as Statistics
-from .tags import TagPattern as TagPattern, TagPatterns as TagPatterns, Tags as Tags
+from .tags import (
+    TagIndex as TagIndex,
+    TagPattern as TagPattern,
+    TagPatterns as TagPatterns,
+    Tags as Tags,
+)
 from .testcase import TestCase as TestCase, TestCases as TestCases
 from .testsuite import TestSuite as TestSuite, TestSuites as TestSuites
 from .totalstatistics import (
     TotalStatistics as TotalStatistics,
     TotalStatisticsBuilder as TotalStatisticsBuilder,
 )
-from .visitor import SuiteVisitor as SuiteVisitor
+from .visitor import CompositeVisitor as CompositeVisitor, SuiteVisitor as SuiteVisitor
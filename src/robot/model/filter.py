@@ -18,7 +18,7 @@ from typing import Sequence, TYPE_CHECKING
 from robot.utils import setter
 
 from .namepatterns import NamePatterns
-from .tags import TagPatterns
+from .tags import TagIndex, TagPatterns
 from .visitor import SuiteVisitor
 
 if TYPE_CHECKING:
@@ -57,6 +57,7 @@ class Filter(EmptySuiteRemover):
         self.include_tests = include_tests
         self.include_tags = include_tags
         self.exclude_tags = exclude_tags
+        self._selected_by_tags: "set[int] | None" = None
 
     @setter
     def include_suites(self, suites) -> "NamePatterns | None":
@@ -89,6 +90,35 @@ class Filter(EmptySuiteRemover):
         self._filter_tests(suite)
         return bool(suite.suites)
 
+    def visit_suite(self, suite: "TestSuite"):
+        if self._selected_by_tags is not None or not self._filters_by_tags:
+            super().visit_suite(suite)
+            return
+        self._selected_by_tags = self._select_by_tags(suite)
+        try:
+            super().visit_suite(suite)
+        finally:
+            self._selected_by_tags = None
+
+    @property
+    def _filters_by_tags(self) -> bool:
+        # When filtering by suite names, a separate filter handles tags.
+        if self.include_suites is not None:
+            return False
+        return self.include_tags is not None or self.exclude_tags is not None
+
+    def _select_by_tags(self, suite: "TestSuite") -> "set[int]":
+        # Tests in the whole suite structure are matched at once. Returned
+        # set contains ids of the selected test objects.
+        tests = list(suite.all_tests)
+        index = TagIndex(test.tags for test in tests)
+        selected = index.all
+        if self.include_tags is not None:
+            selected &= self.include_tags.select(index)
+        if self.exclude_tags is not None:
+            selected &= ~self.exclude_tags.select(index)
+        return {id(tests[position]) for position in index.items(selected)}
+
     def _filter_based_on_suite_name(self, suite: "TestSuite") -> bool:
         if self.include_suites.match(suite.name, suite.full_name):
             suite.visit(
@@ -104,14 +134,11 @@ class Filter(EmptySuiteRemover):
 
     def _filter_tests(self, suite: "TestSuite"):
         tests = self.include_tests
-        include = self.include_tags
-        exclude = self.exclude_tags
         if tests is not None:
             suite.tests = [t for t in suite.tests if tests.match(t.name, t.full_name)]
-        if include is not None:
-            suite.tests = [t for t in suite.tests if include.match(t.tags)]
-        if exclude is not None:
-            suite.tests = [t for t in suite.tests if not exclude.match(t.tags)]
+        if self._selected_by_tags is not None:
+            selected = self._selected_by_tags
+            suite.tests = [t for t in suite.tests if id(t) in selected]
 
     def __bool__(self) -> bool:
         return bool(
@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 from abc import ABC, abstractmethod
-from typing import Iterable, Iterator, overload, Sequence
+from typing import Callable, Iterable, Iterator, overload, Sequence
 
 from robot.utils import Matcher, normalize, NormalizedDict
 
@@ -133,6 +133,13 @@ class TagPatterns(Sequence["TagPattern"]):
         tags = normalize_tags(tags)
         return any(p.match(tags) for p in self._patterns)
 
+    def select(self, index: "TagIndex") -> int:
+        """Return items in the ``index`` matching any of the patterns as a bitset."""
+        selected = 0
+        for pattern in self._patterns:
+            selected |= pattern.select(index)
+        return selected
+
     def __contains__(self, tag: str) -> bool:
         return self.match(tag)
 
@@ -223,6 +230,15 @@ class TagPattern(ABC):
     def match(self, tags: Iterable[str]) -> bool:
         raise NotImplementedError
 
+    def select(self, index: "TagIndex") -> int:
+        """Return items in the ``index`` matching this pattern as a bitset.
+
+        The default implementation calls :meth:`match` with tags of each item
+        separately. Subclasses can override this to select items more
+        efficiently.
+        """
+        return index.filter(self.match)
+
     @abstractmethod
     def __iter__(self) -> Iterator["TagPattern"]:
         raise NotImplementedError
@@ -257,6 +273,9 @@ class SingleTagPattern(TagPattern):
         tags = normalize_tags(tags)
         return self._matcher.match_any(tags)
 
+    def select(self, index: "TagIndex") -> int:
+        return index.match(self._matcher)
+
     def __iter__(self) -> Iterator["TagPattern"]:
         yield self
 
@@ -276,6 +295,12 @@ class AndTagPattern(TagPattern):
         tags = normalize_tags(tags)
         return all(p.match(tags) for p in self._patterns)
 
+    def select(self, index: "TagIndex") -> int:
+        selected = index.all
+        for pattern in self._patterns:
+            selected &= pattern.select(index)
+        return selected
+
     def __iter__(self) -> Iterator["TagPattern"]:
         return iter(self._patterns)
 
@@ -292,6 +317,12 @@ class OrTagPattern(TagPattern):
         tags = normalize_tags(tags)
         return any(p.match(tags) for p in self._patterns)
 
+    def select(self, index: "TagIndex") -> int:
+        selected = 0
+        for pattern in self._patterns:
+            selected |= pattern.select(index)
+        return selected
+
     def __iter__(self) -> Iterator["TagPattern"]:
         return iter(self._patterns)
 
@@ -311,6 +342,10 @@ class NotTagPattern(TagPattern):
             return False
         return not self._rest.match(tags)
 
+    def select(self, index: "TagIndex") -> int:
+        selected = self._first.select(index) if self._first else index.all
+        return selected & ~self._rest.select(index)
+
     def __iter__(self) -> Iterator["TagPattern"]:
         yield self._first
         yield from self._rest
@@ -319,6 +354,84 @@ class NotTagPattern(TagPattern):
         return " NOT ".join(str(pattern) for pattern in self).lstrip()
 
 
+class TagIndex:
+    """Index for matching tags of multiple items against tag patterns at once.
+
+    Tags are normalized and each distinct tag is matched against a pattern
+    only once regardless how many items have it. Sets of items are represented
+    as integers used as bitsets so that bit ``n`` is set if the item at position
+    ``n`` belongs to the set. ``AND``, ``OR`` and ``NOT`` patterns are then
+    evaluated using bitwise operations.
+
+    Use :meth:`TagPatterns.select` and :meth:`TagPattern.select` for selecting
+    items and :meth:`items` for converting the resulting bitset to positions.
+    """
+
+    def __init__(self, tags: "Iterable[Iterable[str]]" = ()):
+        self._tags: "dict[str, list[int]]" = {}
+        self._matches: "dict[str, int]" = {}
+        self.count = 0
+        for item_tags in tags:
+            self.add(item_tags)
+
+    def add(self, tags: Iterable[str]) -> int:
+        """Add item with given ``tags`` to the index and return its position."""
+        position = self.count
+        for tag in normalize_tags(tags):
+            self._tags.setdefault(tag, []).append(position)
+        self.count += 1
+        self._matches.clear()
+        return position
+
+    @property
+    def all(self) -> int:
+        """Bitset containing all items."""
+        return (1 << self.count) - 1
+
+    def match(self, matcher: Matcher) -> int:
+        """Return items having a tag matching the ``matcher`` as a bitset.
+
+        The ``matcher`` must not normalize tags, because they are already
+        normalized in the index.
+        """
+        pattern = matcher.pattern
+        if pattern not in self._matches:
+            positions = [
+                position
+                for tag, tag_positions in self._tags.items()
+                if matcher.match(tag)
+                for position in tag_positions
+            ]
+            self._matches[pattern] = self._to_bitset(positions)
+        return self._matches[pattern]
+
+    def filter(self, predicate: "Callable[[Iterable[str]], bool]") -> int:
+        """Return items whose tags ``predicate`` accepts as a bitset.
+
+        The ``predicate`` is called with normalized tags of each item separately,
+        which is considerably slower than using :meth:`match`.
+        """
+        item_tags = [NormalizedTags() for _ in range(self.count)]
+        for tag, positions in self._tags.items():
+            for position in positions:
+                item_tags[position].append(tag)
+        positions = [pos for pos, tags in enumerate(item_tags) if predicate(tags)]
+        return self._to_bitset(positions)
+
+    def _to_bitset(self, positions: "list[int]") -> int:
+        # Setting bits in a byte array is considerably faster than ORing
+        # large integers together.
+        bits = bytearray((self.count + 7) // 8)
+        for position in positions:
+            bits[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes(bits, "little")
+
+    def items(self, bitset: int) -> "list[int]":
+        """Return positions of items in the ``bitset``."""
+        bits = bin(bitset)[:1:-1]
+        return [position for position, bit in enumerate(bits) if bit == "1"]
+
+
 def normalize_tags(tags: Iterable[str]) -> Iterable[str]:
     """Performance optimization to normalize tags only once."""
     if isinstance(tags, NormalizedTags):
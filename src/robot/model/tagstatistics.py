@@ -18,7 +18,7 @@ import re
 from robot.utils import NormalizedDict
 
 from .stats import CombinedTagStat, TagStat
-from .tags import TagPatterns
+from .tags import TagIndex, TagPatterns
 
 
 class TagStatistics:
@@ -49,18 +49,36 @@ class TagStatisticsBuilder:
         self._excluded = TagPatterns(excluded, "selecting tag statistics to exclude")
         self._reserved = TagPatterns("robot:*")
         self._info = TagStatInfo(docs, links)
-        self.stats = TagStatistics(self._info.get_combined_stats(combined))
+        self._stats = TagStatistics(self._info.get_combined_stats(combined))
+        self._included_tags = {}
+        self._pending = []
+
+    @property
+    def stats(self):
+        if self._pending:
+            self._add_to_combined_statistics(self._pending)
+            self._pending = []
+        return self._stats
 
     def add_test(self, test):
         self._add_tags_to_statistics(test)
-        self._add_to_combined_statistics(test)
+        if self._stats.combined:
+            self._pending.append(test)
 
     def _add_tags_to_statistics(self, test):
+        stats = self._stats.tags
         for tag in test.tags:
-            if self._is_included(tag) and not self._suppress_reserved(tag):
-                if tag not in self.stats.tags:
-                    self.stats.tags[tag] = self._info.get_stat(tag)
-                self.stats.tags[tag].add_test(test)
+            if self._include(tag):
+                if tag not in stats:
+                    stats[tag] = self._info.get_stat(tag)
+                stats[tag].add_test(test)
+
+    def _include(self, tag):
+        if tag not in self._included_tags:
+            self._included_tags[tag] = (
+                self._is_included(tag) and not self._suppress_reserved(tag)
+            )
+        return self._included_tags[tag]
 
     def _is_included(self, tag):
         if self._included and tag not in self._included:
@@ -70,10 +88,12 @@ class TagStatisticsBuilder:
     def _suppress_reserved(self, tag):
         return tag in self._reserved and tag not in self._included
 
-    def _add_to_combined_statistics(self, test):
-        for stat in self.stats.combined:
-            if stat.match(test.tags):
-                stat.add_test(test)
+    def _add_to_combined_statistics(self, tests):
+        # Combined patterns are matched against all tests at once.
+        index = TagIndex(test.tags for test in tests)
+        for stat in self._stats.combined:
+            for position in index.items(stat.pattern.select(index)):
+                stat.add_test(tests[position])
 
 
 class TagStatInfo:
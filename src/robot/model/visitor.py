@@ -60,6 +60,11 @@ Visitors extending the :class:`SuiteVisitor` can stop visiting at a certain
 level either by overriding suitable :meth:`visit_x` method or by returning
 an explicit ``False`` from any :meth:`start_x` method.
 
+Multiple visitors can be run in one traversal by wrapping them into
+a :class:`CompositeVisitor`. That avoids walking through large suite
+structures multiple times. :class:`CompositeVisitor` is new in Robot
+Framework 7.5.
+
 Examples
 --------
 
@@ -615,3 +620,167 @@ class SuiteVisitor:
         Default implementation does nothing.
         """
         pass
+
+
+class CompositeVisitor(SuiteVisitor):
+    """Runs multiple :class:`SuiteVisitor` instances in one traversal.
+
+    Visiting a suite with this visitor is equivalent to visiting it with each
+    of the given visitors separately, but the suite structure is traversed
+    only once. For each visited item, :meth:`start_x` methods of the visitors
+    are called in the order the visitors are given, then child items are
+    visited, and finally :meth:`end_x` methods are called in the same order.
+    Returning an explicit ``False`` from a :meth:`start_x` method stops
+    visiting child items only for that particular visitor.
+
+    If a visitor overrides a :meth:`visit_x` method, that method is called
+    instead and it is responsible for visiting the child items as usual.
+
+    Visitors can modify the items they visit, but they should be independent
+    of each others: a change made by one visitor in :meth:`end_x` is not
+    seen by another visitor in :meth:`start_x` of the same item.
+
+    New in Robot Framework 7.5.
+    """
+
+    _item_types = (
+        "suite", "test", "keyword", "for", "for_iteration", "if", "if_branch",
+        "try", "try_branch", "while", "while_iteration", "group", "var", "return",
+        "continue", "break", "error", "message",
+    )  # fmt: skip
+    _method_names_cache: "dict[type, dict[str, tuple[str | None, ...]]]" = {}
+
+    def __init__(self, *visitors: SuiteVisitor):
+        self.visitors = visitors
+        self._active = [self._get_methods(v) for v in visitors]
+
+    def _get_methods(self, visitor: SuiteVisitor) -> dict:
+        return {
+            item_type: tuple(name and getattr(visitor, name) for name in names)
+            for item_type, names in self._get_method_names(type(visitor)).items()
+        }
+
+    @classmethod
+    def _get_method_names(cls, visitor_cls: type) -> dict:
+        # Methods that are not overridden are omitted to avoid calling them.
+        if visitor_cls not in cls._method_names_cache:
+            names = {}
+            for item_type in cls._item_types:
+                generic = item_type not in ("suite", "test")
+                names[item_type] = (
+                    cls._overridden(visitor_cls, f"visit_{item_type}"),
+                    cls._overridden(visitor_cls, f"start_{item_type}", generic),
+                    cls._overridden(visitor_cls, f"end_{item_type}", generic),
+                )
+            cls._method_names_cache[visitor_cls] = names
+        return cls._method_names_cache[visitor_cls]
+
+    @staticmethod
+    def _overridden(cls: type, name: str, generic: bool = False) -> "str | None":
+        # `start/end_body_item` are called by default by `start/end_x` methods.
+        methods = [name]
+        if generic:
+            methods.append(name.split("_")[0] + "_body_item")
+        for method in methods:
+            if getattr(cls, method) is not getattr(SuiteVisitor, method):
+                return name
+        return None
+
+    def _visit(self, item_type: str, item, visit_children=None):
+        active = self._active
+        started = []
+        for methods in active:
+            visit, start, end = methods[item_type]
+            if visit:
+                visit(item)
+            elif not start or start(item) is not False:
+                started.append(methods)
+        if not started:
+            return
+        if visit_children:
+            self._active = started
+            try:
+                visit_children(item)
+            finally:
+                self._active = active
+        for methods in started:
+            end = methods[item_type][2]
+            if end:
+                end(item)
+
+    def _visit_suite_children(self, suite: "TestSuite"):
+        if suite.has_setup:
+            suite.setup.visit(self)
+        suite.suites.visit(self)
+        suite.tests.visit(self)
+        if suite.has_teardown:
+            suite.teardown.visit(self)
+
+    def _visit_test_children(self, test: "TestCase"):
+        if test.has_setup:
+            test.setup.visit(self)
+        test.body.visit(self)
+        if test.has_teardown:
+            test.teardown.visit(self)
+
+    def _visit_keyword_children(self, keyword: "Keyword"):
+        self._possible_setup(keyword)
+        self._possible_body(keyword)
+        self._possible_teardown(keyword)
+
+    def _visit_body(self, item: "BodyItem"):
+        item.body.visit(self)  # type: ignore
+
+    def visit_suite(self, suite: "TestSuite"):
+        self._visit("suite", suite, self._visit_suite_children)
+
+    def visit_test(self, test: "TestCase"):
+        self._visit("test", test, self._visit_test_children)
+
+    def visit_keyword(self, keyword: "Keyword"):
+        self._visit("keyword", keyword, self._visit_keyword_children)
+
+    def visit_for(self, for_: "For"):
+        self._visit("for", for_, self._visit_body)
+
+    def visit_for_iteration(self, iteration: "ForIteration"):
+        self._visit("for_iteration", iteration, self._visit_body)
+
+    def visit_if(self, if_: "If"):
+        self._visit("if", if_, self._visit_body)
+
+    def visit_if_branch(self, branch: "IfBranch"):
+        self._visit("if_branch", branch, self._visit_body)
+
+    def visit_try(self, try_: "Try"):
+        self._visit("try", try_, self._visit_body)
+
+    def visit_try_branch(self, branch: "TryBranch"):
+        self._visit("try_branch", branch, self._visit_body)
+
+    def visit_while(self, while_: "While"):
+        self._visit("while", while_, self._visit_body)
+
+    def visit_while_iteration(self, iteration: "WhileIteration"):
+        self._visit("while_iteration", iteration, self._visit_body)
+
+    def visit_group(self, group: "Group"):
+        self._visit("group", group, self._visit_body)
+
+    def visit_var(self, var: "Var"):
+        self._visit("var", var, self._possible_body)
+
+    def visit_return(self, return_: "Return"):
+        self._visit("return", return_, self._possible_body)
+
+    def visit_continue(self, continue_: "Continue"):
+        self._visit("continue", continue_, self._possible_body)
+
+    def visit_break(self, break_: "Break"):
+        self._visit("break", break_, self._possible_body)
+
+    def visit_error(self, error: "Error"):
+        self._visit("error", error, self._possible_body)
+
+    def visit_message(self, message: "Message"):
+        self._visit("message", message)
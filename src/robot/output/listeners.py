@@ -17,11 +17,14 @@ import os.path
 from abc import ABC
 from collections.abc import Sequence
 from pathlib import Path
+from queue import Full, Queue
+from threading import Thread
 
 from robot.errors import DataError
 from robot.model import BodyItem
 from robot.utils import (
-    get_error_details, Importer, safe_str, split_args_from_name_or_path, type_name
+    get_error_details, Importer, plural_or_not as s, safe_str,
+    split_args_from_name_or_path, type_name
 )
 
 from .logger import LOGGER
@@ -77,7 +80,9 @@ class LibraryListeners(Listeners):
 
     @property
     def listeners(self):
-        return self._listeners[-1] if self._listeners else []
+        # Return the same empty object every time to let the logger notice
+        # that listeners have not changed.
+        return self._listeners[-1] if self._listeners else ()
 
     def new_suite_scope(self):
         self._listeners.append([])
@@ -87,7 +92,9 @@ class LibraryListeners(Listeners):
 
     def register(self, library):
         listeners = self._import_listeners(library.listeners, library=library)
-        self._listeners[-1].extend(listeners)
+        # Replace the list instead of extending it to let the logger notice
+        # that listeners have changed.
+        self._listeners[-1] = self._listeners[-1] + listeners
 
     def unregister(self, library, close=False):
         remaining = []
@@ -107,6 +114,8 @@ class ListenerFacade(LoggerApi, ABC):
         self._is_logged = log_level.is_logged
         self.library = library
         self.priority = self._get_priority(listener)
+        self.background = self._get_background(listener, library)
+        self._worker = None
 
     def _get_priority(self, listener):
         priority = getattr(listener, "ROBOT_LISTENER_PRIORITY", 0)
@@ -120,6 +129,23 @@ class ListenerFacade(LoggerApi, ABC):
         except (ValueError, TypeError):
             raise DataError(f"Invalid listener priority '{priority}'.")
 
+    def _get_background(self, listener, library):
+        background = getattr(listener, "ROBOT_LISTENER_BACKGROUND", None)
+        if not background:
+            return None
+        if background is True:
+            background = "BLOCK"
+        elif isinstance(background, str):
+            background = background.upper()
+        if background not in ("BLOCK", "DROP"):
+            raise DataError(
+                f"Invalid listener background mode '{background}'. "
+                f"Valid values are 'BLOCK' and 'DROP'."
+            )
+        if library is not None:
+            raise DataError("Library listeners cannot be run in background.")
+        return background
+
     @classmethod
     def create(
         cls,
@@ -165,10 +191,20 @@ class ListenerFacade(LoggerApi, ABC):
             raise DataError(f"Unsupported API version '{version}'.")
         return version
 
+    def implements(self, event: str) -> bool:
+        """Return ``True`` if the listener has a method for the given event.
+
+        Used by the logger to build dispatch tables so that listeners are not
+        called at all with events they are not interested in.
+        """
+        raise NotImplementedError
+
     def _get_method(self, name, fallback=None):
         for method_name in self._get_method_names(name):
             method = getattr(self.listener, method_name, None)
             if method:
+                if self._worker:
+                    return QueuedListenerMethod(method, self._worker)
                 return ListenerMethod(method, self.name)
         return fallback or ListenerMethod(None, self.name)
 
@@ -187,6 +223,13 @@ class ListenerV3Facade(ListenerFacade):
 
     def __init__(self, listener, name, log_level, library=None):
         super().__init__(listener, name, log_level, library)
+        if self.background:
+            # Model objects are passed as-is and they would be modified while
+            # the listener is processing them.
+            raise DataError(
+                "Only listeners using the listener API version 2 can be run "
+                "in background."
+            )
         get = self._get_method
         # Suite
         self.start_suite = get("start_suite")
@@ -201,30 +244,14 @@ class ListenerV3Facade(ListenerFacade):
         start_keyword = get("start_keyword", start_body_item)
         end_keyword = get("end_keyword", end_body_item)
         # Keywords
-        self.start_user_keyword = get(
-            "start_user_keyword",
-            lambda data, implementation, result: start_keyword(data, result),
-        )
-        self.end_user_keyword = get(
-            "end_user_keyword",
-            lambda data, implementation, result: end_keyword(data, result),
-        )
-        self.start_library_keyword = get(
-            "start_library_keyword",
-            lambda data, implementation, result: start_keyword(data, result),
-        )
-        self.end_library_keyword = get(
-            "end_library_keyword",
-            lambda data, implementation, result: end_keyword(data, result),
-        )
-        self.start_invalid_keyword = get(
-            "start_invalid_keyword",
-            lambda data, implementation, result: start_keyword(data, result),
-        )
-        self.end_invalid_keyword = get(
-            "end_invalid_keyword",
-            lambda data, implementation, result: end_keyword(data, result),
-        )
+        start_keyword = self._keyword_fallback(start_keyword)
+        end_keyword = self._keyword_fallback(end_keyword)
+        self.start_user_keyword = get("start_user_keyword", start_keyword)
+        self.end_user_keyword = get("end_user_keyword", end_keyword)
+        self.start_library_keyword = get("start_library_keyword", start_keyword)
+        self.end_library_keyword = get("end_library_keyword", end_keyword)
+        self.start_invalid_keyword = get("start_invalid_keyword", start_keyword)
+        self.end_invalid_keyword = get("end_invalid_keyword", end_keyword)
         # IF
         self.start_if = get("start_if", start_body_item)
         self.end_if = get("end_if", end_body_item)
@@ -274,36 +301,76 @@ class ListenerV3Facade(ListenerFacade):
         result_file = get("result_file")
         self.output_file = get(
             "output_file",
-            lambda path: result_file("OUTPUT", path) if path is not None else None,
+            self._file_fallback(result_file, "OUTPUT"),
         )
         self.report_file = get(
             "report_file",
-            lambda path: result_file("REPORT", path),
+            self._file_fallback(result_file, "REPORT"),
         )
         self.log_file = get(
             "log_file",
-            lambda path: result_file("LOG", path),
+            self._file_fallback(result_file, "LOG"),
         )
         self.xunit_file = get(
             "xunit_file",
-            lambda path: result_file("XUNIT", path),
+            self._file_fallback(result_file, "XUNIT"),
         )
         self.debug_file = get(
             "debug_file",
-            lambda path: result_file("DEBUG", path),
+            self._file_fallback(result_file, "DEBUG"),
         )
         # Close
         self.close = get("close")
 
+    def _keyword_fallback(self, method):
+        if not method:
+            return None
+        return lambda data, implementation, result: method(data, result)
+
+    def _file_fallback(self, result_file, kind):
+        if not result_file:
+            return None
+        return lambda path: result_file(kind, path) if path is not None else None
+
+    def implements(self, event):
+        if event == "log_message":
+            return bool(self._log_message)
+        # Events without a method set in `__init__` use no-op defaults.
+        return bool(vars(self).get(event))
+
     def log_message(self, message):
         if self._is_logged(message):
             self._log_message(message)
 
 
 class ListenerV2Facade(ListenerFacade):
+    # Body items reported using `start/end_keyword`. Other body items, such as
+    # IF and TRY roots, are not reported to listeners using this API version.
+    _body_items = frozenset(
+        {
+            "keyword",
+            "user_keyword",
+            "library_keyword",
+            "invalid_keyword",
+            "for",
+            "for_iteration",
+            "while",
+            "while_iteration",
+            "group",
+            "if_branch",
+            "try_branch",
+            "var",
+            "break",
+            "continue",
+            "return",
+            "error",
+        }
+    )
 
     def __init__(self, listener, name, log_level, library=None):
         super().__init__(listener, name, log_level, library)
+        if self.background:
+            self._worker = ListenerWorker(name, drop=self.background == "DROP")
         get = self._get_method
         # Suite
         self._start_suite = get("start_suite")
@@ -330,6 +397,12 @@ class ListenerV2Facade(ListenerFacade):
         # Close
         self._close = get("close")
 
+    def implements(self, event):
+        kind, _, item = event.partition("_")
+        if kind in ("start", "end") and item in self._body_items:
+            return bool(self._start_kw if kind == "start" else self._end_kw)
+        return bool(getattr(self, "_" + event, None))
+
     def start_suite(self, data, result):
         self._start_suite(result.name, self._suite_attrs(data, result))
 
@@ -623,7 +696,11 @@ class ListenerV2Facade(ListenerFacade):
         }
 
     def close(self):
-        self._close()
+        if self._worker:
+            # Calling `close` must not be dropped even if the queue is full.
+            self._worker.close(self._close.method)
+        else:
+            self._close()
 
 
 class ListenerMethod:
@@ -637,12 +714,89 @@ class ListenerMethod:
             if self.method is not None:
                 self.method(*args)
         except Exception:
-            message, details = get_error_details()
-            LOGGER.error(
-                f"Calling method '{self.method.__name__}' of listener "
-                f"'{self.listener_name}' failed: {message}"
-            )
-            LOGGER.info(f"Details:\n{details}")
+            self.report_error(self.method, self.listener_name, *get_error_details())
+
+    @staticmethod
+    def report_error(method, listener_name, message, details):
+        LOGGER.error(
+            f"Calling method '{method.__name__}' of listener "
+            f"'{listener_name}' failed: {message}"
+        )
+        LOGGER.info(f"Details:\n{details}")
 
     def __bool__(self):
         return self.method is not None
+
+
+class QueuedListenerMethod(ListenerMethod):
+    """Listener method that is called in background by a `ListenerWorker`."""
+
+    def __init__(self, method, worker: "ListenerWorker"):
+        super().__init__(method, worker.name)
+        self.worker = worker
+
+    def __call__(self, *args):
+        self.worker.put(self.method, args)
+
+
+class ListenerWorker:
+    """Calls listener methods in a separate thread.
+
+    Calls are passed to the thread via a bounded queue. If the queue is full,
+    new calls either block until there is space in the queue or, if ``drop``
+    is true, are dropped. Errors occurring in the thread are reported in the
+    main thread when the next call is queued and when the worker is closed.
+    The ``close`` method waits until all queued calls have been processed and
+    optionally calls the given method as the last call.
+    """
+
+    queue_size = 1000
+
+    def __init__(self, name, drop=False):
+        self.name = name
+        self.drop = drop
+        self.dropped = 0
+        self._errors = []
+        self._queue = Queue(self.queue_size)
+        self._thread = Thread(target=self._run, name=f"Listener {name}", daemon=True)
+        self._thread.start()
+
+    def put(self, method, args):
+        self._report_errors()
+        if not self.drop:
+            self._queue.put((method, args))
+            return
+        try:
+            self._queue.put_nowait((method, args))
+        except Full:
+            self.dropped += 1
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            method, args = item
+            try:
+                method(*args)
+            except Exception:
+                self._errors.append((method, *get_error_details()))
+
+    def _report_errors(self):
+        while self._errors:
+            method, message, details = self._errors.pop(0)
+            ListenerMethod.report_error(method, self.name, message, details)
+
+    def close(self, method=None):
+        if not self._thread.is_alive():
+            return
+        if method:
+            self._queue.put((method, ()))
+        self._queue.put(None)
+        self._thread.join()
+        self._report_errors()
+        if self.dropped:
+            LOGGER.warn(
+                f"Listener '{self.name}' dropped {self.dropped} event{s(self.dropped)} "
+                f"because its queue was full."
+            )
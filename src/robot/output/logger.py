@@ -65,6 +65,8 @@ class Logger(AbstractLogger):
         self._error_listener = None
         self._enabled = 0
         self._cache_only = False
+        self._dispatch_table = {}
+        self._dispatch_lib_listeners = None
 
     @property
     def _console(self):
@@ -94,6 +96,35 @@ class Logger(AbstractLogger):
     def __iter__(self):
         return iter(self.end_loggers)
 
+    def _dispatch(self, event):
+        """Return methods to call with the given event in the correct order.
+
+        Results are cached and the cache is invalidated when loggers or
+        listeners change. Listeners not having a method for the event are
+        excluded altogether to avoid calling them unnecessarily.
+        """
+        lib_listeners = self._lib_listeners.listeners if self._lib_listeners else None
+        if lib_listeners is not self._dispatch_lib_listeners:
+            self._dispatch_table = {}
+            self._dispatch_lib_listeners = lib_listeners
+        if event not in self._dispatch_table:
+            loggers = self.start_loggers if event[:6] == "start_" else self.end_loggers
+            self._dispatch_table[event] = [
+                getattr(logger, event)
+                for logger in loggers
+                if self._implements(logger, event)
+            ]
+        return self._dispatch_table[event]
+
+    def _implements(self, logger, event):
+        # Listener facades know which events they implement. Other loggers
+        # are always called.
+        implements = getattr(logger, "implements", None)
+        return implements(event) if implements else True
+
+    def _loggers_changed(self):
+        self._dispatch_table = {}
+
     def __enter__(self):
         if not self._enabled:
             self.register_syslog()
@@ -116,6 +147,7 @@ class Logger(AbstractLogger):
     ):
         console = ConsoleOutput(console, width, colors, links, markers, stdout, stderr)
         self.__console = console
+        self._loggers_changed()
         self._relay_cached_messages(console)
 
     def _relay_cached_messages(self, logger):
@@ -126,6 +158,7 @@ class Logger(AbstractLogger):
     def unregister_console_logger(self):
         self.__console = None
         self._auto_register_console_logger = False
+        self._loggers_changed()
 
     def register_syslog(self, path=None, level="INFO"):
         if not path:
@@ -139,17 +172,21 @@ class Logger(AbstractLogger):
             self.error(f"Opening syslog file '{path}' failed: {err}")
         else:
             self._relay_cached_messages(self._syslog)
+            self._loggers_changed()
 
     def register_output_file(self, logger):
         self._relay_cached_messages(logger)
         self._output_file = logger
+        self._loggers_changed()
 
     def unregister_output_file(self):
         self._output_file = None
+        self._loggers_changed()
 
     def register_listeners(self, listeners, library_listeners):
         self._cli_listeners = listeners
         self._lib_listeners = library_listeners
+        self._loggers_changed()
         for listener in listeners or ():
             self._relay_cached_messages(listener)
 
@@ -157,10 +194,12 @@ class Logger(AbstractLogger):
         for logger in loggers:
             self._relay_cached_messages(logger)
             self._other_loggers.append(logger)
+        self._loggers_changed()
 
     def unregister_logger(self, *loggers):
         for logger in loggers:
             self._other_loggers = [lo for lo in self._other_loggers if lo is not logger]
+        self._loggers_changed()
 
     def disable_message_cache(self):
         self._message_cache = None
@@ -173,8 +212,8 @@ class Logger(AbstractLogger):
     def message(self, msg):
         """Messages about what the framework is doing, warnings, errors, ..."""
         if not self._cache_only:
-            for logger in self:
-                logger.message(msg)
+            for method in self._dispatch("message"):
+                method(msg)
         if self._message_cache is not None:
             self._message_cache.append(msg)
         if msg.level == "ERROR":
@@ -196,8 +235,8 @@ class Logger(AbstractLogger):
         logged = False
         # Common case. We can log normally.
         if self._log_message_parents and not self._library_import_logging:
-            for logger in self:
-                logger.log_message(msg)
+            for method in self._dispatch("log_message"):
+                method(msg)
             if self._output_file and self._output_file.is_logged(msg):
                 self._log_message_parents[-1].body.append(msg)
             logged = True
@@ -223,202 +262,202 @@ class Logger(AbstractLogger):
         self._library_import_logging -= 1
 
     def start_suite(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_suite(data, result)
+        for method in self._dispatch("start_suite"):
+            method(data, result)
 
     def end_suite(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_suite(data, result)
+        for method in self._dispatch("end_suite"):
+            method(data, result)
 
     def start_test(self, data, result):
         self._log_message_parents.append(result)
-        for logger in self.start_loggers:
-            logger.start_test(data, result)
+        for method in self._dispatch("start_test"):
+            method(data, result)
 
     def end_test(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_test(data, result)
+        for method in self._dispatch("end_test"):
+            method(data, result)
         self._log_message_parents.pop()
 
     @start_body_item
     def start_keyword(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_keyword(data, result)
+        for method in self._dispatch("start_keyword"):
+            method(data, result)
 
     @end_body_item
     def end_keyword(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_keyword(data, result)
+        for method in self._dispatch("end_keyword"):
+            method(data, result)
 
     @start_body_item
     def start_user_keyword(self, data, implementation, result):
-        for logger in self.start_loggers:
-            logger.start_user_keyword(data, implementation, result)
+        for method in self._dispatch("start_user_keyword"):
+            method(data, implementation, result)
 
     @end_body_item
     def end_user_keyword(self, data, implementation, result):
-        for logger in self.end_loggers:
-            logger.end_user_keyword(data, implementation, result)
+        for method in self._dispatch("end_user_keyword"):
+            method(data, implementation, result)
 
     @start_body_item
     def start_library_keyword(self, data, implementation, result):
-        for logger in self.start_loggers:
-            logger.start_library_keyword(data, implementation, result)
+        for method in self._dispatch("start_library_keyword"):
+            method(data, implementation, result)
 
     @end_body_item
     def end_library_keyword(self, data, implementation, result):
-        for logger in self.end_loggers:
-            logger.end_library_keyword(data, implementation, result)
+        for method in self._dispatch("end_library_keyword"):
+            method(data, implementation, result)
 
     @start_body_item
     def start_invalid_keyword(self, data, implementation, result):
-        for logger in self.start_loggers:
-            logger.start_invalid_keyword(data, implementation, result)
+        for method in self._dispatch("start_invalid_keyword"):
+            method(data, implementation, result)
 
     @end_body_item
     def end_invalid_keyword(self, data, implementation, result):
-        for logger in self.end_loggers:
-            logger.end_invalid_keyword(data, implementation, result)
+        for method in self._dispatch("end_invalid_keyword"):
+            method(data, implementation, result)
 
     @start_body_item
     def start_for(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_for(data, result)
+        for method in self._dispatch("start_for"):
+            method(data, result)
 
     @end_body_item
     def end_for(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_for(data, result)
+        for method in self._dispatch("end_for"):
+            method(data, result)
 
     @start_body_item
     def start_for_iteration(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_for_iteration(data, result)
+        for method in self._dispatch("start_for_iteration"):
+            method(data, result)
 
     @end_body_item
     def end_for_iteration(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_for_iteration(data, result)
+        for method in self._dispatch("end_for_iteration"):
+            method(data, result)
 
     @start_body_item
     def start_while(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_while(data, result)
+        for method in self._dispatch("start_while"):
+            method(data, result)
 
     @end_body_item
     def end_while(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_while(data, result)
+        for method in self._dispatch("end_while"):
+            method(data, result)
 
     @start_body_item
     def start_while_iteration(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_while_iteration(data, result)
+        for method in self._dispatch("start_while_iteration"):
+            method(data, result)
 
     @end_body_item
     def end_while_iteration(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_while_iteration(data, result)
+        for method in self._dispatch("end_while_iteration"):
+            method(data, result)
 
     @start_body_item
     def start_group(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_group(data, result)
+        for method in self._dispatch("start_group"):
+            method(data, result)
 
     @end_body_item
     def end_group(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_group(data, result)
+        for method in self._dispatch("end_group"):
+            method(data, result)
 
     @start_body_item
     def start_if(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_if(data, result)
+        for method in self._dispatch("start_if"):
+            method(data, result)
 
     @end_body_item
     def end_if(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_if(data, result)
+        for method in self._dispatch("end_if"):
+            method(data, result)
 
     @start_body_item
     def start_if_branch(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_if_branch(data, result)
+        for method in self._dispatch("start_if_branch"):
+            method(data, result)
 
     @end_body_item
     def end_if_branch(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_if_branch(data, result)
+        for method in self._dispatch("end_if_branch"):
+            method(data, result)
 
     @start_body_item
     def start_try(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_try(data, result)
+        for method in self._dispatch("start_try"):
+            method(data, result)
 
     @end_body_item
     def end_try(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_try(data, result)
+        for method in self._dispatch("end_try"):
+            method(data, result)
 
     @start_body_item
     def start_try_branch(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_try_branch(data, result)
+        for method in self._dispatch("start_try_branch"):
+            method(data, result)
 
     @end_body_item
     def end_try_branch(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_try_branch(data, result)
+        for method in self._dispatch("end_try_branch"):
+            method(data, result)
 
     @start_body_item
     def start_var(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_var(data, result)
+        for method in self._dispatch("start_var"):
+            method(data, result)
 
     @end_body_item
     def end_var(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_var(data, result)
+        for method in self._dispatch("end_var"):
+            method(data, result)
 
     @start_body_item
     def start_break(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_break(data, result)
+        for method in self._dispatch("start_break"):
+            method(data, result)
 
     @end_body_item
     def end_break(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_break(data, result)
+        for method in self._dispatch("end_break"):
+            method(data, result)
 
     @start_body_item
     def start_continue(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_continue(data, result)
+        for method in self._dispatch("start_continue"):
+            method(data, result)
 
     @end_body_item
     def end_continue(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_continue(data, result)
+        for method in self._dispatch("end_continue"):
+            method(data, result)
 
     @start_body_item
     def start_return(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_return(data, result)
+        for method in self._dispatch("start_return"):
+            method(data, result)
 
     @end_body_item
     def end_return(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_return(data, result)
+        for method in self._dispatch("end_return"):
+            method(data, result)
 
     @start_body_item
     def start_error(self, data, result):
-        for logger in self.start_loggers:
-            logger.start_error(data, result)
+        for method in self._dispatch("start_error"):
+            method(data, result)
 
     @end_body_item
     def end_error(self, data, result):
-        for logger in self.end_loggers:
-            logger.end_error(data, result)
+        for method in self._dispatch("end_error"):
+            method(data, result)
 
     def library_import(self, library, importer):
         for logger in self:
@@ -461,5 +500,16 @@ class Logger(AbstractLogger):
             logger.close()
         self.__init__(register_console_logger=False)
 
+    def restart(self):
+        """Closes all loggers but keeps the logger itself enabled.
+
+        Used when tests are executed multiple times in the same process.
+        """
+        enabled = self._enabled
+        self.close()
+        if enabled:
+            self.register_syslog()
+        self._enabled = enabled
+
 
 LOGGER = Logger()
@@ -21,6 +21,7 @@ from .loggerapi import LoggerApi
 from .loggerhelper import AbstractLogger
 from .loglevel import LogLevel
 from .outputfile import OutputFile
+from .resultdb import ResultDatabase
 
 
 class Output(AbstractLogger, LoggerApi):
@@ -35,18 +36,23 @@ class Output(AbstractLogger, LoggerApi):
         )
         self.listeners = Listeners(settings.listeners, self.log_level)
         self.library_listeners = LibraryListeners(self.log_level)
-        self._register_loggers(DebugFile(settings.debug_file))
+        self._register_loggers(
+            DebugFile(settings.debug_file),
+            ResultDatabase(settings.result_db, settings.result_db_keywords),
+        )
         self._settings = settings
 
     @property
     def initial_log_level(self):
         return self._settings.log_level
 
-    def _register_loggers(self, debug_file):
+    def _register_loggers(self, debug_file, result_db):
         LOGGER.register_output_file(self.output_file)
         LOGGER.register_listeners(self.listeners or None, self.library_listeners)
         if debug_file:
             LOGGER.register_logger(debug_file)
+        if result_db:
+            LOGGER.register_logger(result_db)
 
     def register_error_listener(self, listener):
         LOGGER.register_error_listener(listener)
@@ -0,0 +1,291 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""SQLite result database written incrementally during execution.
+
+Each execution adds one row to the ``runs`` table and rows identified by
+the run id and the model item id (e.g. ``s1-s2-t3``) to the ``suites``,
+``tests``, ``tags`` and, optionally, ``keywords`` tables. Rows are written
+in batches so that results are queryable already while execution is
+in progress.
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.version import get_full_version
+
+from .logger import LOGGER
+from .loggerapi import LoggerApi
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    status TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    elapsed REAL,
+    rpa INTEGER,
+    generator TEXT
+);
+CREATE TABLE IF NOT EXISTS suites (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    id TEXT NOT NULL,
+    name TEXT,
+    full_name TEXT,
+    source TEXT,
+    status TEXT,
+    message TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    elapsed REAL,
+    PRIMARY KEY (run_id, id)
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    id TEXT NOT NULL,
+    suite_id TEXT NOT NULL,
+    name TEXT,
+    full_name TEXT,
+    status TEXT,
+    message TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    elapsed REAL,
+    PRIMARY KEY (run_id, id)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_id TEXT NOT NULL,
+    tag TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    id TEXT NOT NULL,
+    parent_id TEXT,
+    test_id TEXT,
+    type TEXT,
+    name TEXT,
+    status TEXT,
+    message TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    elapsed REAL
+);
+CREATE INDEX IF NOT EXISTS tests_status ON tests (status, run_id);
+CREATE INDEX IF NOT EXISTS tests_full_name ON tests (full_name, run_id);
+CREATE INDEX IF NOT EXISTS tags_tag ON tags (tag COLLATE NOCASE, run_id);
+CREATE INDEX IF NOT EXISTS tags_test ON tags (run_id, test_id);
+CREATE INDEX IF NOT EXISTS keywords_test ON keywords (run_id, test_id);
+CREATE INDEX IF NOT EXISTS keywords_status ON keywords (status, run_id);
+"""
+
+
+def ResultDatabase(path, keywords=False, batch_size=1000):
+    if not path:
+        return None
+    try:
+        writer = ResultDatabaseWriter(path, keywords, batch_size)
+    except DataError as err:
+        LOGGER.error(err.message)
+        return None
+    LOGGER.info(f"Result database: {path}")
+    return writer
+
+
+class ResultDatabaseWriter(LoggerApi):
+    _inserts = {
+        "suites": "INSERT OR REPLACE INTO suites VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        "tests": "INSERT OR REPLACE INTO tests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        "tags": "INSERT INTO tags VALUES (?, ?, ?)",
+        "keywords": "INSERT INTO keywords VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    }
+
+    def __init__(self, path, keywords=False, batch_size=1000):
+        self.path = Path(path)
+        self.keywords = keywords
+        self.batch_size = max(batch_size, 1)
+        self._connection = self._connect(self.path)
+        self._rows = {table: [] for table in self._inserts}
+        self._pending = 0
+        self._run_id = None
+        self._suite_level = 0
+        self._test_id = None
+
+    def _connect(self, path):
+        try:
+            import sqlite3
+        except ImportError:
+            raise DataError(
+                f"Opening result database '{path}' failed: "
+                f"Python installation does not support SQLite."
+            )
+        self._error = sqlite3.Error
+        try:
+            connection = sqlite3.connect(path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+        except sqlite3.Error as err:
+            raise DataError(f"Opening result database '{path}' failed: {err}")
+        return connection
+
+    @property
+    def run_id(self):
+        return self._run_id
+
+    def start_suite(self, data, result):
+        if not self._suite_level:
+            self._start_run(result)
+        self._suite_level += 1
+
+    def _start_run(self, suite):
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "INSERT INTO runs (name, start_time, rpa, generator) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    suite.name,
+                    self._time(suite.start_time),
+                    int(bool(suite.rpa)),
+                    f"Robot {get_full_version()}",
+                ),
+            )
+            self._run_id = cursor.lastrowid
+
+    def end_suite(self, data, result):
+        self._suite_level -= 1
+        self._add(
+            "suites",
+            result.id,
+            result.name,
+            result.full_name,
+            str(result.source) if result.source else None,
+            result.status,
+            result.message,
+            self._time(result.start_time),
+            self._time(result.end_time),
+            result.elapsed_time.total_seconds(),
+        )
+        if not self._suite_level:
+            self._end_run(result)
+        else:
+            self._flush()
+
+    def _end_run(self, suite):
+        self._flush()
+        if not self._connection:
+            return
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE runs SET status = ?, end_time = ?, elapsed = ? WHERE id = ?",
+                (
+                    suite.status,
+                    self._time(suite.end_time),
+                    suite.elapsed_time.total_seconds(),
+                    self._run_id,
+                ),
+            )
+        self.close()
+
+    def start_test(self, data, result):
+        self._test_id = result.id
+
+    def end_test(self, data, result):
+        self._add(
+            "tests",
+            result.id,
+            result.parent.id,
+            result.name,
+            result.full_name,
+            result.status,
+            result.message,
+            self._time(result.start_time),
+            self._time(result.end_time),
+            result.elapsed_time.total_seconds(),
+        )
+        for tag in result.tags:
+            self._add("tags", result.id, tag)
+        self._test_id = None
+
+    def end_keyword(self, data, result):
+        if self.keywords:
+            self._add_body_item(result, result.full_name)
+
+    def end_body_item(self, data, result):
+        if self.keywords:
+            self._add_body_item(result, result._log_name)
+
+    def _add_body_item(self, item, name):
+        # IF/ELSE and TRY/EXCEPT roots do not have ids. They are not written
+        # and their branches get the closest ancestor having an id as a parent.
+        if item.id is None:
+            return
+        parent = item.parent
+        while parent is not None and parent.id is None:
+            parent = parent.parent
+        self._add(
+            "keywords",
+            item.id,
+            parent.id if parent else None,
+            self._test_id,
+            item.type,
+            name,
+            item.status,
+            getattr(item, "message", ""),
+            self._time(item.start_time),
+            self._time(item.end_time),
+            item.elapsed_time.total_seconds(),
+        )
+
+    def _add(self, table, *values):
+        if not self._connection:
+            return
+        self._rows[table].append((self._run_id, *values))
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending or not self._connection:
+            return
+        with self._transaction() as connection:
+            for table, rows in self._rows.items():
+                if rows:
+                    connection.executemany(self._inserts[table], rows)
+                    rows.clear()
+        self._pending = 0
+
+    @contextmanager
+    def _transaction(self):
+        try:
+            with self._connection:
+                yield self._connection
+        except self._error as err:
+            LOGGER.error(f"Writing result database '{self.path}' failed: {err}")
+            self._connection.close()
+            self._connection = None
+
+    def _time(self, timestamp):
+        return timestamp.isoformat() if timestamp else None
+
+    def close(self):
+        if self._connection:
+            self._flush()
+            if self._connection:
+                self._connection.close()
+                self._connection = None
@@ -28,6 +28,7 @@ from .lexer import (
     Token as Token,
 )
 from .model import (
+    CompositeVisitor as CompositeVisitor,
     File as File,
     ModelTransformer as ModelTransformer,
     ModelVisitor as ModelVisitor,
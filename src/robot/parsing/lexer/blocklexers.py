@@ -53,13 +53,20 @@ class BlockLexer(Lexer, ABC):
 
     def lexer_for(self, statement: StatementTokens) -> Lexer:
         for cls in self.lexer_classes():
-            lexer = cls(self.ctx)
-            if lexer.handles(statement):
-                return lexer
+            if self._probe(cls).handles(statement):
+                return cls(self.ctx)
         raise TypeError(
             f"{type(self).__name__} does not have lexer for statement {statement}."
         )
 
+    def _probe(self, cls: "type[Lexer]") -> Lexer:
+        # Lexers used only for checking do they handle a statement are cached
+        # to avoid creating a new instance of each candidate for each statement.
+        probes = self.ctx.lexer_probes
+        if cls not in probes:
+            probes[cls] = cls(self.ctx)
+        return probes[cls]
+
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return ()
 
@@ -272,7 +279,7 @@ class NestedBlockLexer(BlockLexer, ABC):
 class ForLexer(NestedBlockLexer):
 
     def handles(self, statement: StatementTokens) -> bool:
-        return ForHeaderLexer(self.ctx).handles(statement)
+        return self._probe(ForHeaderLexer).handles(statement)
 
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return (
@@ -295,7 +302,7 @@ class ForLexer(NestedBlockLexer):
 class WhileLexer(NestedBlockLexer):
 
     def handles(self, statement: StatementTokens) -> bool:
-        return WhileHeaderLexer(self.ctx).handles(statement)
+        return self._probe(WhileHeaderLexer).handles(statement)
 
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return (
@@ -318,7 +325,7 @@ class WhileLexer(NestedBlockLexer):
 class TryLexer(NestedBlockLexer):
 
     def handles(self, statement: StatementTokens) -> bool:
-        return TryHeaderLexer(self.ctx).handles(statement)
+        return self._probe(TryHeaderLexer).handles(statement)
 
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return (
@@ -344,7 +351,7 @@ class TryLexer(NestedBlockLexer):
 class GroupLexer(NestedBlockLexer):
 
     def handles(self, statement: StatementTokens) -> bool:
-        return GroupHeaderLexer(self.ctx).handles(statement)
+        return self._probe(GroupHeaderLexer).handles(statement)
 
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return (
@@ -367,7 +374,7 @@ class GroupLexer(NestedBlockLexer):
 class IfLexer(NestedBlockLexer):
 
     def handles(self, statement: StatementTokens) -> bool:
-        return IfHeaderLexer(self.ctx).handles(statement)
+        return self._probe(IfHeaderLexer).handles(statement)
 
     def lexer_classes(self) -> "tuple[type[Lexer], ...]":
         return (
@@ -394,7 +401,7 @@ class InlineIfLexer(NestedBlockLexer):
     def handles(self, statement: StatementTokens) -> bool:
         if len(statement) <= 2:
             return False
-        return InlineIfHeaderLexer(self.ctx).handles(statement)
+        return self._probe(InlineIfHeaderLexer).handles(statement)
 
     def accepts_more(self, statement: StatementTokens) -> bool:
         return False
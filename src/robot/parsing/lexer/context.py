@@ -28,6 +28,7 @@ class LexingContext:
     def __init__(self, settings: Settings, languages: Languages):
         self.settings = settings
         self.languages = languages
+        self.lexer_probes: "dict[type, object]" = {}
 
     def lex_setting(self, statement: StatementTokens):
         self.settings.lex(statement)
@@ -18,14 +18,14 @@ from itertools import chain
 
 from robot.conf import LanguagesLike
 from robot.errors import DataError
-from robot.utils import FileReader, get_error_message, Source
+from robot.utils import FileReader, get_error_message, normalize, Source
 
 from .blocklexers import FileLexer
 from .context import (
     InitFileContext, LexingContext, ResourceFileContext, SuiteFileContext
 )
 from .tokenizer import Tokenizer
-from .tokens import END, EOS, Token
+from .tokens import END, EOS, StatementTokens, Token
 
 
 def get_tokens(
@@ -33,6 +33,7 @@ def get_tokens(
     data_only: bool = False,
     tokenize_variables: bool = False,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> "Iterator[Token]":
     """Parses the given source to tokens.
 
@@ -52,11 +53,19 @@ def get_tokens(
         an initialized :class:`~robot.conf.languages.Language` subclass,
         a list containing such strings or instances, or a
         :class:`~robot.conf.languages.Languages` instance.
+    :param sections: Names of the sections to include like ``["Settings",
+        "Test Cases"]``. Possible values are ``Settings``, ``Variables``,
+        ``Test Cases``, ``Tasks``, ``Keywords`` and ``Comments``, and they
+        are case, space and underscore insensitive. Lines belonging to other
+        sections are omitted and not lexed at all, which makes parsing faster
+        if only some of the sections are needed. Data before the first section
+        header is always included. By default, all sections are included.
+        New in Robot Framework 7.5.
 
     Returns a generator that yields :class:`~robot.parsing.lexer.tokens.Token`
     instances.
     """
-    lexer = Lexer(SuiteFileContext(lang=lang), data_only, tokenize_variables)
+    lexer = Lexer(SuiteFileContext(lang=lang), data_only, tokenize_variables, sections)
     lexer.input(source)
     return lexer.get_tokens()
 
@@ -66,13 +75,19 @@ def get_resource_tokens(
     data_only: bool = False,
     tokenize_variables: bool = False,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> "Iterator[Token]":
     """Parses the given source to resource file tokens.
 
     Same as :func:`get_tokens` otherwise, but the source is considered to be
     a resource file. This affects, for example, what settings are valid.
     """
-    lexer = Lexer(ResourceFileContext(lang=lang), data_only, tokenize_variables)
+    lexer = Lexer(
+        ResourceFileContext(lang=lang),
+        data_only,
+        tokenize_variables,
+        sections,
+    )
     lexer.input(source)
     return lexer.get_tokens()
 
@@ -82,6 +97,7 @@ def get_init_tokens(
     data_only: bool = False,
     tokenize_variables: bool = False,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> "Iterator[Token]":
     """Parses the given source to init file tokens.
 
@@ -89,36 +105,76 @@ def get_init_tokens(
     a suite initialization file. This affects, for example, what settings are
     valid.
     """
-    lexer = Lexer(InitFileContext(lang=lang), data_only, tokenize_variables)
+    lexer = Lexer(InitFileContext(lang=lang), data_only, tokenize_variables, sections)
     lexer.input(source)
     return lexer.get_tokens()
 
 
 class Lexer:
+    _section_checkers = {
+        "settings": "setting_section",
+        "variables": "variable_section",
+        "testcases": "test_case_section",
+        "tasks": "task_section",
+        "keywords": "keyword_section",
+        "comments": "comment_section",
+    }
 
     def __init__(
         self,
         ctx: LexingContext,
         data_only: bool = False,
         tokenize_variables: bool = False,
+        sections: "Iterable[str] | None" = None,
     ):
         self.lexer = FileLexer(ctx)
         self.data_only = data_only
         self.tokenize_variables = tokenize_variables
+        self.sections = self._validate_sections(sections)
         self.statements: list[list[Token]] = []
 
+    def _validate_sections(self, sections: "Iterable[str] | None") -> "set[str] | None":
+        if sections is None:
+            return None
+        if isinstance(sections, str):
+            sections = [sections]
+        checkers = set()
+        for name in sections:
+            normalized = normalize(name, ignore="_")
+            if normalized not in self._section_checkers:
+                raise ValueError(
+                    f"Invalid section '{name}'. Valid sections: 'Settings', "
+                    f"'Variables', 'Test Cases', 'Tasks', 'Keywords' and 'Comments'."
+                )
+            checkers.add(self._section_checkers[normalized])
+        return checkers
+
     def input(self, source: Source):
+        included = lexed = True
         for statement in Tokenizer().tokenize(self._read(source), self.data_only):
-            # Store all tokens but pass only data tokens to lexer.
-            self.statements.append(statement)
             if self.data_only:
                 data = statement[:]
             else:
                 # Separators, comments, etc. already have type, data doesn't.
                 data = [t for t in statement if t.type is None]
-            if data:
+            if self.sections is not None and data and data[0].value.startswith("*"):
+                included, lexed = self._section_included_and_lexed(data)
+            # Store all tokens but pass only data tokens to lexer.
+            if included:
+                self.statements.append(statement)
+            if data and lexed:
                 self.lexer.input(data)
 
+    def _section_included_and_lexed(
+        self,
+        header: StatementTokens,
+    ) -> "tuple[bool, bool]":
+        ctx = self.lexer.ctx
+        included = any(getattr(ctx, checker)(header) for checker in self.sections)
+        # The setting section affects how other sections are lexed, so it is
+        # always lexed even if it is not included.
+        return included, included or ctx.setting_section(header)
+
     def _read(self, source: Source) -> str:
         try:
             with FileReader(source, accept_text=True) as reader:
@@ -26,8 +26,12 @@ class Tokenizer:
     def tokenize(self, data: str, data_only: bool = False) -> "Iterator[list[Token]]":
         current: list[Token] = []
         for lineno, line in enumerate(data.splitlines(not data_only), start=1):
-            tokens = self._tokenize_line(line, lineno, not data_only)
-            tokens, starts_new = self._cleanup_tokens(tokens, data_only)
+            simple = self._tokenize_simple_line(line, lineno, not data_only)
+            if simple:
+                tokens, starts_new = simple
+            else:
+                tokens = self._tokenize_line(line, lineno, not data_only)
+                tokens, starts_new = self._cleanup_tokens(tokens, data_only)
             if starts_new:
                 if current:
                     yield current
@@ -36,6 +40,39 @@ class Tokenizer:
                 current.extend(tokens)
         yield current
 
+    def _tokenize_simple_line(
+        self,
+        line: str,
+        lineno: int,
+        include_separators: bool,
+    ) -> "tuple[list[Token], bool] | None":
+        # Fast path for the common case that the line is empty or uses space
+        # separated format and contains no comments or continuation. Produces
+        # same tokens as `_tokenize_line` and `_cleanup_tokens` together.
+        # Returns `None` if the line is not simple and the generic code needs
+        # to be used.
+        data = line.rstrip()
+        if not data:
+            if include_separators:
+                return [Token(Token.EOL, line, lineno, 0)], False
+            return [], False
+        if data[0] == "|" or "#" in data or data.lstrip()[:3] == "...":
+            return None
+        tokens = []
+        append = tokens.append
+        offset = 0
+        is_data = True
+        for value in self._space_splitter.split(data):
+            if is_data:
+                append(Token(None, value, lineno, offset))
+            elif include_separators:
+                append(Token(Token.SEPARATOR, value, lineno, offset))
+            offset += len(value)
+            is_data = not is_data
+        if include_separators:
+            append(Token(Token.EOL, line[len(data) :], lineno, offset))
+        return tokens, True
+
     def _tokenize_line(
         self,
         line: str,
@@ -227,7 +227,7 @@ class Token:
         before, after, or between variables so that they have the same
         type as the original token.
         """
-        if self.type not in Token.ALLOW_VARIABLES:
+        if self.type not in Token.ALLOW_VARIABLES or "{" not in self.value:
             return self._tokenize_no_variables()
         matches = VariableMatches(self.value)
         if not matches:
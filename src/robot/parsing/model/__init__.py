@@ -35,4 +35,8 @@ from .blocks import (
     While as While,
 )
 from .statements import Config as Config, End as End, Statement as Statement
-from .visitor import ModelTransformer as ModelTransformer, ModelVisitor as ModelVisitor
+from .visitor import (
+    CompositeVisitor as CompositeVisitor,
+    ModelTransformer as ModelTransformer,
+    ModelVisitor as ModelVisitor,
+)
@@ -99,3 +99,44 @@ class ModelTransformer(NodeTransformer, VisitorFinder):
     def visit(self, node: Node) -> "None | Node | list[Node]":
         visitor_method = self._find_visitor(type(node))
         return visitor_method(self, node)
+
+
+class CompositeVisitor(ModelVisitor):
+    """Runs multiple :class:`ModelVisitor` instances in one traversal.
+
+    Visiting a model with this visitor is equivalent to visiting it with each
+    of the given visitors separately, but the model is traversed only once.
+    Visitor methods are called in the order the visitors are given. When
+    a visitor has a ``visit_ClassName`` method matching a node, that method
+    is responsible for visiting the children of the node as usual, and other
+    visitors continue visiting the children in the shared traversal.
+
+    Visitors should not modify the model, because changes are not necessarily
+    seen by other visitors. :class:`ModelTransformer` instances thus should
+    not be used with this class.
+
+    New in Robot Framework 7.5.
+    """
+
+    def __init__(self, *visitors: ModelVisitor):
+        self.visitors = visitors
+        self._active = visitors
+
+    def visit(self, node: Node) -> None:
+        active = self._active
+        remaining = []
+        for visitor in active:
+            if type(visitor).visit is not ModelVisitor.visit:
+                visitor.visit(node)
+                continue
+            visitor_method = visitor._find_visitor(type(node))
+            if visitor_method is NodeVisitor.generic_visit:
+                remaining.append(visitor)
+            else:
+                visitor_method(visitor, node)
+        if remaining:
+            self._active = remaining
+            try:
+                self.generic_visit(node)
+            finally:
+                self._active = active
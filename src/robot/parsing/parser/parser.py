@@ -13,7 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Callable, Iterator
+from typing import Callable, Iterable, Iterator
 
 from robot.conf import LanguagesLike
 from robot.utils import Source
@@ -29,6 +29,7 @@ def get_model(
     data_only: bool = False,
     curdir: "str | None" = None,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> File:
     """Parses the given source into a model represented as an AST.
 
@@ -53,11 +54,19 @@ def get_model(
         an initialized :class:`~robot.conf.languages.Language` subclass,
         a list containing such strings or instances, or a
         :class:`~robot.conf.languages.Languages` instance.
+    :param sections: Names of the sections to include in the model like
+        ``["Settings", "Test Cases"]``. Other sections are not parsed at all,
+        which makes parsing considerably faster if, for example, only settings
+        are needed. Possible values are ``Settings``, ``Variables``,
+        ``Test Cases``, ``Tasks``, ``Keywords`` and ``Comments``, and they are
+        case, space and underscore insensitive. By default, all sections are
+        included. Model containing only some of the sections cannot be saved
+        back to file system without losing data. New in Robot Framework 7.5.
 
     Use :func:`get_resource_model` or :func:`get_init_model` when parsing
     resource or suite initialization files, respectively.
     """
-    return _get_model(get_tokens, source, data_only, curdir, lang)
+    return _get_model(get_tokens, source, data_only, curdir, lang, sections)
 
 
 def get_resource_model(
@@ -65,13 +74,14 @@ def get_resource_model(
     data_only: bool = False,
     curdir: "str | None" = None,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> File:
     """Parses the given source into a resource file model.
 
     Same as :func:`get_model` otherwise, but the source is considered to be
     a resource file. This affects, for example, what settings are valid.
     """
-    return _get_model(get_resource_tokens, source, data_only, curdir, lang)
+    return _get_model(get_resource_tokens, source, data_only, curdir, lang, sections)
 
 
 def get_init_model(
@@ -79,6 +89,7 @@ def get_init_model(
     data_only: bool = False,
     curdir: "str | None" = None,
     lang: LanguagesLike = None,
+    sections: "Iterable[str] | None" = None,
 ) -> File:
     """Parses the given source into an init file model.
 
@@ -86,7 +97,7 @@ def get_init_model(
     a suite initialization file. This affects, for example, what settings are
     valid.
     """
-    return _get_model(get_init_tokens, source, data_only, curdir, lang)
+    return _get_model(get_init_tokens, source, data_only, curdir, lang, sections)
 
 
 def _get_model(
@@ -95,8 +106,9 @@ def _get_model(
     data_only: bool,
     curdir: "str | None",
     lang: LanguagesLike,
+    sections: "Iterable[str] | None",
 ):
-    tokens = token_getter(source, data_only, lang=lang)
+    tokens = token_getter(source, data_only, lang=lang, sections=sections)
     statements = _tokens_to_statements(tokens, curdir)
     model = _statements_to_model(statements, source)
     ConfigParser.parse(model)
@@ -147,6 +147,14 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --logcompression level[:blocksize]  Compression used with long strings
+                          in the log file. Level is an integer from 0 to 9.
+                          If block size is given in kilobytes, strings are
+                          compressed together in blocks of that size using
+                          multiple threads. This is considerably faster with
+                          large logs. Examples: `--logcompression 6:256`,
+                          `--logcompression 1`. Default: 9 (strings are
+                          compressed separately using the highest level)
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
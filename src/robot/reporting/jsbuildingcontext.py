@@ -21,6 +21,7 @@ from robot.output.loggerhelper import LEVELS
 from robot.utils import attribute_escape, get_link_path, html_escape, safe_str
 
 from .expandkeywordmatcher import ExpandKeywordMatcher
+from .searchindex import SearchIndex
 from .stringcache import StringCache
 
 
@@ -32,11 +33,14 @@ class JsBuildingContext:
         split_log=False,
         expand_keywords=None,
         prune_input=False,
+        compression=(9, 0),
     ):
         self._log_dir = self._get_log_dir(log_path)
         self._split_log = split_log
         self._prune_input = prune_input
-        self._strings = self._top_level_strings = StringCache()
+        self._compression = compression
+        self._strings = self._top_level_strings = StringCache(*compression)
+        self.search_index = SearchIndex()
         self.basemillis = None
         self.split_results = []
         self.min_level = "NONE"
@@ -110,7 +114,7 @@ class JsBuildingContext:
 
     def start_splitting_if_needed(self, split=False):
         if self._split_log and split:
-            self._strings = StringCache()
+            self._strings = StringCache(*self._compression)
             return True
         return False
 
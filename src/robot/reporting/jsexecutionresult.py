@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import copy
 import time
 
 from .stringcache import StringIndex
@@ -30,24 +31,40 @@ class JsExecutionResult:
         split_results=None,
         min_level=None,
         expand_keywords=None,
+        search_index=None,
     ):
         self.suite = suite
         self.strings = strings
         self.min_level = min_level
-        self.data = self._get_data(statistics, errors, basemillis or 0, expand_keywords)
+        self.data = self._get_data(
+            statistics, errors, basemillis or 0, expand_keywords, search_index
+        )
         self.split_results = split_results or []
 
-    def _get_data(self, statistics, errors, basemillis, expand_keywords):
+    def _get_data(self, statistics, errors, basemillis, expand_keywords, search_index):
         return {
             "stats": statistics,
             "errors": errors,
             "baseMillis": basemillis,
             "generated": int(time.time() * 1000) - basemillis,
             "expand_keywords": expand_keywords,
+            "search_index": search_index,
         }
 
+    def for_report(self):
+        """Returns a copy of this result without data not needed in report.
+
+        Unlike :meth:`remove_data_not_needed_in_report`, does not modify
+        this result which can thus be used for writing log at the same time.
+        """
+        result = copy.copy(self)
+        result.data = self.data.copy()
+        result.remove_data_not_needed_in_report()
+        return result
+
     def remove_data_not_needed_in_report(self):
         self.data.pop("errors")
+        self.data.pop("search_index")
         rm = _KeywordRemover()
         self.suite = rm.remove_keywords(self.suite)
         self.suite, self.strings = rm.remove_unused_strings(self.suite, self.strings)
@@ -78,8 +95,10 @@ class _KeywordRemover:
 
     def remove_unused_strings(self, model, strings):
         used = set(self._get_used_indices(model))
+        used.update(list(self._get_used_blocks(strings, used)))
         remap = {}
         strings = tuple(self._get_used_strings(strings, used, remap))
+        strings = tuple(self._remap_block_references(strings, remap))
         model = tuple(self._remap_string_indices(model, remap))
         return model, strings
 
@@ -90,6 +109,11 @@ class _KeywordRemover:
             elif isinstance(item, tuple):
                 yield from self._get_used_indices(item)
 
+    def _get_used_blocks(self, strings, used_indices):
+        for index in used_indices:
+            if strings[index][:1] == "@":
+                yield int(strings[index][1:].split(":", 1)[0])
+
     def _get_used_strings(self, strings, used_indices, remap):
         offset = 0
         for index, string in enumerate(strings):
@@ -99,6 +123,13 @@ class _KeywordRemover:
             else:
                 offset += 1
 
+    def _remap_block_references(self, strings, remap):
+        for string in strings:
+            if string[:1] == "@":
+                block, offsets = string[1:].split(":", 1)
+                string = f"@{remap[int(block)]}:{offsets}"
+            yield string
+
     def _remap_string_indices(self, model, remap):
         for item in model:
             if isinstance(item, StringIndex):
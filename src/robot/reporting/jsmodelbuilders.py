@@ -52,12 +52,14 @@ class JsModelBuilder:
         split_log=False,
         expand_keywords=None,
         prune_input_to_save_memory=False,
+        compression=(9, 0),
     ):
         self._context = JsBuildingContext(
             log_path,
             split_log,
             expand_keywords,
             prune_input_to_save_memory,
+            compression,
         )
 
     def build_from(self, result_from_xml):
@@ -66,6 +68,7 @@ class JsModelBuilder:
             statistics=StatisticsBuilder().build(result_from_xml.statistics),
             suite=SuiteBuilder(self._context).build(result_from_xml.suite),
             errors=ErrorsBuilder(self._context).build(result_from_xml.errors),
+            search_index=self._context.search_index.dump(),
             strings=self._context.strings,
             basemillis=self._context.basemillis,
             split_results=self._context.split_results,
@@ -82,6 +85,7 @@ class Builder:
         self._string = self._context.string
         self._html = self._context.html
         self._timestamp = self._context.timestamp
+        self._index = self._context.search_index
 
     def _get_status(self, item, note_only=False):
         model = (
@@ -105,6 +109,13 @@ class Builder:
             index = self._string(msg)
         return (*model, index)
 
+    def _index_message(self, item):
+        msg = item.message
+        if msg.startswith("*HTML*"):
+            self._index.text(msg[6:], html=True)
+        else:
+            self._index.text(msg)
+
     def _build_body(self, body, split=False):
         splitting = self._context.start_splitting_if_needed(split)
         # tuple([<listcomp>]) is faster than tuple(<genex>) with short lists.
@@ -123,23 +134,41 @@ class SuiteBuilder(Builder):
         self._build_test = TestBuilder(context).build
         self._build_body_item = BodyItemBuilder(context).build
 
-    def build(self, suite):
-        with self._context.prune_input(suite.tests, suite.suites):
-            stats = self._get_statistics(suite)  # Must be done before pruning
+    def build(self, suite, id=None):
+        id = id or suite.id
+        prune_input = self._context.prune_input(suite.tests, suite.suites)
+        with prune_input, self._index.owner(id):
             fixture = []
             if suite.has_setup:
                 fixture.append(suite.setup)
             if suite.has_teardown:
                 fixture.append(suite.teardown)
+            self._index.text(suite.name)
+            name = self._string(suite.name, attr=True)
+            source = self._string(suite.source)
+            relative_source = self._context.relative_source(suite.source)
+            doc = self._html(suite.doc)
+            metadata = tuple(self._yield_metadata(suite))
+            status = self._get_status(suite)
+            suites = tuple(
+                self._build_suite(s, f"{id}-s{i}")
+                for i, s in enumerate(suite.suites, start=1)
+            )
+            tests = tuple(
+                self._build_test(t, f"{id}-t{i}")
+                for i, t in enumerate(suite.tests, start=1)
+            )
+            # Must be done before pruning.
+            stats = self._get_statistics(suite, suites)
             return (
-                self._string(suite.name, attr=True),
-                self._string(suite.source),
-                self._context.relative_source(suite.source),
-                self._html(suite.doc),
-                tuple(self._yield_metadata(suite)),
-                self._get_status(suite),
-                tuple(self._build_suite(s) for s in suite.suites),
-                tuple(self._build_test(t) for t in suite.tests),
+                name,
+                source,
+                relative_source,
+                doc,
+                metadata,
+                status,
+                suites,
+                tests,
                 tuple(self._build_body_item(kw, split=True) for kw in fixture),
                 stats,
             )
@@ -149,9 +178,24 @@ class SuiteBuilder(Builder):
             yield self._string(name)
             yield self._html(value)
 
-    def _get_statistics(self, suite):
-        stats = suite.statistics  # Access property only once
-        return (stats.total, stats.passed, stats.failed, stats.skipped)
+    def _get_statistics(self, suite, suites):
+        # Calculated based on statistics of already built child suites instead
+        # of using `suite.statistics` that would visit all tests again.
+        total, passed, failed, skipped = len(suite.tests), 0, 0, 0
+        for test in suite.tests:
+            if test.passed:
+                passed += 1
+            elif test.skipped:
+                skipped += 1
+            else:
+                failed += 1
+        for child in suites:
+            child_total, child_passed, child_failed, child_skipped = child[-1]
+            total += child_total
+            passed += child_passed
+            failed += child_failed
+            skipped += child_skipped
+        return (total, passed, failed, skipped)
 
 
 class TestBuilder(Builder):
@@ -160,9 +204,15 @@ class TestBuilder(Builder):
         super().__init__(context)
         self._build_body_item = BodyItemBuilder(context).build
 
-    def build(self, test):
+    def build(self, test, id=None):
+        id = id or test.id
         body = self._get_body_items(test)
-        with self._context.prune_input(test.body):
+        with self._context.prune_input(test.body), self._index.owner(id):
+            if test.failed:
+                self._index.failure(id)
+            self._index.text(test.name)
+            self._index_message(test)
+            self._index.tags(test.tags)
             return (
                 self._string(test.name, attr=True),
                 self._string(test.timeout),
@@ -191,7 +241,8 @@ class BodyItemBuilder(Builder):
     def build(self, item, split=False):
         if isinstance(item, Message):
             return self._build_message(item)
-        with self._context.prune_input(item.body):
+        with self._context.prune_input(item.body), self._index.body_item(item):
+            self._index_message(item)
             if isinstance(item, Keyword):
                 return self._build_keyword(item, split)
             if isinstance(item, (Return, Error)):
@@ -200,6 +251,8 @@ class BodyItemBuilder(Builder):
 
     def _build_keyword(self, kw: Keyword, split):
         self._context.check_expansion(kw)
+        self._index.text(kw.full_name)
+        self._index.text(" ".join(kw.args))
         body = kw.body.flatten()
         if kw.has_setup:
             body.insert(0, kw.setup)
@@ -233,6 +286,7 @@ class BodyItemBuilder(Builder):
     ):
         if body is None:
             body = item.body.flatten()
+            self._index.text(name)
         return (
             KEYWORD_TYPES[item.type],
             self._string(name, attr=True),
@@ -253,6 +307,7 @@ class MessageBuilder(Builder):
         if msg.level in ("WARN", "ERROR"):
             self._context.create_link_target(msg)
         self._context.message_level(msg.level)
+        self._index.text(msg.message, html=msg.html)
         return self._build(msg)
 
     def _build(self, msg):
@@ -13,6 +13,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from robot.htmldata import HtmlFileWriter, LOG, ModelWriter, REPORT
@@ -40,6 +41,7 @@ class _LogReportWriter:
 
 class LogWriter(_LogReportWriter):
     usage = "log"
+    max_workers = 8
 
     def write(self, path: "Path | str", config):
         if isinstance(path, str):
@@ -49,9 +51,21 @@ class LogWriter(_LogReportWriter):
             self._write_split_logs(path)
 
     def _write_split_logs(self, path: Path):
-        for index, (kws, strings) in enumerate(self._js_model.split_results, start=1):
-            name = f"{path.stem}-{index}.js"
-            self._write_split_log(index, kws, strings, path.with_name(name))
+        # Parts are independent so they can be serialized concurrently.
+        split_results = self._js_model.split_results
+        with ThreadPoolExecutor(min(len(split_results), self.max_workers)) as executor:
+            futures = [
+                executor.submit(
+                    self._write_split_log,
+                    index,
+                    kws,
+                    strings,
+                    path.with_name(f"{path.stem}-{index}.js"),
+                )
+                for index, (kws, strings) in enumerate(split_results, start=1)
+            ]
+            for future in futures:
+                future.result()
 
     def _write_split_log(self, index, kws, strings, path: Path):
         with file_writer(path, usage=self.usage) as outfile:
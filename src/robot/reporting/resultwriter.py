@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 from robot.conf import RebotSettings
 from robot.errors import DataError
 from robot.model import ModelModifier
@@ -53,39 +55,71 @@ class ResultWriter:
         """
         settings = settings or RebotSettings(options)
         results = Results(settings, *self._sources)
+        # Output and xUnit files are written first because creating the JS
+        # model may prune the result model to save memory.
+        writers = []
         if settings.output:
-            self._write_output(results.result, settings.output, settings.legacy_output)
+            writers.append(
+                self._output_writer(
+                    results.result, settings.output, settings.legacy_output
+                )
+            )
         if settings.xunit:
-            self._write_xunit(results.result, settings.xunit)
+            writers.append(self._xunit_writer(results.result, settings.xunit))
+        self._write(writers)
+        writers = []
         if settings.log:
             config = dict(settings.log_config, minLevel=results.js_result.min_level)
-            self._write_log(results.js_result, settings.log, config)
+            writers.append(self._log_writer(results.js_result, settings.log, config))
         if settings.report:
-            results.js_result.remove_data_not_needed_in_report()
-            self._write_report(
-                results.js_result, settings.report, settings.report_config
+            writers.append(
+                self._report_writer(
+                    results.js_result, settings.report, settings.report_config
+                )
             )
+        self._write(writers)
         return results.return_code
 
-    def _write_output(self, result, path, legacy_output=False):
-        self._write("Output", result.save, path, legacy_output)
+    def _output_writer(self, result, path, legacy_output=False):
+        return "Output", result.save, path, legacy_output
+
+    def _xunit_writer(self, result, path):
+        return "XUnit", XUnitWriter(result).write, path
 
-    def _write_xunit(self, result, path):
-        self._write("XUnit", XUnitWriter(result).write, path)
+    def _log_writer(self, js_result, path, config):
+        return "Log", LogWriter(js_result).write, path, config
 
-    def _write_log(self, js_result, path, config):
-        self._write("Log", LogWriter(js_result).write, path, config)
+    def _report_writer(self, js_result, path, config):
+        def write(path, config):
+            ReportWriter(js_result.for_report()).write(path, config)
 
-    def _write_report(self, js_result, path, config):
-        self._write("Report", ReportWriter(js_result).write, path, config)
+        return "Report", write, path, config
 
-    def _write(self, name, writer, path, *args):
+    def _write(self, writers):
+        """Runs ``writers`` concurrently and reports results in order.
+
+        Writers only read the shared models, so they can be run in threads.
+        Possible errors and created files are logged in the main thread
+        to keep console output deterministic.
+        """
+        if len(writers) > 1:
+            with ThreadPoolExecutor(len(writers)) as executor:
+                futures = [executor.submit(self._run_writer, *w[1:]) for w in writers]
+                errors = [future.result() for future in futures]
+        else:
+            errors = [self._run_writer(*w[1:]) for w in writers]
+        for (name, _, path, *_), error in zip(writers, errors):
+            if error:
+                LOGGER.error(error)
+            else:
+                LOGGER.result_file(name, path)
+
+    def _run_writer(self, writer, path, *args):
         try:
             writer(path, *args)
         except DataError as err:
-            LOGGER.error(err.message)
-        else:
-            LOGGER.result_file(name, path)
+            return err.message
+        return None
 
 
 class Results:
@@ -140,6 +174,7 @@ class Results:
                 split_log=self._settings.split_log,
                 expand_keywords=self._settings.expand_keywords,
                 prune_input_to_save_memory=self._prune,
+                compression=self._settings.log_compression,
             )
             self._js_result = builder.build_from(self.result)
             if self._prune:
@@ -0,0 +1,105 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import re
+from contextlib import contextmanager
+
+from robot.utils import normalize
+
+
+class SearchIndex:
+    """Inverted index embedded into log files.
+
+    Maps failed items, tags and tokens in names and messages to ids of
+    the tests and suites containing them. This allows finding items in
+    the log without walking through the whole model in the browser or
+    loading split log files. To keep the index compact, each id is stored
+    only once and the index refers to ids using their position. Lists of
+    positions are sorted so that they can be intersected efficiently.
+
+    Only the first 1000 characters of each text, typically a message, are
+    indexed to keep the index size reasonable also with huge messages.
+    """
+
+    _token = re.compile(r"\w{2,}")
+    _markup = re.compile(r"<[^>]*>")
+    _max_text_length = 1000
+
+    def __init__(self):
+        self._ids: "dict[str, int]" = {}
+        self._failures: "list[int]" = []
+        self._tags: "dict[str, list[int]]" = {}
+        self._tokens: "dict[str, list[int]]" = {}
+        self._owner: "str | None" = None
+        self._owner_tokens: "set[str]" = set()
+
+    def _id(self, id: str) -> int:
+        if id not in self._ids:
+            self._ids[id] = len(self._ids)
+        return self._ids[id]
+
+    @contextmanager
+    def owner(self, id: str):
+        """Adds tokens found inside the block to the suite or test ``id``."""
+        owner, tokens = self._owner, self._owner_tokens
+        self._owner, self._owner_tokens = id, set()
+        try:
+            yield
+        finally:
+            self._owner, self._owner_tokens = owner, tokens
+
+    def failure(self, id: str):
+        self._failures.append(self._id(id))
+
+    @contextmanager
+    def body_item(self, item):
+        """Adds ``item`` to failures if it failed but its children did not."""
+        failures = len(self._failures)
+        yield
+        if item.failed and len(self._failures) == failures:
+            id = item.id
+            if id:
+                self.failure(id)
+
+    def tags(self, tags):
+        for tag in tags:
+            tag = normalize(tag, ignore="_")
+            self._tags.setdefault(tag, []).append(self._id(self._owner))
+
+    def text(self, text: str, html: bool = False):
+        if not text or self._owner is None:
+            return
+        text = text[: self._max_text_length]
+        if html:
+            text = self._markup.sub(" ", text)
+        for token in self._token.findall(text.lower()):
+            if token not in self._owner_tokens:
+                self._owner_tokens.add(token)
+                self._tokens.setdefault(token, []).append(self._id(self._owner))
+
+    def dump(self) -> dict:
+        return {
+            "ids": tuple(self._ids),
+            "failures": tuple(self._failures),
+            "tags": {tag: self._sorted(ids) for tag, ids in self._tags.items()},
+            "tokens": {
+                token: self._sorted(ids) for token, ids in self._tokens.items()
+            },
+        }
+
+    def _sorted(self, ids: "list[int]") -> "tuple[int, ...]":
+        # Suites get tokens from their setups and teardowns after their
+        # children, and tags can be duplicates after normalization.
+        return tuple(sorted(set(ids)))
@@ -13,6 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 from robot.utils import compress_text, html_format
 
 
@@ -21,12 +23,26 @@ class StringIndex(int):
 
 
 class StringCache:
+    """Cache of strings used in log and report files.
+
+    By default long strings are compressed separately. If ``block_size`` is
+    given, long strings are concatenated into blocks of about that many
+    characters and each block is compressed only once. Strings in blocks are
+    dumped as references like ``@<block index>:<start>:<end>`` where offsets
+    are in UTF-16 code units used by JavaScript strings. Blocks themselves
+    are added to the end of the dumped strings and compressed in parallel
+    using ``workers`` threads. Zlib releases the GIL while compressing.
+    """
+
     empty = StringIndex(0)
     _compress_threshold = 80
     _use_compressed_threshold = 1.1
 
-    def __init__(self):
+    def __init__(self, compression_level=9, block_size=0, workers=None):
         self._cache = {("", False): self.empty}
+        self.compression_level = compression_level
+        self.block_size = block_size
+        self.workers = workers
 
     def add(self, text, html=False):
         if not text:
@@ -37,14 +53,61 @@ class StringCache:
         return self._cache[key]
 
     def dump(self):
+        if self.block_size:
+            return self._dump_blocks()
         return tuple(self._encode(text, html) for text, html in self._cache)
 
     def _encode(self, text, html=False):
         if html:
             text = html_format(text)
         if len(text) > self._compress_threshold:
-            compressed = compress_text(text)
+            compressed = compress_text(text, self.compression_level)
             if len(compressed) * self._use_compressed_threshold < len(text):
                 return compressed
         # Strings starting with '*' are raw, others are compressed.
         return "*" + text
+
+    def _dump_blocks(self):
+        strings = []
+        blocks = []
+        block = []
+        size = 0
+        for text, html in self._cache:
+            if html:
+                text = html_format(text)
+            if len(text) > self._compress_threshold:
+                block.append((len(strings), text))
+                size += len(text)
+                if size >= self.block_size:
+                    blocks.append(block)
+                    block, size = [], 0
+            strings.append("*" + text)
+        if block:
+            blocks.append(block)
+        texts = ["".join(text for _, text in block) for block in blocks]
+        for block, text, compressed in zip(blocks, texts, self._compress(texts)):
+            if len(compressed) * self._use_compressed_threshold >= len(text):
+                continue
+            if len(block) == 1:
+                strings[block[0][0]] = compressed
+                continue
+            index = len(strings)
+            strings.append(compressed)
+            start = 0
+            for position, text in block:
+                end = start + self._js_length(text)
+                strings[position] = f"@{index}:{start}:{end}"
+                start = end
+        return tuple(strings)
+
+    def _compress(self, texts):
+        level = self.compression_level
+        if len(texts) > 1 and self.workers != 1:
+            with ThreadPoolExecutor(self.workers) as executor:
+                return list(executor.map(compress_text, texts, [level] * len(texts)))
+        return [compress_text(text, level) for text in texts]
+
+    def _js_length(self, text):
+        if text.isascii():
+            return len(text)
+        return len(text.encode("UTF-16-LE")) // 2
@@ -16,11 +16,14 @@
 from robot import model
 from robot.utils import parse_timestamp
 
+from .keywordremover import KeywordRemover
+from .messagefilter import MessageFilter
+
 
 class SuiteConfigurer(model.SuiteConfigurer):
     """Result suite configured.
 
-    Calls suite's
+    Removes keywords and filters messages like suite's
     :meth:`~robot.result.testsuite.TestSuite.remove_keywords` and
     :meth:`~robot.result.testsuite.TestSuite.filter_messages` methods
     and sets its start and end time based on the given named parameters.
@@ -61,13 +64,15 @@ class SuiteConfigurer(model.SuiteConfigurer):
 
     def visit_suite(self, suite):
         super().visit_suite(suite)
-        self._remove_keywords(suite)
+        self._remove_keywords_and_filter_messages(suite)
         self._set_times(suite)
-        suite.filter_messages(self.log_level)
 
-    def _remove_keywords(self, suite):
-        for how in self.remove_keywords:
-            suite.remove_keywords(how)
+    def _remove_keywords_and_filter_messages(self, suite):
+        # Same as calling `suite.remove_keywords()` with each value and then
+        # `suite.filter_messages()`, but visits the suite only once.
+        visitors = [KeywordRemover.from_config(how) for how in self.remove_keywords]
+        visitors.append(MessageFilter(self.log_level))
+        suite.visit(model.CompositeVisitor(*visitors))
 
     def _set_times(self, suite):
         if self.start_time:
@@ -18,13 +18,14 @@ from pathlib import Path
 from typing import overload, Sequence, TextIO
 
 from robot.errors import DataError
-from robot.model import Statistics, SuiteVisitor
+from robot.model import CompositeVisitor, Statistics, SuiteVisitor
 from robot.utils import JsonDumper, JsonLoader, setter
 from robot.version import get_full_version
 
 from .executionerrors import ExecutionErrors
 from .flattenkeywordmatcher import Flattener
 from .model import TestSuite
+from .suiteteardownfailed import SuiteTeardownFailureHandler
 
 
 def is_json_source(source) -> bool:
@@ -201,11 +202,12 @@ class Result:
             result.source = source
         elif isinstance(source, str) and source[0] != "{" and Path(source).exists():
             result.source = Path(source)
-        result.handle_suite_teardown_failures()
+        visitors = []
         if not include_keywords:
-            result.suite.visit(KeywordRemover())
+            visitors.append(KeywordRemover())
         if flattened_keywords:
-            result.suite.visit(Flattener(flattened_keywords))
+            visitors.append(Flattener(flattened_keywords))
+        result.post_process(*visitors)
         return result
 
     @classmethod
@@ -356,6 +358,16 @@ class Result:
         if self.generated_by_robot:
             self.suite.handle_suite_teardown_failures()
 
+    def post_process(self, *visitors: SuiteVisitor):
+        """Handles suite teardown failures and runs given visitors.
+
+        All this is done using one traversal. Internal usage only.
+        """
+        if self.generated_by_robot:
+            visitors = (SuiteTeardownFailureHandler(), *visitors)
+        if visitors:
+            self.suite.visit(CompositeVisitor(*visitors))
+
     def set_execution_mode(self, other):
         """Set execution mode based on other result. Internal usage only."""
         if other.rpa is None:
@@ -387,7 +399,9 @@ class CombinedResult(Result):
 
 class KeywordRemover(SuiteVisitor):
 
-    def start_suite(self, suite):
+    # Suite fixtures are removed only when the suite ends so that suite
+    # teardown status can be checked by other visitors in the same traversal.
+    def end_suite(self, suite):
         suite.setup = suite.teardown = None
 
     def visit_test(self, test):
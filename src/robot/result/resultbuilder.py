@@ -145,13 +145,14 @@ class ExecutionResultBuilder:
         handler = XmlElementHandler(result)
         with self._source as source:
             self._parse(source, handler.start, handler.end)
-        result.handle_suite_teardown_failures()
+        visitors = []
         if self._flattened_keywords:
             # Tags are nowadays written after keyword content, so we cannot
             # flatten based on them when parsing output.xml.
-            result.suite.visit(FlattenByTags(self._flattened_keywords))
+            visitors.append(FlattenByTags(self._flattened_keywords))
         if not self._include_keywords:
-            result.suite.visit(KeywordRemover())
+            visitors.append(KeywordRemover())
+        result.post_process(*visitors)
         return result
 
     def _parse(self, source, start, end):
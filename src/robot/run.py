@@ -30,7 +30,9 @@ This module also provides :func:`run` and :func:`run_cli` functions
 that can be used programmatically. Other code is for internal usage.
 """
 
+import os
 import sys
+from pathlib import Path
 from threading import current_thread
 
 if __name__ == "__main__" and "robot" not in sys.modules:
@@ -39,11 +41,15 @@ if __name__ == "__main__" and "robot" not in sys.modules:
     set_pythonpath()
 
 from robot.conf import RobotSettings
-from robot.errors import DataError
+from robot.errors import DATA_ERROR, DataError
 from robot.model import ModelModifier
 from robot.output import librarylogger, LOGGER, pyloggingconf
+from robot.output.loggerhelper import write_to_console
 from robot.reporting import ResultWriter
-from robot.running.builder import TestSuiteBuilder
+from robot.result import ExecutionResult
+from robot.running.builder import ModelCache, TestSuiteBuilder
+from robot.running.changedtests import ChangedTests
+from robot.running.watcher import FileWatcher, unload_modules
 from robot.utils import Application, text
 
 USAGE = """Robot Framework -- A generic automation framework
@@ -148,6 +154,17 @@ Options
                           individually using --test.
  -S --rerunfailedsuites output  Select failed suites from an earlier output
                           file to be re-executed.
+    --changedsince output  Select only tests affected by changes made after
+                          the execution that created the given earlier output
+                          file. Tests are affected if their own file or
+                          resource files, variable files or libraries they use
+                          have been modified. Results of other tests are got
+                          from the earlier output. New in RF 7.5.
+    --watch               Keep running after execution and execute tests
+                          again when test data, resource files, libraries or
+                          variable files are modified. Only tests affected by
+                          the changes are executed if an output file is
+                          created. Stop watching with Ctrl-C. New in RF 7.5.
     --runemptysuite       Executes suite even if it contains no tests. Useful
                           e.g. with --include/--exclude when it is not an error
                           that no test matches the condition.
@@ -172,12 +189,13 @@ Options
                           directory where tests are run from and the given path
                           is considered relative to that unless it is absolute.
  -o --output file         XML output file. Given path, similarly as paths given
-                          to --log, --report, --xunit, and --debugfile, is
-                          relative to --outputdir unless given as an absolute
-                          path. Other output files are created based on XML
-                          output files after the test execution and XML outputs
-                          can also be further processed with Rebot tool. Can be
-                          disabled by giving a special value `NONE`.
+                          to --log, --report, --xunit, --debugfile and
+                          --resultdb, is relative to --outputdir unless given
+                          as an absolute path. Other output files are created
+                          based on XML output files after the test execution
+                          and XML outputs can also be further processed with
+                          Rebot tool. Can be disabled by giving a special
+                          value `NONE`.
                           Default: output.xml
     --legacyoutput        Create XML output file in format compatible with
                           Robot Framework 6.x and earlier.
@@ -190,6 +208,13 @@ Options
                           option is specified.
  -b --debugfile file      Debug file written during execution. Not created
                           unless this option is specified.
+    --resultdb file       SQLite database where suites, tests, tags, statuses
+                          and timings are written in batches during execution.
+                          Results of each execution are added as a new run
+                          to an existing database. Not created unless this
+                          option is specified. Default extension: .sqlite
+    --resultdbkeywords    Write also keywords and control structures to the
+                          database created with --resultdb.
  -T --timestampoutputs    When this option is used, timestamp in a format
                           `YYYYMMDD-hhmmss` is added to all generated output
                           files between their basename and extension. For
@@ -198,6 +223,14 @@ Options
                           `report-20070503-154410.html`.
     --splitlog            Split the log file into smaller pieces that open in
                           browsers transparently.
+    --logcompression level[:blocksize]  Compression used with long strings
+                          in the log file. Level is an integer from 0 to 9.
+                          If block size is given in kilobytes, strings are
+                          compressed together in blocks of that size using
+                          multiple threads. This is considerably faster with
+                          large logs. Examples: `--logcompression 6:256`,
+                          `--logcompression 1`. Default: 9 (strings are
+                          compressed separately using the highest level)
     --logtitle title      Title for the generated log file. The default title
                           is `<SuiteName> Log`.
     --reporttitle title   Title for the generated report file. The default
@@ -466,6 +499,11 @@ class RobotFramework(Application):
             raise
         if settings.pythonpath:
             sys.path = settings.pythonpath + sys.path
+        if settings.watch:
+            return self._watch(datasources, settings)
+        return self._run(datasources, settings)
+
+    def _run(self, datasources, settings):
         LOGGER.register_console_logger(**settings.console_output_config)
         LOGGER.info(f"Settings:\n{settings}")
         builder = TestSuiteBuilder(
@@ -484,8 +522,14 @@ class RobotFramework(Application):
                 LOGGER,
             )
             suite.visit(modifier)
+        changed_tests = None
+        if settings.changed_since:
+            changed_tests = ChangedTests(settings.changed_since, settings.languages)
+            changed_tests.record(suite)
         suite.configure(**settings.suite_config)
         settings.rpa = suite.validate_execution_mode()
+        if changed_tests:
+            changed_tests.select(suite, settings.run_empty_suite)
         with pyloggingconf.robot_handler_enabled(settings.log_level):
             old_max_error_lines = text.MAX_ERROR_LINES
             old_max_assign_length = text.MAX_ASSIGN_LENGTH
@@ -498,6 +542,8 @@ class RobotFramework(Application):
                 text.MAX_ERROR_LINES = old_max_error_lines
                 text.MAX_ASSIGN_LENGTH = old_max_assign_length
                 librarylogger.LOGGING_THREADS[0] = "MainThread"
+            if changed_tests:
+                result = self._carry_over_results(changed_tests, result, settings)
             LOGGER.info(
                 f"Tests execution ended. Statistics:\n{result.suite.stat_message}"
             )
@@ -506,6 +552,55 @@ class RobotFramework(Application):
                 writer.write_results(settings.get_rebot_settings())
         return result.return_code
 
+    def _carry_over_results(self, changed_tests, result, settings):
+        if settings.output:
+            result = ExecutionResult(settings.output)
+        result = changed_tests.merge(result)
+        if settings.output:
+            result.save(settings.output, legacy_output=settings.legacy_output)
+            changed_tests.save_hashes(settings.output)
+        return result
+
+    def _watch(self, datasources, settings):
+        variable_files = {
+            Path(path).absolute()
+            for path, _ in settings.variable_files
+            if os.path.isfile(path)
+        }
+        watcher = FileWatcher(
+            [*datasources, *settings.pythonpath, *variable_files],
+            extensions=(*settings.extension, ".resource", ".py"),
+        )
+        rc = DATA_ERROR
+        # Models of files that have not changed are not parsed again.
+        with watcher, ModelCache().enabled():
+            try:
+                while True:
+                    watcher.reset()
+                    try:
+                        rc = self._run(datasources, settings)
+                    except DataError as err:
+                        LOGGER.error(err.message)
+                        rc = DATA_ERROR
+                    if settings.console not in ("quiet", "none"):
+                        write_to_console("Watching for changes. Press Ctrl-C to stop.")
+                    changed = watcher.wait()
+                    unload_modules(changed)
+                    LOGGER.restart()
+                    settings["ChangedSince"] = self._get_changed_since(
+                        settings, changed, variable_files
+                    )
+            except KeyboardInterrupt:
+                return rc
+
+    def _get_changed_since(self, settings, changed, variable_files):
+        # Variable files given from the command line affect all tests.
+        if any(path in variable_files for path in changed):
+            return None
+        if settings.output and os.path.isfile(settings.output):
+            return settings.output
+        return None
+
     def validate(self, options, arguments):
         return self._filter_options_without_value(options), arguments
 
@@ -17,5 +17,5 @@ from .builders import (
     ResourceFileBuilder as ResourceFileBuilder,
     TestSuiteBuilder as TestSuiteBuilder,
 )
-from .parsers import RobotParser as RobotParser
+from .parsers import ModelCache as ModelCache, RobotParser as RobotParser
 from .settings import TestDefaults as TestDefaults
@@ -13,11 +13,14 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
 import re
 from abc import ABC
+from contextlib import contextmanager
 from inspect import signature
 from pathlib import Path
 from textwrap import dedent
+from typing import Callable
 
 from robot.conf import LanguagesLike
 from robot.errors import DataError
@@ -54,22 +57,12 @@ class RobotParser(Parser):
         self.process_curdir = process_curdir
 
     def parse_suite_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
-        model = get_model(
-            self._get_source(source),
-            data_only=True,
-            curdir=self._get_curdir(source),
-            lang=self.lang,
-        )
+        model = self._get_model(get_model, source)
         model.source = source
         return self.parse_model(model, defaults)
 
     def parse_init_file(self, source: Path, defaults: TestDefaults) -> TestSuite:
-        model = get_init_model(
-            self._get_source(source),
-            data_only=True,
-            curdir=self._get_curdir(source),
-            lang=self.lang,
-        )
+        model = self._get_model(get_init_model, source)
         model.source = source
         suite = TestSuite(
             name=TestSuite.name_from_source(source.parent),
@@ -89,6 +82,21 @@ class RobotParser(Parser):
         SuiteBuilder(suite, FileSettings(defaults)).build(model)
         return suite
 
+    def _get_model(self, get_model: "Callable[..., File]", source: Path) -> File:
+        def parse():
+            return get_model(
+                self._get_source(source),
+                data_only=True,
+                curdir=self._get_curdir(source),
+                lang=self.lang,
+            )
+
+        cache = ModelCache.current
+        if not cache:
+            return parse()
+        key = (type(self), get_model, os.path.abspath(source))
+        return cache.get(key, source, (self.lang, self.process_curdir), parse)
+
     def _get_curdir(self, source: Path) -> "str | None":
         return str(source.parent).replace("\\", "\\\\") if self.process_curdir else None
 
@@ -96,12 +104,7 @@ class RobotParser(Parser):
         return source
 
     def parse_resource_file(self, source: Path) -> ResourceFile:
-        model = get_resource_model(
-            self._get_source(source),
-            data_only=True,
-            curdir=self._get_curdir(source),
-            lang=self.lang,
-        )
+        model = self._get_model(get_resource_model, source)
         model.source = source
         return self.parse_resource_model(model)
 
@@ -111,6 +114,52 @@ class RobotParser(Parser):
         return resource
 
 
+class ModelCache:
+    """Caches models of parsed files.
+
+    Models are reused as long as modification times and sizes of the parsed
+    files stay the same. When tests are executed multiple times in the same
+    process, this way only changed files need to be parsed again. Caching is
+    done only when the cache is enabled using :meth:`enabled`, because
+    otherwise models would be kept in memory unnecessarily.
+    """
+
+    current: "ModelCache | None" = None
+
+    def __init__(self):
+        self._models = {}
+
+    @contextmanager
+    def enabled(self):
+        """Enables this cache while the returned context manager is active."""
+        previous = ModelCache.current
+        ModelCache.current = self
+        try:
+            yield self
+        finally:
+            ModelCache.current = previous
+
+    def get(
+        self,
+        key: tuple,
+        source: Path,
+        options: tuple,
+        parse: "Callable[[], File]",
+    ) -> File:
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return parse()
+        state = (stat.st_mtime_ns, stat.st_size)
+        if key in self._models:
+            cached_state, cached_options, model = self._models[key]
+            if cached_state == state and cached_options == options:
+                return model
+        model = parse()
+        self._models[key] = (state, options, model)
+        return model
+
+
 class RestParser(RobotParser):
     extensions = (".robot.rst", ".rst", ".rest")
 
@@ -0,0 +1,312 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from importlib.machinery import PathFinder
+from pathlib import Path
+
+from robot.conf import LanguagesLike
+from robot.errors import DataError
+from robot.libraries import STDLIBS
+from robot.model import SuiteVisitor
+from robot.result import ExecutionResult, Result
+from robot.result.executionerrors import ExecutionErrors
+from robot.result.merger import Merger
+from robot.utils import find_file, get_error_message, test_or_task
+from robot.variables import contains_variable
+
+from .builder import ResourceFileBuilder
+from .model import TestCase, TestSuite
+from .resourcemodel import Import, ResourceFile
+
+
+class ChangedTests:
+    """Selects tests affected by changes made after an earlier execution.
+
+    A test is considered changed if the file containing it, initialization
+    files of its parent suites, resource and variable files they import
+    directly or indirectly, or imported libraries have been modified after
+    the earlier execution started. Tests not found from the earlier results
+    are considered changed as well.
+
+    Changes are detected based on content hashes of files if the earlier
+    execution has stored them using :meth:`save_hashes`. Otherwise, and with
+    files not having a stored hash, changes are detected based on file
+    modification times. If an imported file cannot be resolved, for example,
+    because its name contains variables, tests using it are considered
+    changed.
+
+    After execution, results of the unchanged tests can be carried over from
+    the earlier results using :meth:`merge`.
+    """
+
+    _import_by_path_ends = {
+        Import.LIBRARY: (".py", "/", os.sep),
+        Import.VARIABLES: (".py", "/", os.sep, ".yaml", ".yml", ".json"),
+    }
+
+    def __init__(self, output: "Path | str", lang: LanguagesLike = None):
+        self.output = output
+        try:
+            self.previous = ExecutionResult(output)
+        except DataError:
+            raise DataError(
+                f"Reading earlier output '{output}' failed: {get_error_message()}"
+            )
+        start_time = self._get_start_time(self.previous)
+        if not start_time:
+            raise DataError(
+                f"Earlier output '{output}' does not contain execution start time."
+            )
+        self.since = start_time.timestamp()
+        self.existing: "list[TestCase] | None" = None
+        self._previous_hashes = self._read_hashes(output, start_time)
+        self._hashes: "dict[str, str]" = {}
+        self._modified: "dict[str, bool]" = {}
+        self._resource_builder = ResourceFileBuilder(lang=lang)
+        self._changed = {}
+
+    def _get_start_time(self, result: Result) -> "datetime | None":
+        return result.suite.start_time or result.generation_time
+
+    def _get_hash_file(self, output: "Path | str") -> Path:
+        return Path(f"{output}.hashes.json")
+
+    def _read_hashes(
+        self,
+        output: "Path | str",
+        start_time: datetime,
+    ) -> "dict[str, str]":
+        try:
+            with open(self._get_hash_file(output), encoding="UTF-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        # Hashes are ignored if the output has been overwritten afterwards.
+        if not isinstance(data, dict) or data.get("start") != start_time.isoformat():
+            return {}
+        return data.get("hashes") or {}
+
+    def record(self, suite: TestSuite):
+        """Remembers all tests in the given suite.
+
+        :meth:`merge` discards earlier results of tests that are not
+        remembered. This method should thus be called before tests are
+        filtered with ``--include``, ``--exclude`` and other such options so
+        that only results of tests that have been removed from the data are
+        discarded. If it is not called, tests in the suite given to
+        :meth:`select` are remembered.
+        """
+        self.existing = list(suite.all_tests)
+
+    def select(self, suite: TestSuite, empty_suite_ok: bool = False):
+        """Removes unchanged tests from the given suite."""
+        if self.existing is None:
+            self.record(suite)
+        previous = {test.full_name for test in self.previous.suite.all_tests}
+        selector = ChangedTestSelector(self, previous)
+        suite.visit(selector)
+        if not selector.changed and not empty_suite_ok:
+            kind = test_or_task("{test}s", suite.rpa)
+            raise DataError(f"No {kind} changed since '{self.output}'.")
+        suite.remove_empty_suites(preserve_direct_children=empty_suite_ok)
+
+    def merge(self, result: Result) -> Result:
+        """Carries over results of unchanged tests to the given results.
+
+        Returns the earlier results with results of the executed tests merged
+        into them. Results of tests that no longer exist are removed and
+        execution errors are only got from the given results.
+        """
+        merged = self.previous
+        merged.errors = ExecutionErrors()
+        ResultMerger(merged, rpa=result.rpa).merge(result)
+        # Names are got only now because configuring the suite can change them.
+        existing = {test.full_name for test in self.existing or ()}
+        merged.suite.visit(RemovedTestPruner(existing))
+        merged.suite.remove_empty_suites()
+        # The start time of the new execution is used as the baseline when
+        # the merged results are used with `--changedsince` again.
+        merged.suite.start_time = result.suite.start_time
+        merged.suite.end_time = result.suite.end_time
+        return merged
+
+    def save_hashes(self, output: "Path | str"):
+        """Saves content hashes of the checked files next to the given output.
+
+        Hashes are saved to a file named like ``output.xml.hashes.json`` and
+        they are used for detecting changes if the output is used with
+        :class:`ChangedTests` again. Should be called after :meth:`merge`
+        when the merged results have been saved to the output.
+        """
+        data = {
+            "start": self._get_start_time(self.previous).isoformat(),
+            "hashes": self._hashes,
+        }
+        with open(self._get_hash_file(output), "w", encoding="UTF-8") as file:
+            json.dump(data, file, indent=0)
+
+    def suite_changed(self, suite: TestSuite) -> bool:
+        source = suite.source
+        if not source:
+            return True
+        if source.is_dir():
+            init_files = list(source.glob("__init__.*"))
+            if any(self._is_modified(path) for path in init_files):
+                return True
+        elif self._is_modified(source):
+            return True
+        return self._imports_changed(suite.resource)
+
+    def _imports_changed(self, resource: ResourceFile) -> bool:
+        return any(self._import_changed(imp) for imp in resource.imports)
+
+    def _import_changed(self, imp: Import) -> bool:
+        if contains_variable(imp.name):
+            return True
+        key = (imp.type, imp.name, imp.directory)
+        if key not in self._changed:
+            # Avoid recursion if resource files import each others.
+            self._changed[key] = False
+            try:
+                self._changed[key] = self._get_import_changed(imp)
+            except DataError:
+                self._changed[key] = True
+        return self._changed[key]
+
+    def _get_import_changed(self, imp: Import) -> bool:
+        if imp.type == Import.RESOURCE:
+            path = Path(find_file(imp.name, imp.directory, "Resource file"))
+            if self._is_modified(path):
+                return True
+            return self._imports_changed(self._resource_builder.build(path))
+        if imp.name.lower().endswith(self._import_by_path_ends[imp.type]):
+            file_type = imp.select("Library", "Resource file", "Variable file")
+            path = Path(find_file(imp.name, imp.directory, file_type))
+        else:
+            path = self._find_module(imp.name)
+        if path.is_dir() or path.name == "__init__.py":
+            return self._is_package_modified(path)
+        return self._is_modified(path)
+
+    def _find_module(self, name: str) -> Path:
+        if name in STDLIBS:
+            name = f"robot.libraries.{name}"
+        # Modules are found without importing them or their parent packages.
+        # Libraries can be imported like `module.Class`.
+        path = None
+        search_path = None
+        parts = name.split(".")
+        for index in range(1, len(parts) + 1):
+            try:
+                spec = PathFinder.find_spec(".".join(parts[:index]), search_path)
+            except Exception:
+                spec = None
+            if not spec:
+                break
+            if spec.origin and os.path.isfile(spec.origin):
+                path = Path(spec.origin)
+            search_path = spec.submodule_search_locations
+            if not search_path:
+                break
+        if not path:
+            raise DataError("Module not found.")
+        return path
+
+    def _is_package_modified(self, path: Path) -> bool:
+        if path.is_file():
+            path = path.parent
+        # All files are checked to get their hashes.
+        modified = [
+            self._is_modified(Path(root, name))
+            for root, _, files in os.walk(path)
+            for name in files
+            if name.endswith(".py")
+        ]
+        return any(modified)
+
+    def _is_modified(self, path: Path) -> bool:
+        key = os.path.abspath(path)
+        if key not in self._modified:
+            self._modified[key] = self._get_modified(path, key)
+        return self._modified[key]
+
+    def _get_modified(self, path: Path, key: str) -> bool:
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            mtime = path.stat().st_mtime
+        except OSError:
+            return True
+        self._hashes[key] = digest
+        if key in self._previous_hashes:
+            return digest != self._previous_hashes[key]
+        return mtime >= self.since
+
+
+class ChangedTestSelector(SuiteVisitor):
+
+    def __init__(self, changed_tests: ChangedTests, previous: "set[str]"):
+        self.changed_tests = changed_tests
+        self.previous = previous
+        self.changed = False
+        self._suite_changed = []
+
+    def start_suite(self, suite: TestSuite):
+        parent_changed = self._suite_changed[-1] if self._suite_changed else False
+        changed = parent_changed or self.changed_tests.suite_changed(suite)
+        self._suite_changed.append(changed)
+        if not changed:
+            suite.tests = [t for t in suite.tests if t.full_name not in self.previous]
+        if suite.tests:
+            self.changed = True
+
+    def end_suite(self, suite: TestSuite):
+        self._suite_changed.pop()
+
+    def visit_test(self, test):
+        pass
+
+
+class ResultMerger(Merger):
+    """Merger that does not add messages about merging to tests and suites."""
+
+    def visit_test(self, test):
+        old = self._find(self.current.tests, test.name)
+        if old is None:
+            self.current.tests.append(test)
+        else:
+            index = self.current.tests.index(old)
+            self.current.tests[index] = test
+
+    def _create_add_message(self, item, suite=False):
+        return item.message
+
+
+class RemovedTestPruner(SuiteVisitor):
+
+    def __init__(self, existing: "set[str]"):
+        self.existing = existing
+
+    def start_suite(self, suite):
+        suite.tests = [t for t in suite.tests if t.full_name in self.existing]
+
+    def visit_test(self, test):
+        pass
+
+    def visit_keyword(self, keyword):
+        pass
@@ -17,6 +17,7 @@ import inspect
 from os.path import normpath
 from pathlib import Path
 from typing import Any, Callable, Generic, Mapping, Sequence, TYPE_CHECKING, TypeVar
+from weakref import WeakKeyDictionary
 
 from robot.errors import DataError
 from robot.model import Tags
@@ -375,20 +376,24 @@ class KeywordCreator(Generic[K]):
         return self.library.instance
 
     def create(self, **extra) -> K:
-        tags = self.get_tags()
-        doc, doc_tags = split_tags_from_doc(self.get_doc())
+        name, args, doc, tags = self.get_info()
         kw = self.keyword_class(
             owner=self.library,
-            name=self.get_name(),
-            args=self.get_args(),
+            name=name,
+            args=args,
             doc=doc,
-            tags=tags + doc_tags,
+            tags=tags,
             **self.extra,
             **extra,
         )
         kw.args.name = lambda: kw.full_name
         return kw
 
+    def get_info(self) -> "tuple[str, ArgumentSpec, str, list[str]]":
+        tags = self.get_tags()
+        doc, doc_tags = split_tags_from_doc(self.get_doc())
+        return self.get_name(), self.get_args(), doc, tags + doc_tags
+
     def get_name(self) -> str:
         raise NotImplementedError
 
@@ -409,6 +414,9 @@ class StaticKeywordCreator(KeywordCreator[StaticKeyword]):
         super().__init__(name, library)
         self.method = getattr(library.instance, name)
 
+    def get_info(self) -> "tuple[str, ArgumentSpec, str, list[str]]":
+        return KEYWORD_INFO_CACHE.get(self.method, self.name, super().get_info)
+
     def get_name(self) -> str:
         robot_name = getattr(self.method, "robot_name", None)
         name = robot_name or printable_name(self.name, code_style=True)
@@ -472,6 +480,9 @@ class LibraryInitCreator(KeywordCreator[LibraryInit]):
         init.args.name = lambda: init.owner.name
         return init
 
+    def get_info(self) -> "tuple[str, ArgumentSpec, str, list[str]]":
+        return KEYWORD_INFO_CACHE.get(self.method, self.name, super().get_info)
+
     def get_name(self) -> str:
         return self.name
 
@@ -483,3 +494,42 @@ class LibraryInitCreator(KeywordCreator[LibraryInit]):
 
     def get_tags(self) -> "list[str]":
         return []
+
+
+class KeywordInfoCache:
+    """Process-wide cache for information got by inspecting keyword methods.
+
+    Parsing arguments, type hints and documentation is relatively expensive.
+    Caching the results per function means that creating keywords again,
+    for example, when a library is imported with different arguments,
+    does not require inspecting methods again. Entries are removed
+    automatically when functions are garbage collected.
+    """
+
+    def __init__(self):
+        self._cache = WeakKeyDictionary()
+
+    def get(
+        self,
+        method: Callable[..., Any],
+        name: str,
+        create: "Callable[[], tuple[str, ArgumentSpec, str, list[str]]]",
+    ) -> "tuple[str, ArgumentSpec, str, list[str]]":
+        func = getattr(method, "__func__", method)
+        # Inherited documentation depends on the class of bound methods.
+        owner = getattr(method, "__self__", None)
+        key = (name, type(owner) if func is not method else None)
+        try:
+            infos = self._cache.setdefault(func, {})
+        except TypeError:  # Not hashable or does not support weak references.
+            return create()
+        if key not in infos:
+            infos[key] = create()
+        name, args, doc, tags = infos[key]
+        return name, args.copy(), doc, list(tags)
+
+    def clear(self):
+        self._cache.clear()
+
+
+KEYWORD_INFO_CACHE = KeywordInfoCache()
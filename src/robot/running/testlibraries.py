@@ -97,7 +97,7 @@ class TestLibrary:
     def _instance_has_listeners(self, instance) -> bool:
         return getattr(instance, "ROBOT_LIBRARY_LISTENER", None) is not None
 
-    @property
+    @cached_property
     def converters(self) -> "CustomArgumentConverters | None":
         converters = getattr(self.code, "ROBOT_LIBRARY_CONVERTERS", None)
         if not converters:
@@ -0,0 +1,126 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from robot.utils import abspath, PathWatcher
+
+
+class FileWatcher:
+    """Detects changes to files under the given paths.
+
+    Files in directories are matched based on their extensions, explicitly
+    given files are watched regardless their extension. Changes are detected
+    by comparing file modification times. Directories are scanned only after
+    :class:`~robot.utils.PathWatcher` has noticed changes in them using
+    inotify or, if it is not available, once per ``interval``.
+    """
+
+    def __init__(
+        self,
+        paths: "Iterable[Path | str]",
+        extensions: Sequence[str] = (".robot", ".resource", ".py"),
+        interval: float = 1,
+    ):
+        self.paths = [Path(p).absolute() for p in paths]
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.interval = interval
+        self._mtimes = self._scan()
+        self._watcher = PathWatcher(
+            directories=[p.parent for p in self.paths if not p.is_dir()],
+            recursive_directories=[p for p in self.paths if p.is_dir()],
+            poll_interval=interval,
+        )
+
+    def reset(self):
+        """Forgets earlier changes.
+
+        Should be called right before the watched files are used so that
+        changes made to them after that are noticed.
+        """
+        self._mtimes = self._scan()
+
+    def changes(self) -> "list[Path]":
+        """Returns files that have been modified, added or removed.
+
+        Returned changes are forgotten.
+        """
+        mtimes = self._scan()
+        changed = {
+            path
+            for path in self._mtimes.keys() | mtimes.keys()
+            if self._mtimes.get(path) != mtimes.get(path)
+        }
+        self._mtimes = mtimes
+        return sorted(changed)
+
+    def wait(self) -> "list[Path]":
+        """Waits until files change and returns the changed files."""
+        while True:
+            if self._watcher.wait():
+                changed = self.changes()
+                if changed:
+                    return changed
+
+    def close(self):
+        self._watcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _scan(self) -> "dict[Path, float]":
+        mtimes = {}
+        for path in self.paths:
+            if path.is_dir():
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = [d for d in dirs if not self._is_ignored(d)]
+                    for name in files:
+                        if name.lower().endswith(self.extensions):
+                            self._add_mtime(Path(root, name), mtimes)
+            else:
+                self._add_mtime(path, mtimes)
+        return mtimes
+
+    def _is_ignored(self, name: str) -> bool:
+        return name.startswith(".") or name == "__pycache__"
+
+    def _add_mtime(self, path: Path, mtimes: "dict[Path, float]"):
+        try:
+            mtimes[path] = path.stat().st_mtime
+        except OSError:
+            pass
+
+
+def unload_modules(paths: "Iterable[Path | str]") -> "list[str]":
+    """Removes modules imported from the given paths from ``sys.modules``.
+
+    Makes sure that modified libraries and variable files are imported again
+    instead of the earlier imported module being reused. Returns names of
+    the removed modules.
+    """
+    paths = {abspath(p, case_normalize=True) for p in paths}
+    removed = []
+    for name, module in list(sys.modules.items()):
+        source = getattr(module, "__file__", None)
+        if source and abspath(source, case_normalize=True) in paths:
+            del sys.modules[name]
+            removed.append(name)
+    return removed
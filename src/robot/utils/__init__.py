@@ -78,7 +78,12 @@ from .markupwriters import (
     NullMarkupWriter as NullMarkupWriter,
     XmlWriter as XmlWriter,
 )
-from .match import eq as eq, Matcher as Matcher, MultiMatcher as MultiMatcher
+from .match import (
+    compile_pattern as compile_pattern,
+    eq as eq,
+    Matcher as Matcher,
+    MultiMatcher as MultiMatcher,
+)
 from .misc import (
     classproperty as classproperty,
     isatty as isatty,
@@ -96,6 +101,7 @@ from .normalizing import (
     NormalizedDict as NormalizedDict,
 )
 from .notset import NOT_SET as NOT_SET, NotSet as NotSet
+from .pathwatcher import PathWatcher as PathWatcher
 from .platform import (
     PY_VERSION as PY_VERSION,
     PYPY as PYPY,
@@ -17,6 +17,6 @@ import base64
 import zlib
 
 
-def compress_text(text):
-    compressed = zlib.compress(text.encode("UTF-8"), 9)
+def compress_text(text, level=9):
+    compressed = zlib.compress(text.encode("UTF-8"), level)
     return base64.b64encode(compressed).decode("ASCII")
@@ -14,12 +14,19 @@
 #  limitations under the License.
 
 import json
+import math
+import re
 from pathlib import Path
 from typing import Dict, overload, TextIO
 
 from .error import get_error_message
 from .robottypes import type_name
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DataDict = Dict[str, object]
 
 
@@ -33,10 +40,20 @@ class JsonLoader:
     except for ``object_pairs_hook``. As a special feature, handles duplicate
     items so that lists are merged.
 
+    If the orjson__ module is installed and no configuration is given, it is
+    used for parsing. Merging duplicate lists is not possible with it, so
+    the data is parsed again using the standard ``json`` module if the source
+    contains more lists than the parsed data. The same is done if orjson
+    cannot parse the data, for example, due to ``NaN`` values.
+
     __ https://docs.python.org/3/library/json.html#json.load
+    __ https://github.com/ijl/orjson
     """
 
+    _list_value = re.compile(rb'"\s*:\s*\[')
+
     def __init__(self, **config):
+        self.fast = orjson is not None and not any(config.values())
         self.config = self._add_hook_to_merge_duplicate_lists(config)
 
     def _add_hook_to_merge_duplicate_lists(self, config):
@@ -67,6 +84,8 @@ class JsonLoader:
         return data
 
     def _load(self, source: "str | bytes | TextIO | Path") -> object:
+        if self.fast:
+            return self._fast_load(source)
         if self._is_path(source):
             with open(source, encoding="UTF-8") as file:
                 return json.load(file, **self.config)
@@ -74,6 +93,45 @@ class JsonLoader:
             return json.load(source, **self.config)
         return json.loads(source, **self.config)
 
+    def _fast_load(self, source: "str | bytes | TextIO | Path") -> object:
+        if self._is_path(source):
+            with open(source, "rb") as file:
+                source = file.read()
+        elif hasattr(source, "read"):
+            source = source.read()
+        try:
+            data = orjson.loads(source)
+        except (orjson.JSONDecodeError, TypeError):
+            pass
+        else:
+            if isinstance(source, str):
+                source = source.encode("UTF-8", "surrogatepass")
+            if self._has_no_duplicate_lists(source, data):
+                return data
+        return json.loads(source, **self.config)
+
+    def _has_no_duplicate_lists(self, source: bytes, data: object) -> bool:
+        # Parsed data containing less lists than the source means that some
+        # of them were duplicates and orjson discarded them. Strings looking
+        # like list items can cause false positives, but they are harmless.
+        found = sum(1 for _ in self._list_value.finditer(source))
+        return found == self._count_list_values(data)
+
+    def _count_list_values(self, data: object) -> int:
+        count = 0
+        stack = [data] if isinstance(data, (dict, list)) else []
+        while stack:
+            item = stack.pop()
+            values = item.values() if isinstance(item, dict) else item
+            for value in values:
+                if isinstance(value, list):
+                    if isinstance(item, dict):
+                        count += 1
+                    stack.append(value)
+                elif isinstance(value, dict):
+                    stack.append(value)
+        return count
+
     def _is_path(self, source: "str | bytes | TextIO | Path") -> bool:
         if isinstance(source, Path):
             return True
@@ -88,11 +146,57 @@ class JsonDumper:
 
     Supports the same configuration as the underlying `json.dump`__.
 
+    If the orjson__ module is installed, it is used when the configuration
+    allows it. That requires ``indent`` to be ``None`` and ``separators`` to
+    be ``(",", ":")``, or ``indent`` to be ``0`` or ``2`` and ``separators``
+    to be ``None``, ``(",", ": ")`` or ``(",", ":")``. Other configuration
+    than ``ensure_ascii`` is not supported. The output is post-processed so
+    that it is the same as with the standard ``json`` module, including how
+    floats are formatted. If the data cannot be serialized with orjson or
+    contains non-finite floats, the ``json`` module is used. The same is done
+    with compact output if it contains floats orjson formats differently.
+
     __ https://docs.python.org/3/library/json.html#json.load
+    __ https://github.com/ijl/orjson
     """
 
+    _key_separator = re.compile(rb'\n( *)("(?:[^"\\]|\\.)*"): ')
+    _indentation = re.compile(rb"\n +")
+    # orjson formats floats smaller than 1e-4 without an exponent and also
+    # exponents differently than `float.__repr__`. Patterns start with
+    # literals so that searching them is fast. Floats in indented output are
+    # followed by a newline that cannot occur inside strings.
+    _indented_floats = (
+        re.compile(rb"0\.0000[0-9]+(?=,?\n)"),
+        re.compile(rb"e-?[0-9]+(?=,?\n)"),
+    )
+    _compact_floats = (
+        re.compile(rb"0\.0000[0-9]+(?=[,}\]])"),
+        re.compile(rb"e-?[0-9]+(?=[,}\]])"),
+    )
+    _non_ascii = re.compile("[^\x00-\x7f]")
+
     def __init__(self, **config):
         self.config = config
+        self.fast_option = self._get_fast_option(**config)
+
+    def _get_fast_option(
+        self,
+        ensure_ascii=True,
+        indent=None,
+        separators=None,
+        **config,
+    ) -> "int | None":
+        self._ensure_ascii = ensure_ascii
+        self._dedent = indent == 0
+        self._compact_keys = indent is not None and separators == (",", ":")
+        if orjson is None or config:
+            return None
+        if indent is None and separators == (",", ":"):
+            return 0
+        if indent in (0, 2) and separators in (None, (",", ": "), (",", ":")):
+            return orjson.OPT_INDENT_2
+        return None
 
     @overload
     def dump(self, data: DataDict, output: None = None) -> str: ...
@@ -105,6 +209,10 @@ class JsonDumper:
         data: DataDict,
         output: "None | TextIO | Path | str" = None,
     ) -> "None | str":
+        if self.fast_option is not None and self._is_valid_output(output):
+            encoded = self._fast_encode(data)
+            if encoded is not None:
+                return self._fast_write(encoded, output)
         if not output:
             return json.dumps(data, **self.config)
         elif isinstance(output, (str, Path)):
@@ -118,3 +226,93 @@ class JsonDumper:
             raise TypeError(
                 f"Output should be None, path or open file, got {type_name(output)}."
             )
+
+    def _is_valid_output(self, output: "None | TextIO | Path | str") -> bool:
+        return not output or isinstance(output, (str, Path)) or hasattr(output, "write")
+
+    def _fast_encode(self, data: DataDict) -> "bytes | None":
+        try:
+            encoded = orjson.dumps(data, option=self.fast_option)
+        except TypeError:
+            return None
+        # orjson writes NaN and infinity as null, unlike the json module.
+        if b"null" in encoded and self._has_non_finite_floats(data):
+            return None
+        if self.fast_option:
+            encoded = self._format_floats(encoded)
+        elif self._find_floats(encoded, self._compact_floats, b":,[-"):
+            # Found floats can also be inside strings, but falling back to
+            # the json module is safe also then.
+            return None
+        # Key separator is always ": " and indentation two spaces with orjson.
+        # Quotes inside strings are escaped, so `": ` can be replaced directly
+        # if the data does not contain `\": `.
+        if self._compact_keys:
+            if b'\\": ' in encoded:
+                encoded = self._key_separator.sub(rb"\n\1\2:", encoded)
+            else:
+                encoded = encoded.replace(b'": ', b'":')
+        if self._dedent:
+            encoded = self._indentation.sub(b"\n", encoded)
+        return encoded
+
+    def _format_floats(self, encoded: bytes) -> bytes:
+        spans = self._find_floats(encoded, self._indented_floats, b" -")
+        if not spans:
+            return encoded
+        parts = []
+        end = 0
+        for start, stop in sorted(spans):
+            parts.append(encoded[end:start])
+            parts.append(repr(float(encoded[start:stop])).encode("ASCII"))
+            end = stop
+        parts.append(encoded[end:])
+        return b"".join(parts)
+
+    def _find_floats(
+        self,
+        encoded: bytes,
+        patterns: "tuple[re.Pattern[bytes], re.Pattern[bytes]]",
+        preceding: bytes,
+    ) -> "list[tuple[int, int]]":
+        small, exponent = patterns
+        spans = []
+        for match in small.finditer(encoded):
+            start = match.start()
+            if encoded[start - 1] in preceding:
+                spans.append((start, match.end()))
+        for match in exponent.finditer(encoded):
+            start = match.start()
+            while start and encoded[start - 1] in b"0123456789.":
+                start -= 1
+            if start < match.start() and encoded[start - 1] in preceding:
+                spans.append((start, match.end()))
+        return spans
+
+    def _has_non_finite_floats(self, data: object) -> bool:
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, float):
+                if not math.isfinite(item):
+                    return True
+            elif isinstance(item, dict):
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+        return False
+
+    def _fast_write(self, encoded: bytes, output: "None | TextIO | Path | str"):
+        if self._ensure_ascii and not encoded.isascii():
+            encoded = self._escape_non_ascii(encoded.decode("UTF-8")).encode("ASCII")
+        if not output:
+            return encoded.decode("UTF-8")
+        if isinstance(output, (str, Path)):
+            with open(output, "wb") as file:
+                file.write(encoded)
+        else:
+            output.write(encoded.decode("UTF-8"))
+        return None
+
+    def _escape_non_ascii(self, text: str) -> str:
+        return self._non_ascii.sub(lambda match: json.dumps(match.group())[1:-1], text)
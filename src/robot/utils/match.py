@@ -15,7 +15,8 @@
 
 import fnmatch
 import re
-from typing import Iterable, Iterator, Sequence
+from functools import lru_cache
+from typing import AnyStr, Iterable, Iterator, Sequence
 
 from .normalizing import normalize
 
@@ -32,6 +33,28 @@ def eq(
     return str1 == str2
 
 
+@lru_cache(maxsize=512)
+def compile_pattern(
+    pattern: AnyStr,
+    flags: int = 0,
+    regexp: bool = True,
+) -> "re.Pattern[AnyStr]":
+    """Compiles the given regular expression or glob pattern and caches it.
+
+    Glob patterns are translated to regular expressions matching the whole
+    string. The most recently used patterns are cached so that compiling
+    same patterns repeatedly, for example, in keywords used in loops, is fast.
+    Invalid patterns cause ``re.error``.
+    """
+    if not regexp:
+        if isinstance(pattern, bytes):
+            glob = fnmatch.translate(str(pattern, "ISO-8859-1"))
+            pattern = bytes(glob, "ISO-8859-1")
+        else:
+            pattern = fnmatch.translate(pattern)
+    return re.compile(pattern, flags)
+
+
 class Matcher:
 
     def __init__(
@@ -51,9 +74,7 @@ class Matcher:
         self._regexp = self._compile(self._normalize(pattern), regexp=regexp)
 
     def _compile(self, pattern, regexp=False):
-        if not regexp:
-            pattern = fnmatch.translate(pattern)
-        return re.compile(pattern, re.DOTALL)
+        return compile_pattern(pattern, re.DOTALL, regexp)
 
     def match(self, string: str) -> bool:
         return self._regexp.match(self._normalize(string)) is not None
@@ -66,6 +87,13 @@ class Matcher:
 
 
 class MultiMatcher(Iterable[Matcher]):
+    """Matches strings against multiple patterns.
+
+    With glob patterns, strings are normalized only once and matched against
+    all patterns at once. Patterns without wildcards are checked using a set
+    lookup and other patterns are combined into one regular expression.
+    Regular expression patterns are matched one by one.
+    """
 
     def __init__(
         self,
@@ -81,6 +109,24 @@ class MultiMatcher(Iterable[Matcher]):
             for pattern in self._ensure_iterable(patterns)
         ]
         self.match_if_no_patterns = match_if_no_patterns
+        self._combined = None
+        if self.matchers and not regexp:
+            self._combined = self._combine(self.matchers[0]._normalize)
+
+    def _combine(self, normalize):
+        literals = set()
+        regexps = []
+        for matcher in self.matchers:
+            pattern = normalize(matcher.pattern)
+            if "*" in pattern or "?" in pattern or "[" in pattern:
+                regexps.append(f"(?:{matcher._regexp.pattern})")
+            else:
+                literals.add(pattern)
+        try:
+            regexp = re.compile("|".join(regexps), re.DOTALL) if regexps else None
+        except re.error:
+            return None
+        return normalize, literals, regexp
 
     def _ensure_iterable(self, patterns):
         if patterns is None:
@@ -90,6 +136,12 @@ class MultiMatcher(Iterable[Matcher]):
         return patterns
 
     def match(self, string: str) -> bool:
+        if self._combined:
+            normalize, literals, regexp = self._combined
+            string = normalize(string)
+            if string in literals:
+                return True
+            return regexp is not None and regexp.match(string) is not None
         if self.matchers:
             return any(m.match(string) for m in self.matchers)
         return self.match_if_no_patterns
@@ -0,0 +1,150 @@
+#  Copyright 2008-2015 Nokia Networks
+#  Copyright 2016-     Robot Framework Foundation
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import glob
+import os
+import select
+import sys
+import time
+from pathlib import Path
+from typing import Iterable
+
+
+class PathWatcher:
+    """Waits until something changes in the given directories.
+
+    On Linux uses inotify so that waiting ends right after a change and does
+    not consume CPU. Elsewhere, or if inotify cannot be used, polls instead.
+    Directories in ``recursive_directories`` are watched with all their
+    subdirectories except for hidden directories and ``__pycache__``.
+    Directories do not need to exist, but if they contain glob wildcards,
+    polling is used too.
+    """
+
+    # Guards against missed events, e.g. on network file systems.
+    max_wait = 1.0
+    _inotify = None
+    # IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO,
+    # IN_CREATE, IN_DELETE, IN_DELETE_SELF and IN_MOVE_SELF.
+    _mask = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+
+    def __init__(
+        self,
+        directories: "Iterable[Path | str]" = (),
+        recursive_directories: "Iterable[Path | str]" = (),
+        poll_interval: float = 0.1,
+    ):
+        self._directories = [os.fspath(d) for d in directories]
+        self._recursive_directories = [os.fspath(d) for d in recursive_directories]
+        self.poll_interval = poll_interval
+        self._fd = None
+        inotify = self._get_inotify()
+        all_directories = self._directories + self._recursive_directories
+        if inotify and not any(glob.has_magic(d) for d in all_directories):
+            # IN_NONBLOCK | IN_CLOEXEC
+            fd = inotify.inotify_init1(0o4000 | 0o2000000)
+            if fd >= 0:
+                self._fd = fd
+                self._add_watches()
+
+    @property
+    def polling(self) -> bool:
+        """``True`` if changes are detected by polling, ``False`` otherwise."""
+        return self._fd is None
+
+    @classmethod
+    def _get_inotify(cls):
+        if cls._inotify is None:
+            cls._inotify = False
+            if sys.platform.startswith("linux"):
+                try:
+                    import ctypes
+                    import ctypes.util
+
+                    libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+                    libc.inotify_init1, libc.inotify_add_watch
+                except (OSError, AttributeError):
+                    pass
+                else:
+                    cls._inotify = libc
+        return cls._inotify
+
+    def _add_watches(self):
+        directories = [self._get_existing(d) for d in self._directories]
+        for directory in self._recursive_directories:
+            directories.extend(self._get_recursive(self._get_existing(directory)))
+        for directory in directories:
+            path = os.fsencode(directory)
+            if self._inotify.inotify_add_watch(self._fd, path, self._mask) < 0:
+                # Adding a watch fails, for example, if the limit of watches
+                # has been reached. Polling is used in that case.
+                self.close()
+                return
+
+    def _get_existing(self, directory: str) -> str:
+        # Non-existing directories cannot be watched. Their closest existing
+        # parent is watched instead and watches are updated after changes.
+        directory = directory or os.curdir
+        while not os.path.isdir(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        return directory
+
+    def _get_recursive(self, directory: str) -> "list[str]":
+        directories = []
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if not (d.startswith(".") or d == "__pycache__")]
+            directories.append(root)
+        return directories or [directory]
+
+    def wait(self, timeout: "float | None" = None) -> bool:
+        """Waits until something changes or the ``timeout`` expires.
+
+        When inotify is used, returns ``True`` if something changed and
+        ``False`` if the ``timeout`` or the maximum wait time expired. When
+        polling, waits for the poll interval and always returns ``True``.
+        """
+        if self._fd is None:
+            interval = self.poll_interval
+        else:
+            interval = self.max_wait
+        if timeout is not None:
+            interval = min(interval, timeout)
+        if self._fd is None:
+            time.sleep(interval)
+            return True
+        ready, _, _ = select.select([self._fd], [], [], interval)
+        if not ready:
+            return False
+        try:
+            while os.read(self._fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+        self._add_watches()
+        return True
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
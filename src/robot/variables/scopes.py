@@ -59,7 +59,7 @@ class VariableScopes:
                 break
 
     def start_suite(self):
-        self._suite = self._global.copy()
+        self._suite = self._global.new_child()
         self._scopes.append(self._suite)
         self._suite_locals.append(NormalizedDict(ignore="_"))
         self._variables_set.start_suite()
@@ -72,7 +72,7 @@ class VariableScopes:
         self._variables_set.end_suite()
 
     def start_test(self):
-        self._test = self._suite.copy(update=self._suite_locals[-1])
+        self._test = self._suite.new_child(update=self._suite_locals[-1])
         self._scopes.append(self._test)
         self._variables_set.start_test()
 
@@ -83,7 +83,7 @@ class VariableScopes:
 
     def start_keyword(self):
         update = self._suite_locals[-1] if self._test else None
-        kw = self._suite.copy(update)
+        kw = self._suite.new_child(update)
         self._variables_set.start_keyword()
         self._variables_set.update(kw)
         self._scopes.append(kw)
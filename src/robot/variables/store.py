@@ -13,9 +13,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from collections.abc import Iterator, MutableMapping
+
 from robot.errors import DataError
 from robot.utils import (
-    DotDict, is_dict_like, is_list_like, NormalizedDict, NOT_SET, type_name
+    DotDict, is_dict_like, is_list_like, normalize, NormalizedDict, NOT_SET, type_name
 )
 
 from .notfound import variable_not_found
@@ -23,10 +25,107 @@ from .resolvable import GlobalVariableValue, Resolvable
 from .search import search_variable
 
 
+class VariableData(MutableMapping[str, object]):
+    """Mapping of variable names to values with copy-on-write layers.
+
+    Names are normalized similarly as with ``NormalizedDict(ignore="_")``.
+    A child created with :meth:`new_child` sees variables in its parents,
+    but changes are stored only in the child itself. Removing a variable
+    existing in a parent hides it from the child. Creating a child does not
+    depend on how many variables the parents contain.
+    """
+
+    def __init__(self, parent: "VariableData | None" = None):
+        self._data: "dict[str, object]" = {}
+        self._keys: "dict[str, str]" = {}
+        self._removed: "set[str]" = set()
+        self._parent = parent
+
+    def new_child(self) -> "VariableData":
+        return VariableData(self)
+
+    def copy(self) -> "VariableData":
+        """Returns a copy that is independent of this data and its parents."""
+        copy = VariableData()
+        for norm, (key, value) in self._visible().items():
+            copy._data[norm] = value
+            copy._keys[norm] = key
+        return copy
+
+    def _normalize(self, name: str) -> str:
+        return normalize(name, ignore="_")
+
+    def _find(self, norm: str) -> "VariableData | None":
+        layer = self
+        while layer is not None:
+            if norm in layer._data:
+                return layer
+            if norm in layer._removed:
+                return None
+            layer = layer._parent
+        return None
+
+    def _visible(self) -> "dict[str, tuple[str, object]]":
+        layers = []
+        layer = self
+        while layer is not None:
+            layers.append(layer)
+            layer = layer._parent
+        visible = {}
+        for layer in reversed(layers):
+            for norm in layer._removed:
+                visible.pop(norm, None)
+            for norm, value in layer._data.items():
+                visible[norm] = (layer._keys[norm], value)
+        return visible
+
+    def __getitem__(self, name: str) -> object:
+        if isinstance(name, str):
+            norm = self._normalize(name)
+            layer = self._find(norm)
+            if layer is not None:
+                return layer._data[norm]
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value: object):
+        norm = self._normalize(name)
+        if norm not in self._keys:
+            # Preserve the original name if the variable exists in a parent.
+            layer = self._find(norm)
+            self._keys[norm] = layer._keys[norm] if layer else name
+            self._removed.discard(norm)
+        self._data[norm] = value
+
+    def __delitem__(self, name: str):
+        if name not in self:
+            raise KeyError(name)
+        norm = self._normalize(name)
+        self._data.pop(norm, None)
+        self._keys.pop(norm, None)
+        if self._parent is not None:
+            self._removed.add(norm)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._find(self._normalize(name)) is not None
+
+    def __iter__(self) -> "Iterator[str]":
+        visible = self._visible()
+        return (visible[norm][0] for norm in sorted(visible))
+
+    def __len__(self) -> int:
+        return len(self._visible())
+
+    def clear(self):
+        self._data.clear()
+        self._keys.clear()
+        if self._parent is not None:
+            self._removed = set(self._parent._visible())
+
+
 class VariableStore:
 
     def __init__(self, variables):
-        self.data = NormalizedDict(ignore="_")
+        self.data = VariableData()
         self._variables = variables
 
     def resolve_delayed(self):
@@ -76,8 +76,20 @@ class Variables:
         self.store.clear()
 
     def copy(self, update=None):
+        return self._create(self.store.data.copy(), update)
+
+    def new_child(self, update=None):
+        """Returns variables that see these variables but store changes separately.
+
+        Creating a child does not depend on the number of variables. Changes
+        to these variables are visible in the child unless it has overridden
+        or removed them.
+        """
+        return self._create(self.store.data.new_child(), update)
+
+    def _create(self, data, update):
         variables = Variables()
-        variables.store.data = self.store.data.copy()
+        variables.store.data = data
         if update:
             for name, value in update.items():
                 if value is not None:
@@ -6,7 +6,7 @@ from pathlib import Path
 from robot.conf.settings import _BaseSettings, RebotSettings, RobotSettings
 from robot.errors import DataError
 from robot.utils import WINDOWS
-from robot.utils.asserts import assert_equal, assert_true
+from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
 
 
 class SettingWrapper(_BaseSettings):
@@ -53,6 +53,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
             "Log.html",
             "XUnit.xml",
             "DebugFile.txt",
+            "ResultDB.sqlite",
         ):
             name, ext = name.split(".")
             expected = Path(f"test.{ext}").absolute()
@@ -70,6 +71,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
             "Log.html",
             "XUnit.xml",
             "DebugFile.txt",
+            "ResultDB.sqlite",
         ):
             base, ext = name.split(".")
             for value in "test", Path("test"):
@@ -83,7 +85,7 @@ class TestRobotAndRebotSettings(unittest.TestCase):
                 )
 
     def test_result_files_as_none(self):
-        for name in "Output", "Report", "Log", "XUnit", "DebugFile":
+        for name in "Output", "Report", "Log", "XUnit", "DebugFile", "ResultDB":
             attr = (name[:-4] if name.endswith("File") else name).lower()
             for value in "None", "NONE", None:
                 for timestamp_outputs in True, False:
@@ -94,6 +96,21 @@ class TestRobotAndRebotSettings(unittest.TestCase):
                     if hasattr(settings, attr):
                         assert_equal(getattr(settings, attr), None)
 
+    def test_log_compression(self):
+        for settings in RobotSettings, RebotSettings:
+            assert_equal(settings().log_compression, (9, 0))
+            assert_equal(settings(logcompression="6").log_compression, (6, 0))
+            assert_equal(settings(logcompression="1:64").log_compression, (1, 65536))
+            for invalid in "10", "x", "6:x", "-1", "6:-1":
+                assert_raises_with_msg(
+                    DataError,
+                    f"Invalid value for option '--logcompression': Expected format "
+                    f"'level' or 'level:blocksize' where level is an integer from "
+                    f"0 to 9 and block size a non-negative integer, got '{invalid}'.",
+                    settings,
+                    logcompression=invalid,
+                )
+
     def test_output_dir(self):
         for value in ".", Path("."), Path(".").absolute():
             assert_equal(
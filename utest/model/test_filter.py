@@ -91,6 +91,22 @@ class TestFilterByExcludeTags(FilterBaseTest):
         self._test(Filter(exclude_tags=["t1 AND * NOT s* AND x"]), ["t2", "t3"], ["t1"])
 
 
+class TestFilterByIncludeAndExcludeTags(FilterBaseTest):
+
+    def test_include_and_exclude(self):
+        self._test(Filter(include_tags=["t*"], exclude_tags=["s22"]), ["t1", "t2"], [])
+
+    def test_filter_can_be_used_multiple_times(self):
+        filter = Filter(include_tags=["t1"], exclude_tags=["X"])
+        self._test(filter, ["t1"], [])
+        self._test(filter, ["t1"], [])
+        self._create_suite()
+        self.s22.visit(filter)
+        assert_equal([t.name for t in self.s22.tests], [])
+        self.s31.visit(filter)
+        assert_equal([t.name for t in self.s31.tests], ["t1"])
+
+
 class TestFilterByTestName(FilterBaseTest):
 
     def test_no_filtering(self):
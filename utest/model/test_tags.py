@@ -1,7 +1,7 @@
 import unittest
 import warnings
 
-from robot.model.tags import TagPattern, TagPatterns, Tags
+from robot.model.tags import TagIndex, TagPattern, TagPatterns, Tags
 from robot.utils import seq2str
 from robot.utils.asserts import (
     assert_equal, assert_false, assert_not_equal, assert_raises, assert_true
@@ -445,6 +445,83 @@ class TestTagPatterns(unittest.TestCase):
         assert_equal(list(d), [d[0], d[1]])
 
 
+class TestTagIndex(unittest.TestCase):
+    tags = [["a", "b"], ["A_1"], [], ["b", "c", "robot:x"], ["X Y"], ["a"]]
+
+    def setUp(self):
+        self.index = TagIndex(self.tags)
+
+    def test_add(self):
+        index = TagIndex()
+        assert_equal(index.add(["x"]), 0)
+        assert_equal(index.add([]), 1)
+        assert_equal(index.count, 2)
+        assert_equal(index.all, 0b11)
+
+    def test_items(self):
+        assert_equal(self.index.items(0), [])
+        assert_equal(self.index.items(0b101001), [0, 3, 5])
+        assert_equal(self.index.items(self.index.all), [0, 1, 2, 3, 4, 5])
+
+    def test_select_matches_match(self):
+        patterns = [
+            "a",
+            "A",
+            "a*",
+            "?",
+            "xy",
+            "robot:*",
+            "a AND b",
+            "a OR c",
+            "b AND NOT c",
+            "NOT a",
+            "NOT a NOT b",
+            "a* AND b OR c",
+            "*",
+            "nonex",
+            "",
+        ]
+        for pattern in patterns:
+            pattern = TagPattern.from_string(pattern)
+            expected = [i for i, tags in enumerate(self.tags) if pattern.match(tags)]
+            assert_equal(
+                self.index.items(pattern.select(self.index)), expected, pattern
+            )
+
+    def test_select_with_generated_patterns(self):
+        tags = [["0"], ["1"], ["0", "1"], []]
+        index = TagIndex(tags)
+        for pattern in AndOrPatternGenerator(max_length=5):
+            pattern = TagPattern.from_string(pattern)
+            expected = [i for i, t in enumerate(tags) if pattern.match(t)]
+            assert_equal(index.items(pattern.select(index)), expected, pattern)
+
+    def test_tag_patterns(self):
+        patterns = TagPatterns(["b", "x*"])
+        assert_equal(self.index.items(patterns.select(self.index)), [0, 3, 4])
+        assert_equal(TagPatterns().select(self.index), 0)
+
+    def test_select_with_custom_pattern(self):
+        class LongTag(TagPattern):
+            def match(self, tags):
+                return any(len(tag) > 1 for tag in tags)
+
+            def __iter__(self):
+                yield self
+
+            def __str__(self):
+                return "long"
+
+        assert_equal(self.index.items(LongTag().select(self.index)), [1, 3, 4])
+        assert_equal(LongTag().select(TagIndex()), 0)
+
+    def test_adding_items_after_selecting(self):
+        pattern = TagPattern.from_string("a")
+        assert_equal(self.index.items(pattern.select(self.index)), [0, 5])
+        self.index.add(["A"])
+        assert_equal(self.index.items(pattern.select(self.index)), [0, 5, 6])
+
+
 class AndOrPatternGenerator:
     tags = ["0", "1"]
     operators = ["OR", "AND"]
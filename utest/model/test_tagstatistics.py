@@ -153,6 +153,15 @@ class TestTagStatistics(unittest.TestCase):
         builder.add_test(TestCase(tags=["A", "B"]))
         assert_equal(len(list(builder.stats)), 2)
 
+    def test_combined_stats_are_updated_when_tests_added_after_access(self):
+        builder = TagStatisticsBuilder(combined=[("a OR b", "")])
+        builder.add_test(TestCase(tags=["a"], status="PASS"))
+        assert_equal(builder.stats.combined[0].passed, 1)
+        builder.add_test(TestCase(tags=["B"]))
+        builder.add_test(TestCase(tags=["c"]))
+        assert_equal(builder.stats.combined[0].passed, 1)
+        assert_equal(builder.stats.combined[0].failed, 1)
+
     def test_iter_sorting(self):
         builder = TagStatisticsBuilder(combined=[("c*", ""), ("xxx", "a title")])
         builder.add_test(TestCase(tags=["c1", "c2", "t1"]))
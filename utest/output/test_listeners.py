@@ -1,4 +1,5 @@
 import sys
+import threading
 import unittest
 
 from robot.errors import DataError
@@ -7,7 +8,9 @@ from robot.output import LOGGER
 from robot.output.listeners import ListenerFacade, Listeners
 from robot.running.outputcapture import OutputCapturer
 from robot.utils import DotDict
-from robot.utils.asserts import assert_equal, assert_raises_with_msg
+from robot.utils.asserts import (
+    assert_equal, assert_false, assert_raises_with_msg, assert_true
+)
 
 LOGGER.unregister_console_logger()
 
@@ -179,6 +182,155 @@ class TestListeners(unittest.TestCase):
         assert_equal(stdout.rstrip(), expected)
 
 
+class TestImplements(unittest.TestCase):
+
+    def test_v2(self):
+        listener = ListenerFacade.create(ListenAll())
+        for event in (
+            "start_suite",
+            "end_test",
+            "start_keyword",
+            "end_user_keyword",
+            "start_for_iteration",
+            "end_if_branch",
+            "start_var",
+            "output_file",
+            "close",
+        ):
+            assert_true(listener.implements(event), event)
+        for event in ("start_if", "end_try", "log_message", "message", "start_foo"):
+            assert_false(listener.implements(event), event)
+
+    def test_v3(self):
+        class V3:
+            def start_keyword(self, data, result):
+                pass
+
+            def result_file(self, kind, path):
+                pass
+
+        listener = ListenerFacade.create(V3())
+        for event in (
+            "start_user_keyword",
+            "start_library_keyword",
+            "start_invalid_keyword",
+            "output_file",
+            "xunit_file",
+        ):
+            assert_true(listener.implements(event), event)
+        for event in ("end_user_keyword", "start_if", "log_message", "message"):
+            assert_false(listener.implements(event), event)
+
+    def test_v3_body_item_fallback(self):
+        class V3:
+            def end_body_item(self, data, result):
+                pass
+
+        listener = ListenerFacade.create(V3())
+        for event in ("end_for", "end_if", "end_var", "end_library_keyword"):
+            assert_true(listener.implements(event), event)
+        for event in ("start_for", "end_suite", "end_test"):
+            assert_false(listener.implements(event), event)
+
+
+class TestBackground(unittest.TestCase):
+
+    def test_methods_are_called_in_background(self):
+        listener = BackgroundListener()
+        facade = ListenerFacade.create(listener)
+        assert_equal(facade.background, "BLOCK")
+        facade.start_test(TestMock(), TestMock(is_result=True))
+        facade.end_test(TestMock(), TestMock(is_result=True))
+        facade.close()
+        assert_equal(
+            [(name, arg) for name, arg, _ in listener.calls],
+            [("start_test", "testmock"), ("end_test", "testmock"), ("close", None)],
+        )
+        for _, _, thread in listener.calls:
+            assert_true(thread is not threading.current_thread())
+
+    def test_attributes_are_created_when_event_is_queued(self):
+        listener = BackgroundListener()
+        facade = ListenerFacade.create(listener)
+        result = TestMock(is_result=True)
+        facade.end_test(TestMock(), result)
+        result.status = "PASS"
+        facade.close()
+        assert_equal(listener.calls[0][1], "testmock")
+        assert_equal(listener.attrs[0]["status"], "FAIL")
+
+    def test_drop(self):
+        listener = BackgroundListener("drop", block=True)
+        facade = ListenerFacade.create(listener)
+        assert_equal(facade.background, "DROP")
+        facade._worker._queue.maxsize = 1
+        for _ in range(5):
+            facade.start_test(TestMock(), TestMock(is_result=True))
+        dropped = facade._worker.dropped
+        listener.release.set()
+        facade.close()
+        assert_true(dropped >= 3)
+        assert_equal(len(listener.calls), 5 - dropped + 1)
+
+    def test_invalid_mode(self):
+        assert_raises_with_msg(
+            DataError,
+            "Taking listener 'BackgroundListener' into use failed: "
+            "Invalid listener background mode 'INVALID'. "
+            "Valid values are 'BLOCK' and 'DROP'.",
+            ListenerFacade.create,
+            BackgroundListener("invalid"),
+        )
+
+    def test_only_listener_v2_supported(self):
+        listener = BackgroundListener()
+        listener.ROBOT_LISTENER_API_VERSION = 3
+        assert_raises_with_msg(
+            DataError,
+            "Taking listener 'BackgroundListener' into use failed: "
+            "Only listeners using the listener API version 2 can be run "
+            "in background.",
+            ListenerFacade.create,
+            listener,
+        )
+
+    def test_library_listeners_not_supported(self):
+        assert_raises_with_msg(
+            DataError,
+            "Taking listener 'BackgroundListener' into use failed: "
+            "Library listeners cannot be run in background.",
+            ListenerFacade.create,
+            BackgroundListener(),
+            library=object(),
+        )
+
+
+class BackgroundListener:
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, mode=True, block=False):
+        self.ROBOT_LISTENER_BACKGROUND = mode
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.calls = []
+        self.attrs = []
+
+    def start_test(self, name, attrs):
+        self.release.wait()
+        self._record("start_test", name, attrs)
+
+    def end_test(self, name, attrs):
+        self._record("end_test", name, attrs)
+
+    def close(self):
+        self._record("close")
+
+    def _record(self, name, arg=None, attrs=None):
+        self.calls.append((name, arg, threading.current_thread()))
+        self.attrs.append(attrs)
+
+
 class TestListenerPriority(unittest.TestCase):
 
     def test_no_priority(self):
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from robot.errors import DataError
 from robot.output.console.verbose import VerboseConsole
+from robot.output.listeners import LibraryListeners, Listeners
 from robot.output.logger import Logger
 from robot.output.loggerapi import LoggerApi
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
@@ -259,6 +260,39 @@ class TestLogger(unittest.TestCase):
         )
         assert_equal(list(logger), list(logger.end_loggers))
 
+    def test_listeners_are_called_only_with_implemented_events(self):
+        class Listener:
+            def __init__(self):
+                self.events = []
+
+            def start_test(self, data, result):
+                self.events.append(("start", data, result))
+
+        class Library:
+            def __init__(self, *listeners):
+                self.listeners = listeners
+
+        listener, lib_listener = Listener(), Listener()
+        library_listeners = LibraryListeners()
+        library_listeners.new_suite_scope()
+        logger = Logger(register_console_logger=False)
+        logger.register_listeners(Listeners([listener]), library_listeners)
+        assert_equal(len(logger._dispatch("start_test")), 1)
+        assert_equal(len(logger._dispatch("end_test")), 0)
+        library_listeners.register(Library(lib_listener))
+        assert_equal(len(logger._dispatch("start_test")), 2)
+        assert_equal(len(logger._dispatch("end_test")), 0)
+        logger.register_logger(LoggerMock())
+        assert_equal(len(logger._dispatch("start_test")), 3)
+        assert_equal(len(logger._dispatch("end_test")), 1)
+        logger.start_test("data", "result")
+        logger.end_test("data", "result")
+        assert_equal(listener.events, [("start", "data", "result")])
+        assert_equal(lib_listener.events, [("start", "data", "result")])
+        library_listeners.discard_suite_scope()
+        assert_equal(len(logger._dispatch("start_test")), 2)
+        assert_true(library_listeners.listeners is library_listeners.listeners)
+
     def test_custom_console_logger_by_object(self):
         class MyConsole:
             def start_suite(self, data, result):
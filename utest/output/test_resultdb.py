@@ -0,0 +1,125 @@
+import sqlite3
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from robot.running import TestSuite
+from robot.utils.asserts import assert_equal, assert_true
+
+
+def run(suite, path, **config):
+    suite.run(
+        output=None,
+        log=None,
+        report=None,
+        resultdb=path,
+        stdout=StringIO(),
+        stderr=StringIO(),
+        **config,
+    )
+
+
+def query(path, sql, *args):
+    connection = sqlite3.connect(path)
+    try:
+        return connection.execute(sql, args).fetchall()
+    finally:
+        connection.close()
+
+
+class TestResultDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name, "results.sqlite")
+        self.suite = TestSuite(name="Root")
+        child = self.suite.suites.create(name="Child")
+        child.tests.create(name="Passing", tags=["smoke", "X"]).body.create_keyword(
+            "Log", args=["Hello!"]
+        )
+        child.tests.create(name="Failing", tags=["x"]).body.create_keyword(
+            "Fail", args=["Oh no!"]
+        )
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_runs(self):
+        run(self.suite, self.path)
+        run(self.suite, self.path)
+        runs = query(self.path, "SELECT id, name, status, elapsed FROM runs")
+        assert_equal([r[:3] for r in runs], [(1, "Root", "FAIL"), (2, "Root", "FAIL")])
+        assert_true(all(r[3] >= 0 for r in runs))
+
+    def test_suites_and_tests(self):
+        run(self.suite, self.path)
+        assert_equal(
+            query(self.path, "SELECT id, full_name, status FROM suites ORDER BY id"),
+            [("s1", "Root", "FAIL"), ("s1-s1", "Root.Child", "FAIL")],
+        )
+        assert_equal(
+            query(self.path, "SELECT id, suite_id, name, status, message FROM tests"),
+            [
+                ("s1-s1-t1", "s1-s1", "Passing", "PASS", ""),
+                ("s1-s1-t2", "s1-s1", "Failing", "FAIL", "Oh no!"),
+            ],
+        )
+
+    def test_tags(self):
+        run(self.suite, self.path)
+        run(self.suite, self.path)
+        assert_equal(
+            query(
+                self.path,
+                "SELECT tags.run_id, tests.name FROM tags "
+                "JOIN tests USING (run_id) "
+                "WHERE tags.test_id = tests.id AND tag = ? COLLATE NOCASE "
+                "AND status = 'FAIL' ORDER BY tags.run_id",
+                "X",
+            ),
+            [(1, "Failing"), (2, "Failing")],
+        )
+
+    def test_keywords_are_not_written_by_default(self):
+        run(self.suite, self.path)
+        assert_equal(query(self.path, "SELECT * FROM keywords"), [])
+
+    def test_keywords(self):
+        run(self.suite, self.path, resultdbkeywords=True)
+        assert_equal(
+            query(self.path, "SELECT id, test_id, type, name, status FROM keywords"),
+            [
+                ("s1-s1-t1-k1", "s1-s1-t1", "KEYWORD", "BuiltIn.Log", "PASS"),
+                ("s1-s1-t2-k1", "s1-s1-t2", "KEYWORD", "BuiltIn.Fail", "FAIL"),
+            ],
+        )
+
+    def test_keywords_with_control_structures(self):
+        test = self.suite.suites[0].tests.create(name="Control")
+        if_ = test.body.create_if()
+        if_.body.create_branch(condition="True").body.create_keyword("No Operation")
+        try_ = test.body.create_try()
+        try_.body.create_branch().body.create_keyword("Fail", args=["Error"])
+        try_.body.create_branch(type="EXCEPT", patterns=["Error"])
+        run(self.suite, self.path, resultdbkeywords=True)
+        assert_equal(
+            query(
+                self.path,
+                "SELECT id, parent_id, type, status FROM keywords "
+                "WHERE test_id = 's1-s1-t3'",
+            ),
+            [
+                ("s1-s1-t3-k1-k1", "s1-s1-t3-k1", "KEYWORD", "PASS"),
+                ("s1-s1-t3-k1", "s1-s1-t3", "IF", "PASS"),
+                ("s1-s1-t3-k2-k1", "s1-s1-t3-k2", "KEYWORD", "FAIL"),
+                ("s1-s1-t3-k2", "s1-s1-t3", "TRY", "FAIL"),
+                ("s1-s1-t3-k3", "s1-s1-t3", "EXCEPT", "PASS"),
+            ],
+        )
+        assert_equal(len(query(self.path, "SELECT * FROM tests")), 3)
+        assert_equal(query(self.path, "SELECT status FROM runs"), [("FAIL",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ from pathlib import Path
 
 from robot.conf import Language, Languages
 from robot.parsing import get_init_tokens, get_resource_tokens, get_tokens, Token
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_raises_with_msg
 
 T = Token
 
@@ -3077,5 +3077,106 @@ Dokumentaatio    Documentation
         )
 
 
+class TestSections(unittest.TestCase):
+    data = """\
+Comment before first section
+*** Settings ***
+Test Template    Log
+*** Variables ***
+${X}    1
+*** Test Cases ***
+Test
+    Hello
+*** Keywords ***
+Keyword
+    No Operation
+*** Comments ***
+Comment
+"""
+
+    def test_only_settings(self):
+        expected = [
+            (T.SETTING_HEADER, "*** Settings ***", 2, 0),
+            (T.EOS, "", 2, 16),
+            (T.TEST_TEMPLATE, "Test Template", 3, 0),
+            (T.NAME, "Log", 3, 17),
+            (T.EOS, "", 3, 20),
+        ]
+        assert_tokens(self.data, expected, data_only=True, sections=["Settings"])
+        assert_tokens(self.data, expected, data_only=True, sections="settings")
+
+    def test_multiple_sections(self):
+        expected = [
+            (T.VARIABLE_HEADER, "*** Variables ***", 4, 0),
+            (T.EOS, "", 4, 17),
+            (T.VARIABLE, "${X}", 5, 0),
+            (T.ARGUMENT, "1", 5, 8),
+            (T.EOS, "", 5, 9),
+            (T.KEYWORD_HEADER, "*** Keywords ***", 9, 0),
+            (T.EOS, "", 9, 16),
+            (T.KEYWORD_NAME, "Keyword", 10, 0),
+            (T.EOS, "", 10, 7),
+            (T.KEYWORD, "No Operation", 11, 4),
+            (T.EOS, "", 11, 16),
+            (T.COMMENT_HEADER, "*** Comments ***", 12, 0),
+            (T.EOS, "", 12, 16),
+        ]
+        sections = ["VARIABLES", "key words", "Comments"]
+        assert_tokens(self.data, expected, data_only=True, sections=sections)
+
+    def test_settings_affect_other_sections_even_if_not_included(self):
+        expected = [
+            (T.COMMENT, "Comment before first section", 1, 0),
+            (T.EOL, "\n", 1, 28),
+            (T.EOS, "", 1, 29),
+            (T.TESTCASE_HEADER, "*** Test Cases ***", 6, 0),
+            (T.EOL, "\n", 6, 18),
+            (T.EOS, "", 6, 19),
+            (T.TESTCASE_NAME, "Test", 7, 0),
+            (T.EOL, "\n", 7, 4),
+            (T.EOS, "", 7, 5),
+            (T.SEPARATOR, "    ", 8, 0),
+            (T.ARGUMENT, "Hello", 8, 4),
+            (T.EOL, "\n", 8, 9),
+            (T.EOS, "", 8, 10),
+        ]
+        assert_tokens(self.data, expected, sections=["test_cases"])
+
+    def test_no_sections(self):
+        expected = [
+            (T.COMMENT, "Comment before first section", 1, 0),
+            (T.EOL, "\n", 1, 28),
+            (T.EOS, "", 1, 29),
+        ]
+        assert_tokens(self.data, expected, sections=[])
+        assert_tokens(self.data, expected, get_resource_tokens, sections=[])
+        assert_tokens(self.data, [], data_only=True, sections=[])
+
+    def test_translated_headers(self):
+        data = """\
+*** Asetukset ***
+Dokumentaatio    Documentation
+*** Avainsanat ***
+Keyword
+"""
+        expected = [
+            (T.KEYWORD_HEADER, "*** Avainsanat ***", 3, 0),
+            (T.EOS, "", 3, 18),
+            (T.KEYWORD_NAME, "Keyword", 4, 0),
+            (T.EOS, "", 4, 7),
+        ]
+        assert_tokens(data, expected, data_only=True, lang="fi", sections=["Keywords"])
+
+    def test_invalid_section(self):
+        assert_raises_with_msg(
+            ValueError,
+            "Invalid section 'Bad'. Valid sections: 'Settings', 'Variables', "
+            "'Test Cases', 'Tasks', 'Keywords' and 'Comments'.",
+            get_tokens,
+            self.data,
+            sections=["Settings", "Bad"],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -7,7 +7,8 @@ from pathlib import Path
 from parsing_test_utils import assert_model, remove_non_data
 
 from robot.parsing import (
-    get_model, get_resource_model, ModelTransformer, ModelVisitor, Token
+    CompositeVisitor, get_model, get_resource_model, ModelTransformer, ModelVisitor,
+    Token
 )
 from robot.parsing.model.blocks import (
     File, For, Group, If, ImplicitCommentSection, InvalidSection, Keyword,
@@ -189,6 +190,26 @@ class TestGetModel(unittest.TestCase):
             model = get_model(f)
         assert_model(model, EXPECTED)
 
+    def test_sections(self):
+        data = """\
+*** Settings ***
+Documentation    Example
+*** Test Cases ***
+Example
+    Keyword
+*** Keywords ***
+Keyword
+    No Operation
+"""
+        model = get_model(data, sections=["Settings", "Keywords"])
+        assert_equal(
+            [type(section) for section in model.sections],
+            [SettingSection, KeywordSection],
+        )
+        assert_equal(model.sections[1].body[0].name, "Keyword")
+        model = get_model(data, sections=[])
+        assert_equal(model.sections, [])
+
 
 class TestSaveModel(unittest.TestCase):
     different_path = PATH.parent / "different.robot"
@@ -2857,6 +2878,48 @@ Example
         )
         assert_model(model, expected)
 
+    def test_CompositeVisitor(self):
+
+        class NameCollector(ModelVisitor):
+
+            def __init__(self):
+                self.names = []
+
+            def visit_TestCaseName(self, node):
+                self.names.append(node.name)
+
+            def visit_KeywordName(self, node):
+                self.names.append(node.name)
+
+        class TypeCollector(ModelVisitor):
+
+            def __init__(self):
+                self.types = []
+
+            def visit_Block(self, node):
+                self.types.append(type(node).__name__)
+                self.generic_visit(node)
+
+            def visit_Statement(self, node):
+                self.types.append(node.type)
+
+        class TestCaseSkipper(TypeCollector):
+
+            def visit_TestCase(self, node):
+                self.types.append("SKIPPED")
+
+        model = get_model(DATA)
+        expected = [NameCollector(), TypeCollector(), TestCaseSkipper()]
+        for visitor in expected:
+            visitor.visit(model)
+        visitors = [NameCollector(), TypeCollector(), TestCaseSkipper()]
+        CompositeVisitor(*visitors).visit(model)
+        assert_equal(visitors[0].names, ["Example", "Keyword"])
+        assert_equal(visitors[0].names, expected[0].names)
+        assert_equal(visitors[1].types, expected[1].types)
+        assert_equal(visitors[2].types, expected[2].types)
+        assert_equal(visitors[2].types[3:6], ["TESTCASE HEADER", "EOL", "SKIPPED"])
+
     def test_visit_Return(self):
         class VisitReturn(ModelVisitor):
             def visit_Return(self, node):
@@ -1,9 +1,11 @@
 import unittest
+from pathlib import Path
 
 from robot.parsing.lexer.tokenizer import Tokenizer
 from robot.parsing.lexer.tokens import Token
 from robot.utils.asserts import assert_equal
 
+TESTDATA = (Path(__file__).parent / "../../atest/testdata").resolve()
 DATA = None
 SEPA = Token.SEPARATOR
 EOL = Token.EOL
@@ -1103,5 +1105,67 @@ class TestComments(unittest.TestCase):
         )
 
 
+class TestSimpleLines(unittest.TestCase):
+    lines = [
+        "",
+        "   ",
+        "\t",
+        "*** Test Cases ***",
+        "Name",
+        " Name",
+        "Name    Log    arg",
+        "    Log    arg",
+        "\tLog\targ",
+        "    Log    arg    ",
+        "    Log    arg\t\t",
+        "    Log \t arg",
+        "    Log\t arg",
+        "    ${x} =    Set Variable    ${y}[0]",
+        "    Log    ${x}",
+        "    Log    @{list}    &{dict}",
+        "\xa0\xa0Log\xa0\xa0arg",
+        "Log\u3000\u3000arg",
+        "    Log    one space",
+        "    Log    ..",
+        "    Log    ...",
+        "    Log    ....",
+        "    ...    arg",
+        "...    arg",
+        "...",
+        "    Log    # comment",
+        "    Log    arg#not comment",
+        "# comment",
+        "| Log | arg |",
+        "|Log",
+        "  |  Log",
+    ]
+
+    def test_simple_lines_produce_same_tokens_as_generic_code(self):
+        for line in self.lines:
+            for line_end in ["", "\n", "\r\n", "  \n"]:
+                self._verify(line + line_end)
+
+    def test_golden_tokens_from_test_data(self):
+        for path in sorted(TESTDATA.rglob("*.robot")):
+            try:
+                data = path.read_text(encoding="UTF-8")
+            except UnicodeDecodeError:
+                continue
+            for line in data.splitlines(keepends=True):
+                self._verify(line)
+
+    def _verify(self, line):
+        tokenizer = Tokenizer()
+        for data_only in [False, True]:
+            if data_only:
+                line = line.rstrip("\r\n")
+            simple = tokenizer._tokenize_simple_line(line, 1, not data_only)
+            if simple is None:
+                continue
+            tokens = tokenizer._tokenize_line(line, 1, not data_only)
+            expected = tokenizer._cleanup_tokens(tokens, data_only)
+            assert_equal(simple, expected, repr(line), values=False)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -72,6 +72,13 @@ class TestRemoveDataNotNeededInReport(unittest.TestCase):
         assert_equal(strings, tuple(" acd"))
         assert_equal(model, (0, 1, 2, 3, 3, 5, (0, 1, 2, 2, 4, 5)))
 
+    def test_remove_unused_strings_with_blocks(self):
+        strings = ("*", "*a", "@5:0:2", "@5:2:4", "@6:0:2", "block1", "block2")
+        model = (StringIndex(1), (StringIndex(3),))
+        model, strings = _KeywordRemover().remove_unused_strings(model, strings)
+        assert_equal(strings, ("*a", "@2:2:4", "block1"))
+        assert_equal(model, (0, (1,)))
+
     def test_through_jsexecutionresult(self):
         suite = (
             0, StringIndex(1), 2, 3, 4, StringIndex(5),
@@ -106,6 +113,24 @@ class TestRemoveDataNotNeededInReport(unittest.TestCase):
         assert_equal(result.min_level, "DEBUG")
         assert_true("errors" not in result.data)
 
+    def test_for_report_does_not_modify_original(self):
+        suite = (0, StringIndex(1), 2, 3, 4, StringIndex(2), (), (), ("kws",), 9)
+        result = JsExecutionResult(
+            suite=suite,
+            strings=tuple(" ABC"),
+            errors=(1, 2),
+            statistics={},
+            search_index={},
+        )
+        report = result.for_report()
+        assert_equal(report.strings, tuple("AB"))
+        assert_equal(report.suite[-2], ())
+        assert_true("errors" not in report.data)
+        assert_true("search_index" not in report.data)
+        assert_equal(result.strings, tuple(" ABC"))
+        assert_equal(result.suite, suite)
+        assert_equal(result.data["errors"], (1, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -585,6 +585,82 @@ class TestSplitting(unittest.TestCase):
             assert_true("*s1-t1-k1" not in res[1])
 
 
+class TestSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.suite = TestSuite(name="Root")
+        sub = self.suite.suites.create(name="Sub Suite")
+        tc = sub.tests.create(name="Passing", tags=["Smoke", "own_tag"], status="PASS")
+        tc.body.create_keyword(
+            name="Log", owner="BuiltIn", args=["Hello, world!"], status="PASS"
+        )
+        tc = sub.tests.create(
+            name="Failing", tags=["smoke"], status="FAIL", message="Oh no!"
+        )
+        kw = tc.body.create_keyword(name="Outer", status="FAIL")
+        kw.body.create_keyword(name="Inner", status="PASS")
+        inner = kw.body.create_keyword(name="Inner", status="FAIL")
+        inner.body.create_message("*HTML* <b>Failure</b> details", "FAIL", html=True)
+        self.suite.setup.config(name="Setup", status="PASS")
+
+    def _build(self):
+        context = JsBuildingContext()
+        SuiteBuilder(context).build(self.suite)
+        index = context.search_index.dump()
+        ids = index["ids"]
+        return {
+            "failures": [ids[i] for i in index["failures"]],
+            "tags": {t: [ids[i] for i in v] for t, v in index["tags"].items()},
+            "tokens": {t: [ids[i] for i in v] for t, v in index["tokens"].items()},
+        }
+
+    def test_failures_contain_tests_and_innermost_keywords(self):
+        assert_equal(self._build()["failures"], ["s1-s1-t2", "s1-s1-t2-k1-k2"])
+
+    def test_tags(self):
+        assert_equal(
+            self._build()["tags"],
+            {"smoke": ["s1-s1-t1", "s1-s1-t2"], "owntag": ["s1-s1-t1"]},
+        )
+
+    def test_tokens(self):
+        tokens = self._build()["tokens"]
+        assert_equal(tokens["root"], ["s1"])
+        assert_equal(tokens["setup"], ["s1"])
+        assert_equal(tokens["sub"], ["s1-s1"])
+        assert_equal(tokens["builtin"], ["s1-s1-t1"])
+        assert_equal(tokens["hello"], ["s1-s1-t1"])
+        assert_equal(tokens["no"], ["s1-s1-t2"])
+        assert_equal(tokens["inner"], ["s1-s1-t2"])
+        assert_equal(tokens["failure"], ["s1-s1-t2"])
+        assert_true("b" not in tokens)
+
+    def test_postings_are_sorted(self):
+        self.suite.suites[0].teardown.config(name="Log", status="PASS")
+        context = JsBuildingContext()
+        SuiteBuilder(context).build(self.suite)
+        index = context.search_index.dump()
+        ids = index["ids"]
+        assert_equal([ids[i] for i in index["tokens"]["log"]], ["s1-s1", "s1-s1-t1"])
+        for postings in [*index["tokens"].values(), *index["tags"].values()]:
+            assert_equal(list(postings), sorted(set(postings)))
+
+    def test_long_texts_are_truncated(self):
+        self.suite.suites[0].tests[1].message = "x" * 990 + " first second"
+        tokens = self._build()["tokens"]
+        assert_equal(tokens["first"], ["s1-s1-t2"])
+        assert_true("second" not in tokens)
+
+    def test_index_is_not_in_report(self):
+        from robot.reporting.jsmodelbuilders import JsModelBuilder
+        from robot.result import Result
+
+        result = JsModelBuilder().build_from(Result(suite=self.suite))
+        assert_true(result.data["search_index"]["failures"])
+        result.remove_data_not_needed_in_report()
+        assert_true("search_index" not in result.data)
+
+
 class TestPruneInput(unittest.TestCase):
 
     def setUp(self):
@@ -129,6 +129,7 @@ class StubSettings:
     log = None
     log_config = {}
     split_log = False
+    log_compression = (9, 0)
     report = None
     report_config = None
     output = None
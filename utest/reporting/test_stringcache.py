@@ -1,7 +1,9 @@
+import base64
 import random
 import string
 import time
 import unittest
+import zlib
 
 from robot.reporting.stringcache import StringCache, StringIndex
 from robot.utils.asserts import assert_equal, assert_false, assert_true
@@ -60,6 +62,63 @@ class TestStringCache(unittest.TestCase):
             assert_true(i1 is i2, f"not same: {i1} and {i2}")
 
 
+class TestBlockCompression(unittest.TestCase):
+
+    def _decode(self, dumped, index):
+        text = dumped[index]
+        if text.startswith("*"):
+            return text[1:]
+        if text.startswith("@"):
+            block, start, end = (int(i) for i in text[1:].split(":"))
+            block = self._decode(dumped, block).encode("UTF-16-LE")
+            return block[start * 2 : end * 2].decode("UTF-16-LE")
+        return zlib.decompress(base64.b64decode(text)).decode("UTF-8")
+
+    def test_long_strings_are_compressed_in_blocks(self):
+        cache = StringCache(block_size=1000)
+        strings = [f"{i} long string with some content " * 10 for i in range(20)]
+        strings.append("short")
+        indices = [cache.add(s) for s in strings]
+        dumped = cache.dump()
+        blocks = dumped[len(indices) + 1 :]
+        assert_equal(len(blocks), 5)
+        assert_equal(dumped[indices[-1]], "*short")
+        for index, string in zip(indices, strings):
+            assert_equal(self._decode(dumped, index), string)
+        assert_true(all(dumped[i].startswith("@") for i in indices[:-1]))
+
+    def test_offsets_are_in_utf16_code_units(self):
+        cache = StringCache(block_size=10000)
+        strings = ["\U0001F600 non-BMP" * 20, "\u00e4iti" * 50, "ascii" * 40]
+        indices = [cache.add(s) for s in strings]
+        dumped = cache.dump()
+        for index, string in zip(indices, strings):
+            assert_equal(self._decode(dumped, index), string)
+
+    def test_single_string_block_is_not_referenced(self):
+        cache = StringCache(block_size=100)
+        index = cache.add("long" * 100)
+        dumped = cache.dump()
+        assert_equal(len(dumped), 2)
+        assert_equal(dumped[index], StringCache()._encode("long" * 100))
+
+    def test_compression_level(self):
+        for level in 0, 1, 9:
+            cache = StringCache(compression_level=level, block_size=100)
+            indices = [cache.add(f"{i}" * 200) for i in range(5)]
+            dumped = cache.dump()
+            for i, index in enumerate(indices):
+                assert_equal(self._decode(dumped, index), f"{i}" * 200)
+
+    def test_single_thread(self):
+        cache = StringCache(block_size=100, workers=1)
+        indices = [cache.add(f"{i}" * 200) for i in range(5)]
+        dumped = cache.dump()
+        assert_equal(len(dumped), 6)
+        for i, index in enumerate(indices):
+            assert_equal(self._decode(dumped, index), f"{i}" * 200)
+
+
 class TestStringIndex(unittest.TestCase):
 
     def test_to_string(self):
@@ -249,6 +249,21 @@ class TestRemoveKeywords(unittest.TestCase):
         assert_equal(len(t2.body[0].messages), 1)
         assert_equal(len(t2.body[1].body), 1)
 
+    def test_remove_keywords_and_filter_messages(self):
+        suite = TestSuite()
+        test = suite.tests.create(status="FAIL")
+        kw = test.body.create_keyword(status="FAIL")
+        kw.body.create_message("debug", level="DEBUG")
+        kw.body.create_message("warn", level="WARN")
+        iteration = test.body.create_for().body.create_iteration()
+        for level in "DEBUG", "INFO", "WARN":
+            iteration.body.create_message(level, level=level)
+        test.body[-1].body.create_iteration().body.create_keyword(status="PASS")
+        suite.visit(SuiteConfigurer(remove_keywords=["passed", "for"], log_level="INFO"))
+        assert_equal([m.message for m in kw.messages], ["warn"])
+        assert_equal(len(test.body[1].body), 2)
+        assert_equal([m.message for m in iteration.body], ["INFO", "WARN"])
+
     def _suite_with_setup_and_teardown_and_test_with_keywords(self):
         suite = TestSuite()
         suite.setup.config(name="S", status="PASS").body.create_message("setup message")
@@ -2,10 +2,10 @@ import unittest
 from os.path import dirname, join
 
 from robot.api.parsing import get_model
-from robot.model import SuiteVisitor, TestSuite
+from robot.model import CompositeVisitor, SuiteVisitor, TestSuite
 from robot.result import ExecutionResult, TestSuite as ResultSuite
 from robot.running import TestSuite as RunningSuite
-from robot.utils.asserts import assert_equal
+from robot.utils.asserts import assert_equal, assert_true
 
 RESULT = ExecutionResult(join(dirname(__file__), "golden.xml"))
 
@@ -252,6 +252,60 @@ END GROUP
             )
 
 
+class TestCompositeVisitor(unittest.TestCase):
+
+    def test_equivalent_to_separate_visitors(self):
+        expected = Recorder()
+        RESULT.suite.visit(expected)
+        first, second = Recorder(), Recorder()
+        RESULT.suite.visit(CompositeVisitor(first, second))
+        assert_equal(first.visited, expected.visited)
+        assert_equal(second.visited, expected.visited)
+
+    def test_start_can_stop_visiting_for_one_visitor(self):
+        stopping, recorder = StartKeywordStopping(), Recorder()
+        RESULT.suite.visit(CompositeVisitor(stopping, recorder))
+        assert_true("START MESSAGE" in recorder.visited)
+
+    def test_custom_visit_method(self):
+        class VisitTest(SuiteVisitor):
+            visited = 0
+
+            def visit_test(self, test):
+                self.visited += 1
+
+            def start_keyword(self, keyword):
+                raise AssertionError
+
+        suite = TestSuite(name="S")
+        suite.tests.create(name="T").body.create_keyword(name="K")
+        custom, recorder = VisitTest(), Recorder()
+        suite.visit(CompositeVisitor(custom, recorder))
+        assert_equal(custom.visited, 1)
+        assert_equal(
+            recorder.visited,
+            ["START S", "START T", "START KEYWORD", "END KEYWORD", "END T", "END S"],
+        )
+
+    def test_visitors_are_called_in_order(self):
+        class Visitor(SuiteVisitor):
+            def __init__(self, name, visited):
+                self.name = name
+                self.visited = visited
+
+            def start_test(self, test):
+                self.visited.append(f"START {self.name}")
+
+            def end_test(self, test):
+                self.visited.append(f"END {self.name}")
+
+        visited = []
+        suite = TestSuite()
+        suite.tests.create()
+        suite.visit(CompositeVisitor(Visitor("A", visited), Visitor("B", visited)))
+        assert_equal(visited, ["START A", "START B", "END A", "END B"])
+
+
 class StartSuiteStopping(SuiteVisitor):
 
     def start_suite(self, suite):
@@ -333,5 +387,29 @@ class ItemAdder(SuiteVisitor):
             keyword.parent.body.create_keyword(name="Added by end_keyword")
 
 
+class Recorder(SuiteVisitor):
+
+    def __init__(self):
+        self.visited = []
+
+    def start_suite(self, suite):
+        self.visited.append(f"START {suite.name}")
+
+    def end_suite(self, suite):
+        self.visited.append(f"END {suite.name}")
+
+    def start_test(self, test):
+        self.visited.append(f"START {test.name}")
+
+    def end_test(self, test):
+        self.visited.append(f"END {test.name}")
+
+    def start_body_item(self, item):
+        self.visited.append(f"START {item.type}")
+
+    def end_body_item(self, item):
+        self.visited.append(f"END {item.type}")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
 from robot.errors import DataError
-from robot.running import TestSuite, TestSuiteBuilder
+from robot.running import ResourceFileBuilder, TestSuite, TestSuiteBuilder
+from robot.running.builder import ModelCache
 from robot.utils import Importer
 from robot.utils.asserts import assert_equal, assert_raises, assert_true
 
@@ -188,5 +191,54 @@ class TestTemplates(unittest.TestCase):
         assert_equal(test.template, "Expect Exactly Three Args")
 
 
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tempdir.name)
+        self._write("suite.robot", "*** Test Cases ***\nTest 1\n    No Operation\n")
+        self._write("keywords.resource", "*** Keywords ***\nKeyword 1\n    No Operation\n")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_unchanged_files_are_not_parsed_again(self):
+        with ModelCache().enabled():
+            assert_equal(self._parse(), ("Test 1", "Keyword 1"))
+            self._write("suite.robot", "*** Test Cases ***\nTest 2\n    No Operation\n")
+            self._write("keywords.resource", "*** Keywords ***\nKeyword 2\n    Log\n")
+            assert_equal(self._parse(), ("Test 1", "Keyword 2"))
+            self._touch("suite.robot")
+            assert_equal(self._parse(), ("Test 2", "Keyword 2"))
+
+    def test_cache_is_used_only_when_enabled(self):
+        cache = ModelCache()
+        with cache.enabled():
+            assert_true(ModelCache.current is cache)
+            self._parse()
+        assert_true(ModelCache.current is None)
+        self._write("suite.robot", "*** Test Cases ***\nTest 2\n    No Operation\n")
+        assert_equal(self._parse(), ("Test 2", "Keyword 1"))
+
+    def _parse(self):
+        suite = TestSuiteBuilder().build(self.dir / "suite.robot")
+        resource = ResourceFileBuilder().build(self.dir / "keywords.resource")
+        return suite.tests[0].name, resource.keywords[0].name
+
+    def _write(self, name, content):
+        # Modification time is preserved to be able to test that only
+        # changing it causes parsing the file again.
+        path = self.dir / name
+        stat = path.stat() if path.exists() else None
+        path.write_text(content, encoding="UTF-8")
+        if stat:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    def _touch(self, name):
+        stat = (self.dir / name).stat()
+        mtime = stat.st_mtime_ns + 1_000_000_000
+        os.utime(self.dir / name, ns=(mtime, mtime))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,219 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from io import StringIO
+from pathlib import Path
+
+from robot.errors import DataError
+from robot.result import ExecutionResult
+from robot.running import TestSuiteBuilder
+from robot.running.changedtests import ChangedTests
+from robot.utils.asserts import (
+    assert_equal, assert_raises, assert_raises_with_msg, assert_true
+)
+
+FILES = {
+    "__init__.robot": """\
+*** Settings ***
+Suite Setup    Log    Hello
+""",
+    "common.resource": """\
+*** Settings ***
+Library    mylib.py
+Resource    ${CURDIR}/nested.resource
+""",
+    "nested.resource": """\
+*** Keywords ***
+Nested
+    No Operation
+""",
+    "mylib.py": """\
+def my_keyword():
+    pass
+""",
+    "a.robot": """\
+*** Settings ***
+Resource    common.resource
+
+*** Test Cases ***
+A1
+    My Keyword
+A2
+    Nested
+""",
+    "b.robot": """\
+*** Test Cases ***
+B1
+    Fail    Expected
+B2
+    No Operation
+""",
+    "sub/c.robot": """\
+*** Settings ***
+Library    Collections
+Variables    ${NONEXISTING}.py
+
+*** Test Cases ***
+C1
+    No Operation
+""",
+}
+
+
+class TestChangedTests(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tempdir.name, "tests")
+        past = time.time() - 60
+        for name, content in FILES.items():
+            path = self.dir / name
+            path.parent.mkdir(exist_ok=True, parents=True)
+            path.write_text(content, encoding="UTF-8")
+            os.utime(path, (past, past))
+        self.output = Path(self.tempdir.name, "output.xml")
+        self._run(self._build(), self.output)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_nothing_changed(self):
+        assert_equal(self._select(), ["C1"])
+
+    def test_nothing_changed_is_error(self):
+        self.dir.joinpath("sub/c.robot").unlink()
+        assert_raises_with_msg(
+            DataError,
+            f"No tests changed since '{self.output}'.",
+            ChangedTests(self.output).select,
+            self._build(),
+        )
+
+    def test_nothing_changed_with_empty_suite_ok(self):
+        self.dir.joinpath("sub/c.robot").unlink()
+        suite = self._build()
+        ChangedTests(self.output).select(suite, empty_suite_ok=True)
+        assert_equal(suite.test_count, 0)
+
+    def test_suite_file_changed(self):
+        self._modify("b.robot")
+        assert_equal(self._select(), ["B1", "B2", "C1"])
+
+    def test_init_file_changed(self):
+        self._modify("__init__.robot")
+        assert_equal(self._select(), ["A1", "A2", "B1", "B2", "C1"])
+
+    def test_resource_file_changed(self):
+        self._modify("nested.resource")
+        assert_equal(self._select(), ["A1", "A2", "C1"])
+
+    def test_library_changed(self):
+        self._modify("mylib.py")
+        assert_equal(self._select(), ["A1", "A2", "C1"])
+
+    def test_new_test(self):
+        path = self.dir / "b.robot"
+        mtime = path.stat().st_mtime
+        with open(path, "a", encoding="UTF-8") as file:
+            file.write("B3\n    No Operation\n")
+        os.utime(path, (mtime, mtime))
+        assert_equal(self._select(), ["B3", "C1"])
+
+    def test_merge(self):
+        self._modify("b.robot")
+        self.dir.joinpath("sub/c.robot").unlink()
+        changed = ChangedTests(self.output)
+        suite = self._build()
+        changed.select(suite)
+        result = changed.merge(self._run(suite, self.dir.parent / "new.xml"))
+        tests = list(result.suite.all_tests)
+        assert_equal([t.name for t in tests], ["A1", "A2", "B1", "B2"])
+        assert_equal([t.status for t in tests], ["PASS", "PASS", "FAIL", "PASS"])
+        assert_equal(result.suite.statistics.failed, 1)
+        assert_equal([s.name for s in result.suite.suites], ["A", "B"])
+        assert_equal(result.suite.suites[1].tests[0].message, "Expected")
+        assert_true(result.suite.start_time > changed.previous.generation_time)
+
+    def test_merge_does_not_discard_results_of_filtered_tests(self):
+        self._modify("b.robot")
+        changed = ChangedTests(self.output)
+        suite = self._build()
+        changed.record(suite)
+        suite.configure(include_tags=["nomatch"], empty_suite_ok=True)
+        changed.select(suite, empty_suite_ok=True)
+        result = changed.merge(self._run(suite, self.dir.parent / "new.xml"))
+        tests = list(result.suite.all_tests)
+        assert_equal([t.name for t in tests], ["A1", "A2", "B1", "B2", "C1"])
+        assert_equal(result.suite.statistics.failed, 1)
+
+    def test_content_hashes(self):
+        new = self.dir.parent / "new.xml"
+        changed = ChangedTests(self.output)
+        suite = self._build()
+        changed.select(suite)
+        changed.merge(self._run(suite, new)).save(new)
+        changed.save_hashes(new)
+        path = self.dir / "b.robot"
+        past = path.stat().st_mtime
+        path.write_text(FILES["b.robot"].replace("Expected", "Changed"), "UTF-8")
+        os.utime(path, (past, past))
+        self._modify("a.robot")
+        self._modify("mylib.py")
+        assert_equal(self._select(new), ["B1", "B2", "C1"])
+        Path(f"{new}.hashes.json").unlink()
+        assert_equal(self._select(new), ["A1", "A2", "C1"])
+
+    def test_content_hashes_are_ignored_if_output_is_overwritten(self):
+        changed = ChangedTests(self.output)
+        changed.select(self._build())
+        changed.save_hashes(self.output)
+        self._modify("b.robot")
+        assert_equal(self._select(), ["C1"])
+        self._run(self._build(), self.output)
+        self._modify("b.robot")
+        assert_equal(self._select(), ["B1", "B2", "C1"])
+
+    def test_modules_are_not_imported_when_finding_them(self):
+        package = self.dir / "mypackage"
+        package.mkdir()
+        (package / "__init__.py").write_text("raise RuntimeError", "UTF-8")
+        (package / "mylib.py").write_text("", "UTF-8")
+        sys.path.insert(0, str(self.dir))
+        try:
+            changed = ChangedTests(self.output)
+            assert_equal(
+                changed._find_module("mypackage.mylib.MyLib"), package / "mylib.py"
+            )
+            assert_equal(changed._find_module("mypackage"), package / "__init__.py")
+            assert_true("mypackage" not in sys.modules)
+            assert_raises(DataError, changed._find_module, "nonexisting")
+        finally:
+            sys.path.remove(str(self.dir))
+
+    def test_invalid_output(self):
+        path = Path(self.tempdir.name, "invalid.xml")
+        path.write_text("<bad>", encoding="UTF-8")
+        error = assert_raises(DataError, ChangedTests, path)
+        assert_true(str(error).startswith(f"Reading earlier output '{path}' failed: "))
+
+    def _build(self):
+        return TestSuiteBuilder().build(self.dir)
+
+    def _run(self, suite, output):
+        suite.run(output=output, stdout=StringIO(), stderr=StringIO())
+        return ExecutionResult(output)
+
+    def _modify(self, name):
+        future = time.time() + 60
+        os.utime(self.dir / name, (future, future))
+
+    def _select(self, output=None):
+        suite = self._build()
+        ChangedTests(output or self.output).select(suite)
+        return [test.name for test in suite.all_tests]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ from classes import (
 
 from robot.errors import DataError
 from robot.running import Keyword as KeywordData
+from robot.running.librarykeyword import KEYWORD_INFO_CACHE
 from robot.running.testlibraries import (
     ClassLibrary, DynamicLibrary, ModuleLibrary, TestLibrary
 )
@@ -408,6 +409,20 @@ class TestKeywords(unittest.TestCase):
         assert_equal(instance.kw_accessed, 44)
         assert_equal(instance.kw_called, 42)
 
+    def test_keyword_information_is_cached(self):
+        lib1 = TestLibrary.from_name("classes.ArgInfoLibrary")
+        lib2 = TestLibrary.from_name("classes.ArgInfoLibrary", "Other")
+        assert_true(lib1.keywords)
+        for kw1, kw2 in zip(lib1.keywords, lib2.keywords):
+            func = kw1.method.__func__
+            assert_true(func in KEYWORD_INFO_CACHE._cache)
+            assert_equal(kw1.name, kw2.name)
+            assert_equal(kw1.doc, kw2.doc)
+            assert_equal(kw1.args.argument_names, kw2.args.argument_names)
+            assert_true(kw1.args is not kw2.args)
+            assert_equal(kw1.args.name, kw1.full_name)
+            assert_equal(kw2.args.name, kw2.full_name)
+
 
 class TestDynamicLibrary(unittest.TestCase):
 
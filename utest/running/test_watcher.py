@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from robot.running.watcher import FileWatcher, unload_modules
+from robot.utils.asserts import assert_equal, assert_false, assert_true
+
+
+class TestFileWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tempdir.name)
+        for name in ["a.robot", "b.resource", "lib.py", "other.txt", "sub/c.robot"]:
+            self._create(name)
+        self.watcher = FileWatcher([self.dir], interval=0.01)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_no_changes(self):
+        assert_equal(self.watcher.changes(), [])
+
+    def test_modified(self):
+        self._modify("b.resource")
+        self._modify("sub/c.robot")
+        assert_equal(
+            self.watcher.changes(),
+            [self.dir / "b.resource", self.dir / "sub/c.robot"],
+        )
+        assert_equal(self.watcher.changes(), [])
+
+    def test_added_and_removed(self):
+        self._create("new.py")
+        (self.dir / "a.robot").unlink()
+        assert_equal(self.watcher.changes(), [self.dir / "a.robot", self.dir / "new.py"])
+
+    def test_other_extensions_are_ignored(self):
+        self._modify("other.txt")
+        self._create("new.txt")
+        assert_equal(self.watcher.changes(), [])
+
+    def test_explicitly_given_files_are_watched_regardless_extension(self):
+        watcher = FileWatcher([self.dir / "other.txt"])
+        self._modify("other.txt")
+        assert_equal(watcher.changes(), [self.dir / "other.txt"])
+
+    def test_reset(self):
+        self._modify("lib.py")
+        self.watcher.reset()
+        assert_equal(self.watcher.changes(), [])
+
+    def test_wait(self):
+        self._modify("lib.py")
+        assert_equal(self.watcher.wait(), [self.dir / "lib.py"])
+
+    def _create(self, name):
+        path = self.dir / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("", encoding="UTF-8")
+        past = time.time() - 60
+        os.utime(path, (past, past))
+
+    def _modify(self, name):
+        now = time.time()
+        os.utime(self.dir / name, (now, now))
+
+
+class TestUnloadModules(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name, "watcher_test_module.py")
+        self.path.write_text("VALUE = 1\n", encoding="UTF-8")
+        sys.path.insert(0, self.tempdir.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tempdir.name)
+        sys.modules.pop("watcher_test_module", None)
+        self.tempdir.cleanup()
+
+    def test_unload(self):
+        import watcher_test_module  # noqa: F401
+
+        assert_equal(unload_modules([self.path]), ["watcher_test_module"])
+        assert_false("watcher_test_module" in sys.modules)
+
+    def test_unrelated_modules_are_not_unloaded(self):
+        import watcher_test_module  # noqa: F401
+
+        assert_equal(unload_modules([self.path.with_name("other.py")]), [])
+        assert_true("watcher_test_module" in sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,17 @@
+import json
 import unittest
 from decimal import Decimal
 from io import StringIO
 
-from robot.utils import JsonLoader
-from robot.utils.asserts import assert_equal, assert_raises_with_msg, assert_true
+from robot.utils import JsonDumper, JsonLoader
+from robot.utils.asserts import (
+    assert_equal, assert_false, assert_raises_with_msg, assert_true
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class TestJsonLoader(unittest.TestCase):
@@ -51,5 +59,111 @@ class TestJsonLoader(unittest.TestCase):
         )
 
 
+@unittest.skipIf(orjson is None, "Requires orjson")
+class TestFastJson(unittest.TestCase):
+
+    def test_loader_uses_orjson_only_without_config(self):
+        assert_true(JsonLoader().fast)
+        assert_true(JsonLoader(object_hook=None).fast)
+        assert_false(JsonLoader(parse_float=Decimal).fast)
+
+    def test_load(self):
+        data = '{"x": [1, {"y": [2, []]}], "z": "å"}'
+        assert_equal(JsonLoader().load(data), {"x": [1, {"y": [2, []]}], "z": "å"})
+        assert_equal(JsonLoader().load(StringIO(data))["z"], "å")
+
+    def test_duplicate_lists_are_merged(self):
+        data = JsonLoader().load(TestJsonLoader.data)
+        assert_equal(data["x"], 2.2)
+        assert_equal(data["y"], [1, 2, 3])
+        data = JsonLoader().load('{"a":{"b":[1],"c":"x","b":[2]},"d":[]}')
+        assert_equal(data, {"a": {"b": [1, 2], "c": "x"}, "d": []})
+
+    def test_strings_looking_like_lists(self):
+        data = JsonLoader().load('{"x": "\\":[", "y": ["\\": ["]}')
+        assert_equal(data, {"x": '":[', "y": ['": [']})
+
+    def test_data_not_supported_by_orjson(self):
+        data = JsonLoader().load('{"x": NaN, "y": 123456789012345678901234567890}')
+        assert_true(data["x"] != data["x"])
+        assert_equal(data["y"], 123456789012345678901234567890)
+
+    def test_invalid_data(self):
+        assert_raises_with_msg(
+            ValueError,
+            "Invalid JSON data: JSONDecodeError: Expecting value: line 1 column 1 (char 0)",
+            JsonLoader().load,
+            StringIO("bad"),
+        )
+
+    def test_dumper_uses_orjson_only_with_compatible_config(self):
+        for config in [
+            {"ensure_ascii": False, "separators": (",", ":")},
+            {"ensure_ascii": True, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 2},
+            {"ensure_ascii": False, "indent": 2, "separators": (",", ": ")},
+            {"ensure_ascii": False, "indent": 0, "separators": (",", ":")},
+            {"indent": 0},
+        ]:
+            assert_true(JsonDumper(**config).fast_option is not None, config)
+        for config in [
+            {},
+            {"ensure_ascii": False},
+            {"ensure_ascii": False, "indent": 4},
+            {"ensure_ascii": False, "indent": 2, "separators": (", ", ": ")},
+            {"ensure_ascii": False, "separators": (",", ":"), "sort_keys": True},
+        ]:
+            assert_equal(JsonDumper(**config).fast_option, None, config)
+
+    def test_dump(self):
+        data = {
+            "x": [1, 2.5, None, True, [], {}],
+            "y": {"å": "ä\n", "z": [{"a": "𝄞"}]},
+            "keys": {'k\\': '"', "a": 'b": c', "b": 'c\\": d'},
+        }
+        for config in [
+            {"ensure_ascii": False, "separators": (",", ":")},
+            {"ensure_ascii": True, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 2},
+            {"ensure_ascii": False, "indent": 0, "separators": (",", ":")},
+            {"ensure_ascii": True, "indent": 0, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 0},
+        ]:
+            output = StringIO()
+            JsonDumper(**config).dump(data, output)
+            assert_equal(output.getvalue(), json.dumps(data, **config))
+            assert_equal(JsonDumper(**config).dump(data), json.dumps(data, **config))
+
+    def test_dump_non_finite_floats(self):
+        data = {"x": [float("nan"), float("inf"), None], "y": -float("inf")}
+        for config in [
+            {"ensure_ascii": False, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 0, "separators": (",", ":")},
+        ]:
+            assert_equal(JsonDumper(**config).dump(data), json.dumps(data, **config))
+
+    def test_dump_floats(self):
+        floats = [0.1, 100.0, 1e-4, 7.8e-05, -1e-05, 1.2e-06, 1e-07, 1.5e-10]
+        floats += [1e15, 1e16, -1.2e16, 1.2345678901234568e17, 1e300, 5e-324]
+        data = {"x": floats, "y": 7.8e-05, "z": "1e16\n", "0.00001": ["1e-7"]}
+        for config in [
+            {"ensure_ascii": False, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 2},
+            {"ensure_ascii": False, "indent": 0, "separators": (",", ":")},
+            {"ensure_ascii": False, "indent": 0},
+        ]:
+            assert_equal(JsonDumper(**config).dump(data), json.dumps(data, **config))
+        data = {"x": [0.1, 12.5, 1e15], "y": "1e16"}
+        dumper = JsonDumper(ensure_ascii=False, separators=(",", ":"))
+        assert_equal(dumper._fast_encode(data), orjson.dumps(data))
+        dumper = JsonDumper(ensure_ascii=False, indent=2)
+        assert_equal(dumper._fast_encode({"x": 1e-05}), b'{\n  "x": 1e-05\n}')
+
+    def test_dump_data_not_supported_by_orjson(self):
+        data = {1: 123456789012345678901234567890}
+        dumper = JsonDumper(ensure_ascii=False, separators=(",", ":"))
+        assert_equal(dumper.dump(data), '{"1":123456789012345678901234567890}')
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,7 @@
+import re
 import unittest
 
-from robot.utils import eq, Matcher, MultiMatcher
+from robot.utils import compile_pattern, eq, Matcher, MultiMatcher
 from robot.utils.asserts import assert_equal, assert_raises
 
 
@@ -15,6 +16,35 @@ class TestEq(unittest.TestCase):
         assert not eq("foo", "foo ", spaceless=False)
 
 
+class TestCompilePattern(unittest.TestCase):
+
+    def test_regexp(self):
+        pattern = compile_pattern("a.c", re.IGNORECASE)
+        assert pattern.fullmatch("ABC")
+        assert not pattern.fullmatch("ABCD")
+
+    def test_glob(self):
+        pattern = compile_pattern("a?c*", regexp=False)
+        assert pattern.match("abc")
+        assert pattern.match("abc\ndef")
+        assert not pattern.match("ab")
+        assert not pattern.match("xabc")
+
+    def test_bytes(self):
+        assert compile_pattern(b"a.c").fullmatch(b"abc")
+        assert compile_pattern(b"\xe4?", regexp=False).match(b"\xe4x")
+        assert not compile_pattern(b"\xe4?", regexp=False).match(b"\xe4xx")
+
+    def test_compiled_patterns_are_cached(self):
+        assert compile_pattern("x+y") is compile_pattern("x+y")
+        assert compile_pattern("x+y") is not compile_pattern("x+y", re.DOTALL)
+        assert compile_pattern("x+y") is not compile_pattern("x+y", regexp=False)
+        assert compile_pattern("x+y") is not compile_pattern(b"x+y")
+
+    def test_invalid_pattern(self):
+        assert_raises(re.error, compile_pattern, "(")
+
+
 class TestMatcher(unittest.TestCase):
 
     def test_matcher(self):
@@ -195,6 +225,27 @@ class TestMultiMatcher(unittest.TestCase):
         assert matcher.match("__::FOO::__")
         assert not matcher.match("bar")
 
+    def test_many_patterns_match_same_as_individual_matchers(self):
+        patterns = ["lit", "Other Lit", "a*b*c", "x?", "[xy]z", "*end", "", "["]
+        matcher = MultiMatcher(patterns, caseless=False, spaceless=False)
+        for string in [
+            "lit",
+            "LIT",
+            "OtherLit",
+            "Other Lit",
+            "a-b-c",
+            "ab",
+            "xx",
+            "yz",
+            "the end",
+            "",
+            "[",
+            "nothing",
+            "a\nb\nc",
+        ]:
+            expected = any(m.match(string) for m in matcher)
+            assert_equal(matcher.match(string), expected, repr(string))
+
     def test_do_not_match_when_no_patterns_by_default(self):
         assert not MultiMatcher().match("xxx")
 
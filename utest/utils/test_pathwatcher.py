@@ -0,0 +1,110 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from robot.utils import PathWatcher
+from robot.utils.asserts import assert_equal, assert_false, assert_raises, assert_true
+
+INOTIFY = sys.platform.startswith("linux")
+
+
+class FailingInotify:
+
+    def __init__(self):
+        self.fds = []
+
+    def inotify_init1(self, flags):
+        read, write = os.pipe()
+        os.close(write)
+        self.fds.append(read)
+        return read
+
+    def inotify_add_watch(self, fd, path, mask):
+        return -1
+
+
+class TestPathWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_polling_is_used_if_adding_watch_fails(self):
+        inotify = FailingInotify()
+        original = PathWatcher._inotify
+        PathWatcher._inotify = inotify
+        try:
+            with PathWatcher([self.dir]) as watcher:
+                assert_true(watcher.polling)
+                start = time.time()
+                assert_true(watcher.wait(timeout=5))
+                assert_true(time.time() - start < 1)
+        finally:
+            PathWatcher._inotify = original
+        assert_equal(len(inotify.fds), 1)
+        assert_raises(OSError, os.fstat, inotify.fds[0])
+
+    def test_polling_with_wildcards(self):
+        with PathWatcher([self.dir / "*"], poll_interval=0.01) as watcher:
+            assert_true(watcher.polling)
+            assert_true(watcher.wait())
+
+    @unittest.skipIf(not INOTIFY, "Requires inotify.")
+    def test_inotify(self):
+        with PathWatcher([self.dir]) as watcher:
+            assert_false(watcher.polling)
+            assert_false(watcher.wait(timeout=0))
+            self._create("file.txt")
+            start = time.time()
+            assert_true(watcher.wait(timeout=5))
+            assert_true(time.time() - start < 1)
+
+    @unittest.skipIf(not INOTIFY, "Requires inotify.")
+    def test_non_existing_directory(self):
+        with PathWatcher([self.dir / "new"]) as watcher:
+            self._create("new/file.txt")
+            assert_true(watcher.wait(timeout=5))
+            assert_false(watcher.wait(timeout=0))
+            self._create("new/file.txt")
+            assert_true(watcher.wait(timeout=5))
+
+    @unittest.skipIf(not INOTIFY, "Requires inotify.")
+    def test_relative_directory(self):
+        with PathWatcher([""]) as watcher:
+            assert_false(watcher.polling)
+
+    @unittest.skipIf(not INOTIFY, "Requires inotify.")
+    def test_recursive(self):
+        (self.dir / "sub" / "deeper").mkdir(parents=True)
+        (self.dir / ".hidden").mkdir()
+        with PathWatcher(recursive_directories=[self.dir]) as watcher:
+            self._create(".hidden/file.txt")
+            assert_false(watcher.wait(timeout=0.1))
+            self._create("sub/deeper/file.txt")
+            assert_true(watcher.wait(timeout=5))
+            self._create("sub/new/file.txt")
+            assert_true(watcher.wait(timeout=5))
+            self._create("sub/new/file.txt")
+            assert_true(watcher.wait(timeout=5))
+
+    @unittest.skipIf(not INOTIFY, "Requires inotify.")
+    def test_not_recursive(self):
+        (self.dir / "sub").mkdir()
+        with PathWatcher([self.dir]) as watcher:
+            self._create("sub/file.txt")
+            assert_false(watcher.wait(timeout=0.1))
+
+    def _create(self, name):
+        path = self.dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="UTF-8")
+
+
+if __name__ == "__main__":
+    unittest.main()
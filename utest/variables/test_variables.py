@@ -1,7 +1,7 @@
 import unittest
 
 from robot.errors import DataError, VariableError
-from robot.utils.asserts import assert_equal, assert_raises
+from robot.utils.asserts import assert_equal, assert_raises, assert_true
 from robot.variables import Variables
 
 SCALARS = ["${var}", "${  v A  R }"]
@@ -271,6 +271,54 @@ class TestVariables(unittest.TestCase):
         varz["${foo}"] = "bar"
         copy = varz.copy()
         assert_equal(copy["${foo}"], "bar")
+        varz["${foo}"] = "new"
+        assert_equal(copy["${foo}"], "bar")
+
+    def test_new_child(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        varz["${Zap}"] = "zap"
+        child = varz.new_child()
+        assert_equal(child["${foo}"], "bar")
+        child["${foo}"] = "child"
+        child["${new}"] = "new"
+        assert_equal(child["${foo}"], "child")
+        assert_equal(varz["${foo}"], "bar")
+        assert_true("${new}" not in varz)
+        varz["${zap}"] = "parent"
+        assert_equal(child["${z_A_p}"], "parent")
+        assert_equal(list(child.as_dict()), ["${foo}", "${new}", "${Zap}"])
+
+    def test_new_child_with_update(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        varz["${zap}"] = "zap"
+        child = varz.new_child({"${foo}": "new", "${zap}": None})
+        assert_equal(child["${foo}"], "new")
+        assert_true("${zap}" not in child)
+        assert_equal(varz["${zap}"], "zap")
+        assert_equal(list(child.as_dict()), ["${foo}"])
+        child["${zap}"] = "again"
+        assert_equal(child["${zap}"], "again")
+
+    def test_copy_of_child_is_independent(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        child = varz.new_child()
+        child["${zap}"] = "zap"
+        copy = child.copy()
+        varz["${foo}"] = "new"
+        assert_equal(copy["${foo}"], "bar")
+        assert_equal(copy["${zap}"], "zap")
+
+    def test_clear_child(self):
+        varz = Variables()
+        varz["${foo}"] = "bar"
+        child = varz.new_child()
+        child["${zap}"] = "zap"
+        child.clear()
+        assert_equal(child.as_dict(), {})
+        assert_equal(varz["${foo}"], "bar")
 
     def test_ignore_error(self):
         v = Variables()
@@ -35,6 +35,15 @@ describe("Text decoder", function () {
         var actual = strings.get(1);
         expect(actual).toEqual("plain text");
     });
+
+    it("should extract strings from compressed blocks", function () {
+        var stringArray = ["*", "@3:0:13", "@3:13:30",
+                           "eNrLSM3JyVcozy/KSdFRyABzDu/Jy0zOT0lV+DB/RoMiAN4CDbY="];
+        var strings = window.testdata.StringStore(stringArray);
+        expect(strings.get(2)).toEqual("hello \u00fcnicode \ud83d\ude00!");
+        expect(strings.get(1)).toEqual("hello world, ");
+        expect(stringArray[1]).toEqual("*hello world, ");
+    });
 });
 
 function subSuite(index, suite) {
@@ -575,3 +584,40 @@ describe("Should split tests and keywords with --splitlog", function (){
     });
 
 });
+
+describe("Search index", function (){
+    beforeEach(function (){
+        window.output = {
+            search_index: {
+                ids: ["s1-t1", "s1-t2", "s1-t2-k1-k2", "s1-s1"],
+                failures: [1, 2],
+                tags: {"smoke": [0, 1]},
+                tokens: {"hello": [0, 1], "world": [1], "suite": [3]}
+            }
+        };
+    });
+
+    it("should return failures in order", function (){
+        expect(window.testdata.failures()).toEqual(["s1-t2", "s1-t2-k1-k2"]);
+    });
+
+    it("should find items containing all tokens", function (){
+        expect(window.testdata.search("Hello")).toEqual(["s1-t1", "s1-t2"]);
+        expect(window.testdata.search("hello, WORLD!")).toEqual(["s1-t2"]);
+        expect(window.testdata.search("hello suite")).toEqual([]);
+        expect(window.testdata.search("")).toEqual([]);
+    });
+
+    it("should find tests by normalized tag", function (){
+        expect(window.testdata.searchByTag("S_MO KE")).toEqual(["s1-t1", "s1-t2"]);
+        expect(window.testdata.searchByTag("nonex")).toEqual([]);
+        expect(window.testdata.search("tag:Smoke")).toEqual(["s1-t1", "s1-t2"]);
+        expect(window.testdata.search(" TAG: s\tmoke")).toEqual(["s1-t1", "s1-t2"]);
+    });
+
+    it("should work without index", function (){
+        window.output = {};
+        expect(window.testdata.failures()).toEqual([]);
+        expect(window.testdata.search("hello")).toEqual([]);
+    });
+});
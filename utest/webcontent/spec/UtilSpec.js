@@ -10,6 +10,8 @@ describe("Testing Matcher", function () {
         expect(matches('hello WORLD')).toBeTruthy();
         expect(matches('HELLOWORLD')).toBeTruthy();
         expect(matches('h e l l o   w o r l d')).toBeTruthy();
+        expect(matches('hello\tworld\n')).toBeTruthy();
+        expect(matches('hello_world')).toBeTruthy();
     });
 
     it("should support * wildcard", function () {